@@ -38,6 +38,7 @@ def register_callbacks(app):
             ds._ITEM_DETAILS[key] = details
             saved += 1
         ds._recompute_stock_summary()
+        ds._bump_data_version()
         return dbc.Toast(
             f"Saved {saved} item(s)",
             header="Inventory Updated",
@@ -59,6 +60,8 @@ def register_callbacks(app):
             return no_update
         ds.save_image_override(name, url)
         ds._IMAGE_URLS[name] = url
+        ds._refresh_image_urls()
+        ds._bump_data_version()
         return dbc.Toast(
             f"Image saved for {name}",
             header="Image Updated",
@@ -82,6 +85,7 @@ def register_callbacks(app):
         ds._save_usage(item_name, qty, "Used in production")
         ds._usage_by_item[item_name] = ds._usage_by_item.get(item_name, 0) + qty
         ds._recompute_stock_summary()
+        ds._bump_data_version()
         return dbc.Toast(
             f"Logged {qty}x {item_name} as used",
             header="Usage Recorded",
@@ -137,6 +141,7 @@ def register_callbacks(app):
             qa_dict["id"] = len(ds._QUICK_ADDS) + 9000
             ds._QUICK_ADDS.insert(0, qa_dict)
             ds._recompute_stock_summary()
+            ds._bump_data_version()
             toast = dbc.Toast(
                 f"Added {qty}x {name} ({category})",
                 header="Quick Add Saved",
@@ -176,6 +181,7 @@ def register_callbacks(app):
             ds._delete_quick_add(qa_id)
             ds._QUICK_ADDS[:] = [qa for qa in ds._QUICK_ADDS if qa.get("id") != qa_id]
             ds._recompute_stock_summary()
+            ds._bump_data_version()
             return dbc.Toast(
                 "Quick-add item deleted",
                 header="Deleted",
@@ -191,3 +197,13 @@ def register_callbacks(app):
                 duration=4000,
                 style={"position": "fixed", "top": 20, "right": 20, "zIndex": 9999},
             )
+
+    # ── All Orders table paging (inv-orders-pagination) ───────────────────
+    @app.callback(
+        Output("inv-orders-page", "children"),
+        Input("inv-orders-pagination", "active_page"),
+        prevent_initial_call=True,
+    )
+    def page_orders_table(active_page):
+        from etsy_dashboard.pages.inventory import render_order_page
+        return render_order_page(active_page)
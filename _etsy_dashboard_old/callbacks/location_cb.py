@@ -21,6 +21,7 @@ def register_callbacks(app):
             return no_update
         qty = int(qty or 1)
         ds.save_location_override("", item_name, [{"location": destination, "qty": qty}])
+        ds._bump_data_version()
         return dbc.Toast(
             f"Moved {qty}x {item_name} to {destination}",
             header="Location Updated",
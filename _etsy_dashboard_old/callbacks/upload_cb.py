@@ -156,9 +156,12 @@ def register_callbacks(app):
             f.write(decoded)
 
         results = []
-        for o in orders:
-            result = ds._reload_inventory_data(o)
-            results.append(result)
+        try:
+            for o in orders:
+                result = ds._reload_inventory_data(o, persist=False)
+                results.append(result)
+        finally:
+            ds._save_invoices()
 
         ds._cascade_reload("inventory")
         total_items = sum(r["item_count"] for r in results)
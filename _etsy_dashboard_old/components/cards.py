@@ -1,5 +1,9 @@
 """Reusable card/section builders."""
+import json
+from functools import lru_cache
+
 from dash import html, dcc
+import plotly.io as pio
 import dash_bootstrap_components as dbc
 from etsy_dashboard.theme import *
 from etsy_dashboard.data_state import money
@@ -33,6 +37,34 @@ def row_item(label, amount, indent=0, bold=False, color=WHITE, neg_color=RED):
     ], style=style)
 
 
+@lru_cache(maxsize=None)
+def _form_row_styles(indent, bold, border, color):
+    """(row, label, value) styles for a form_row; shared between rows, never mutated."""
+    style = {
+        "display": "flex", "justifyContent": "space-between",
+        "padding": "4px 0", "marginLeft": f"{indent * 20}px",
+    }
+    if bold:
+        style["fontWeight"] = "bold"
+    if border:
+        style["borderTop"] = f"1px solid {DARKGRAY}44"
+        style["marginTop"] = "4px"
+        style["paddingTop"] = "8px"
+    label_style = {"color": color if bold else GRAY, "fontSize": "13px", "flex": "1"}
+    value_style = {"color": color, "fontFamily": "monospace",
+                   "fontWeight": "bold" if bold else "normal", "fontSize": "13px"}
+    return style, label_style, value_style
+
+
+def form_row(label, value_str, color=WHITE, bold=False, indent=0, border=False):
+    """Label/value row with a preformatted value (P&L, tax forms, valuation)."""
+    style, label_style, value_style = _form_row_styles(indent, bold, border, color)
+    return html.Div([
+        html.Span(label, style=label_style),
+        html.Span(value_str, style=value_style),
+    ], style=style)
+
+
 def chart_context(description, metrics=None, legend=None, look_for=None, simple=None):
     """Compact context block displayed above a chart."""
     children = [
@@ -80,5 +112,14 @@ def make_chart(fig, height=360, legend_h=True):
     return fig
 
 
+def frozen_figure(fig):
+    """Serialize a finished figure once into a plain JSON-ready dict.
+
+    Meant for figures cached across renders: Dash can encode the result without
+    walking the plotly object tree or converting numpy arrays again.
+    """
+    return json.loads(pio.to_json(fig, validate=False))
+
+
 def severity_color(sev):
     return GREEN if sev == "good" else RED if sev == "bad" else ORANGE if sev == "warning" else BLUE
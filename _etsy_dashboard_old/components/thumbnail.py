@@ -1,19 +1,42 @@
 """Item thumbnail component."""
+import re
+from html import escape
+
 from dash import html
 from etsy_dashboard.theme import DARKGRAY
 
+_CAMEL_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def _img_style(size):
+    return {"width": f"{size}px", "height": f"{size}px", "objectFit": "cover",
+            "borderRadius": "4px", "verticalAlign": "middle"}
+
+
+def _placeholder_style(size):
+    return {
+        "width": f"{size}px", "height": f"{size}px", "display": "inline-flex",
+        "alignItems": "center", "justifyContent": "center",
+        "backgroundColor": "#ffffff10", "borderRadius": "4px",
+        "color": DARKGRAY, "fontSize": f"{size // 3}px", "fontWeight": "bold",
+        "verticalAlign": "middle"}
+
+
+def _css(style):
+    """Inline CSS text for a Dash (camelCase) style dict."""
+    return ";".join(_CAMEL_RE.sub("-", k).lower() + ":" + v for k, v in style.items())
+
 
 def item_thumbnail(name, image_url="", size=40):
     """Return a thumbnail img element or gray placeholder."""
     if image_url:
-        return html.Img(
-            src=image_url, referrerPolicy="no-referrer",
-            style={"width": f"{size}px", "height": f"{size}px", "objectFit": "cover",
-                   "borderRadius": "4px", "verticalAlign": "middle"})
-    return html.Div(
-        "?", style={
-            "width": f"{size}px", "height": f"{size}px", "display": "inline-flex",
-            "alignItems": "center", "justifyContent": "center",
-            "backgroundColor": "#ffffff10", "borderRadius": "4px",
-            "color": DARKGRAY, "fontSize": f"{size // 3}px", "fontWeight": "bold",
-            "verticalAlign": "middle"})
+        return html.Img(src=image_url, referrerPolicy="no-referrer", style=_img_style(size))
+    return html.Div("?", style=_placeholder_style(size))
+
+
+def item_thumbnail_html(image_url="", size=40):
+    """``item_thumbnail`` as an HTML string, for DataTable markdown cells."""
+    if not isinstance(image_url, str) or not image_url:
+        return f'<span style="{_css(_placeholder_style(size))}">?</span>'
+    return (f'<img src="{escape(image_url)}" referrerpolicy="no-referrer" '
+            f'style="{_css(_img_style(size))}">')
@@ -5,10 +5,11 @@ Every page/callback imports from here instead of using globals in the monolith.
 """
 
 import os
+import re
 import json
+from functools import lru_cache, wraps
 import pandas as pd
 import numpy as np
-from sklearn.linear_model import LinearRegression
 
 # ── Paths ────────────────────────────────────────────────────────────────────
 # BASE_DIR points to the project root (parent of etsy_dashboard/)
@@ -39,7 +40,7 @@ from supabase_loader import (
     load_inventory_items_with_ids,
 )
 
-from etsy_dashboard.theme import BANK_TAX_DEDUCTIBLE, CATEGORY_OPTIONS
+from etsy_dashboard.theme import BANK_TAX_DEDUCTIBLE, CATEGORY_OPTIONS, GREEN, ORANGE, RED
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -63,38 +64,66 @@ def money(val):
     return f"${val:,.2f}"
 
 
+# Keyword rules in priority order — the first matching rule wins. A list (not a
+# dict) because "Crafts" and "Packaging" each appear at two priority levels.
+_CATEGORY_KEYWORDS = [
+    ("Personal/Gift", ["pottery", "meat grinder", "slicer"]),
+    ("Business Fees", ["articles of organization", "credit card surcharge", "llc filing"]),
+    ("Crafts", ["balsa", "basswood", "wood sheet", "magnet", "clock movement",
+                "clock mechanism", "clock kit", "quartz clock"]),
+    ("Tools", ["soldering", "3d pen"]),
+    ("Printer Parts", ["build plate", "bed plate", "print surface"]),
+    ("Jewelry", ["earring", "jewelry"]),
+    ("Filament", ["pla", "filament", "3d printer filament"]),
+    ("Packaging", ["gift box", "box", "mailer", "bubble", "wrapping", "packing", "packaging",
+                   "shipping label", "label printer", "fragile sticker"]),
+    ("Lighting", ["led", "lamp", "light", "bulb", "socket", "pendant", "lantern", " cord"]),
+    ("Hardware", ["screw", "bolt", "glue", "adhesive", "wire", "hook", "ring"]),
+    ("Crafts", ["crafts", "craft"]),
+    ("Packaging", ["tape", "heavy duty"]),
+]
+_CATEGORY_PATTERNS = [
+    (cat, re.compile("|".join(re.escape(w) for w in words)))
+    for cat, words in _CATEGORY_KEYWORDS
+]
+
+
 def categorize_item(name):
     """Auto-categorize items. Names match CATEGORY_OPTIONS."""
     name_l = name.lower()
-    if any(w in name_l for w in ["pottery", "meat grinder", "slicer"]):
-        return "Personal/Gift"
-    if any(w in name_l for w in ["articles of organization", "credit card surcharge", "llc filing"]):
-        return "Business Fees"
-    if any(w in name_l for w in ["balsa", "basswood", "wood sheet", "magnet", "clock movement",
-                                  "clock mechanism", "clock kit", "quartz clock"]):
-        return "Crafts"
-    if any(w in name_l for w in ["soldering", "3d pen"]):
-        return "Tools"
-    if any(w in name_l for w in ["build plate", "bed plate", "print surface"]):
-        return "Printer Parts"
-    if any(w in name_l for w in ["earring", "jewelry"]):
-        return "Jewelry"
-    if any(w in name_l for w in ["pla", "filament", "3d printer filament"]):
-        return "Filament"
-    if any(w in name_l for w in ["gift box", "box", "mailer", "bubble", "wrapping", "packing", "packaging",
-                                  "shipping label", "label printer", "fragile sticker"]):
-        return "Packaging"
-    if any(w in name_l for w in ["led", "lamp", "light", "bulb", "socket", "pendant", "lantern", " cord"]):
-        return "Lighting"
-    if any(w in name_l for w in ["screw", "bolt", "glue", "adhesive", "wire", "hook", "ring"]):
-        return "Hardware"
-    if any(w in name_l for w in ["crafts", "craft"]):
-        return "Crafts"
-    if any(w in name_l for w in ["tape", "heavy duty"]):
-        return "Packaging"
+    for cat, pat in _CATEGORY_PATTERNS:
+        if pat.search(name_l):
+            return cat
     return "Other"
 
 
+def _per_unique(values, func):
+    """Evaluate ``func`` once per distinct value of a Series and broadcast back.
+
+    ``func`` receives the distinct values as a Series and returns an array-like
+    of results in the same order.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    out = np.asarray(func(pd.Series(uniques)), dtype=object)
+    return pd.Series(out[codes], index=values.index)
+
+
+def _categorize_unique(names):
+    names_l = names.str.lower()
+    cats = np.full(len(names_l), "Other", dtype=object)
+    unmatched = np.ones(len(names_l), dtype=bool)
+    for cat, pat in _CATEGORY_PATTERNS:
+        hit = names_l.str.contains(pat.pattern, regex=True, na=False).to_numpy() & unmatched
+        cats[hit] = cat
+        unmatched &= ~hit
+    return cats
+
+
+def categorize_items(names):
+    """Vectorized categorize_item over a Series of names (one scan per rule)."""
+    return _per_unique(names, _categorize_unique)
+
+
 def classify_location(addr):
     if not addr:
         return "Unknown"
@@ -106,6 +135,24 @@ def classify_location(addr):
     return "Other"
 
 
+def _classify_unique(addrs):
+    addr_u = addrs.str.upper()
+    return np.select(
+        [
+            addr_u == "",
+            addr_u.str.contains("TULSA|, OK", regex=True),
+            addr_u.str.contains("CELINA|PROSPER|, TX", regex=True),
+        ],
+        ["Unknown", "Tulsa, OK", "Texas"],
+        default="Other",
+    )
+
+
+def classify_locations(addrs):
+    """Vectorized classify_location over a Series of addresses."""
+    return _per_unique(addrs.fillna("").astype(str), _classify_unique)
+
+
 def _norm_loc(loc_str):
     """Normalize location string to 'Tulsa' or 'Texas' or ''."""
     loc_str = (loc_str or "").strip().lower()
@@ -124,9 +171,354 @@ def get_draw_reason(desc):
     return ""
 
 
-def _parse_bank_date(d):
-    parts = d.split("/")
-    return (int(parts[2]), int(parts[0]), int(parts[1]))
+_LAZY_BUILDERS = {}
+
+
+def _lazy(*names):
+    """Register a builder for module attributes that are computed on first access.
+
+    The builder returns the values of ``names`` in order. They are then cached as
+    ordinary module globals until ``_reset_lazy`` drops them on reload.
+    """
+    def register(builder):
+        for name in names:
+            _LAZY_BUILDERS[name] = (names, builder)
+        return builder
+    return register
+
+
+def __getattr__(name):
+    try:
+        names, builder = _LAZY_BUILDERS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals().update(zip(names, builder()))
+    return globals()[name]
+
+
+def _reset_lazy(*names):
+    """Drop cached lazy attributes (all of them when no ``names`` are given)."""
+    for name in names or _LAZY_BUILDERS:
+        globals().pop(name, None)
+
+
+def _round_cents(values):
+    """``round(v, 2)`` over an array, keeping Python's rounding of each float.
+
+    ``np.round`` scales and rounds half-to-even, which can land a cent away from
+    ``round`` (4.745 -> 4.74 instead of 4.75).
+    """
+    return np.array([round(v, 2) for v in np.asarray(values, dtype=np.float64).tolist()],
+                    dtype=np.float64)
+
+
+_TXN_TYPES = ("Sale", "Fee", "Shipping", "Marketing", "Refund", "Tax", "Deposit", "Buyer Fee")
+
+
+_ETSY_TEXT_COLUMNS = ("Title", "Info", "Month")
+_ETSY_STR = pd.StringDtype(na_value=np.nan)
+_ORDER_RE = re.compile(r"(Order #\d+)")
+
+
+def _prepare_etsy_data(data):
+    """Normalize the dtypes of freshly loaded Etsy transactions in place.
+
+    Type has a handful of distinct values; as a categorical, every == / groupby on it
+    works on small integer codes instead of string compares. The text columns that
+    get scanned, grouped and matched are pinned to the NaN-backed string dtype
+    (pandas 3's default "str", Arrow-backed when pyarrow is installed). It is named
+    explicitly so pandas 2 keeps missing values as NaN instead of the text "nan",
+    and an all-missing column never falls back to object.
+    The ``Order #...`` id in each Title is extracted once into ``OrderId``.
+    """
+    data["Type"] = data["Type"].astype("category")
+    for col in _ETSY_TEXT_COLUMNS:
+        if col in data.columns and data[col].dtype != _ETSY_STR:
+            data[col] = data[col].astype(_ETSY_STR)
+    data["OrderId"] = data["Title"].str.extract(_ORDER_RE, expand=False)
+    return data
+
+
+def _split_by_type(data):
+    """Partition Etsy transactions by Type in one groupby.
+
+    Returns ({type: rows} for every known type, empty frames included, and the
+    Net_Clean total per type).
+    """
+    groups = data.groupby("Type", sort=False, observed=True)
+    by_type = dict(tuple(groups))
+    frames = {t: by_type.get(t, data.iloc[:0]) for t in _TXN_TYPES}
+    return frames, groups["Net_Clean"].sum()
+
+
+def _title_totals(df):
+    """Net_Clean sum and row count per distinct Title of a transaction frame."""
+    return df.groupby("Title", sort=False)["Net_Clean"].agg(["sum", "size"])
+
+
+def _title_buckets(totals, rules):
+    """(Net_Clean sum, row count) per bucket of ``rules`` over the titles in ``totals``.
+
+    ``rules`` maps bucket names to regexes anchored at the start of the title. They are
+    compiled into one pattern of optional lookaheads, so every distinct title is matched
+    once and may land in several (overlapping) buckets.
+    """
+    pattern = "(?s)" + "".join(f"(?:(?=(?P<{name}>{rx}))|)" for name, rx in rules.items())
+    hits = pd.Series(list(totals.index), dtype="str").str.extract(pattern).notna().to_numpy().T
+    sums = hits.astype(np.float64) @ totals["sum"].to_numpy(dtype=np.float64)
+    counts = hits.astype(np.int64) @ totals["size"].to_numpy(dtype=np.int64)
+    return {name: (sums[i], int(counts[i])) for i, name in enumerate(rules)}
+
+
+_FEE_BUCKETS = {
+    "listing": r".*Listing fee",
+    "txn_product": r"Transaction fee:(?!.*Shipping)",
+    "txn_shipping": r".*Transaction fee: Shipping",
+    "processing": r".*Processing fee",
+    "credit_transaction": r"Credit for transaction fee",
+    "credit_listing": r"Credit for listing fee",
+    "credit_processing": r"Credit for processing fee",
+    "share_save": r".*Share & Save",
+    "credit_ship_fee": r".*Credit for transaction fee on shipping",
+}
+_MKT_BUCKETS = {
+    "etsy_ads": r".*Etsy Ads",
+    "offsite_fees": r"(?!.*Credit).*Offsite Ads",
+    "offsite_credits": r".*Credit for Offsite",
+}
+_SHIP_BUCKETS = {
+    "usps_outbound": r"USPS shipping label\Z",
+    "usps_return": r"USPS return shipping label\Z",
+    "asendia": r".*Asendia",
+    "adjustment": r".*Adjustment",
+    "credit": r".*Credit for",
+    "insurance": r"(?i:.*insurance)",
+}
+
+
+def _bank_frame(txns):
+    """Columnar view of bank transactions, built once and shared by the bank aggregates.
+
+    The MM/DD/YYYY date is split into its string parts (``mm``, ``yyyy``) and integer
+    ``ymd`` sort keys; ``is_dep`` flags deposits.
+    """
+    btx = pd.DataFrame(txns, columns=["date", "type", "category", "amount"])
+    parts = btx["date"].str.split("/")
+    btx["mm"], btx["yyyy"] = parts.str[0], parts.str[2]
+    btx["y"] = btx["yyyy"].astype(np.int32)
+    btx["m"] = btx["mm"].astype(np.int32)
+    btx["d"] = parts.str[1].astype(np.int32)
+    btx["is_dep"] = (btx["type"] == "deposit").to_numpy(dtype=bool)
+    btx["amount"] = btx["amount"].astype(np.float64)
+    return btx
+
+
+def _bank_aggregates(btx):
+    """Return (debits by category, deposits/debits by month) for a ``_bank_frame``."""
+    if btx.empty:
+        return {}, {}
+    month = btx["yyyy"] + "-" + btx["mm"]
+    kind = np.where(btx["is_dep"], "deposits", "debits")
+    by_cat = (btx.loc[btx["type"] == "debit"]
+              .groupby("category", sort=False, dropna=False)["amount"].sum()
+              .sort_values(ascending=False, kind="stable")
+              .to_dict())
+    monthly = (btx.groupby([month, kind], sort=False)["amount"].sum()
+               .unstack(fill_value=0)
+               .reindex(index=month.unique(), columns=["deposits", "debits"], fill_value=0)
+               .to_dict("index"))
+    return by_cat, monthly
+
+
+# Ledger table columns, in display order
+_BANK_LEDGER_COLUMNS = ["date", "desc", "category", "type", "amount", "_balance"]
+
+
+def _bank_ledger(txns, btx):
+    """Sort bank transactions by date, deposits before debits on the same day, and
+    attach a cumulative ``_balance``.
+
+    Returns (sorted transactions, sorted transactions with ``_balance``).
+    """
+    if btx.empty:
+        return [], []
+    is_dep = btx["is_dep"].to_numpy()
+    order = np.lexsort((~is_dep, btx["d"].to_numpy(), btx["m"].to_numpy(), btx["y"].to_numpy()))
+    signed = np.where(is_dep, 1.0, -1.0) * btx["amount"].to_numpy()
+    balances = _round_cents(np.cumsum(signed[order]))
+    txns_sorted = [txns[i] for i in order]
+    return txns_sorted, [{**t, "_balance": b} for t, b in zip(txns_sorted, balances.tolist())]
+
+
+_DELIVERY_NOTE = "Your package was left near the front door or porch."
+
+
+_INV_DF_COLUMNS = [
+    "order_num", "date", "date_parsed", "month", "grand_total",
+    "subtotal", "tax", "source", "item_count", "file",
+    "ship_address", "payment_method",
+]
+_INV_ITEM_COLUMNS = [
+    "order_num", "date", "date_parsed", "month", "name", "qty",
+    "price", "total", "source", "seller", "ship_to",
+    "payment_method", "image_url",
+]
+
+
+def _parse_invoice_dates(invoices):
+    """Parse invoice dates; returns (date_parsed, month) arrays aligned with invoices.
+
+    Receipts are normally "%B %d, %Y"; anything else gets a second,
+    per-element ("mixed") parse, and unparseable dates become NaT/"Unknown".
+    """
+    raw = pd.Series([inv["date"] for inv in invoices], dtype=object)
+    dates = pd.to_datetime(raw, format="%B %d, %Y", errors="coerce")
+    retry = dates.isna() & raw.notna()
+    if retry.any():
+        dates[retry] = pd.to_datetime(raw[retry], format="mixed", errors="coerce")
+    months = dates.dt.strftime("%Y-%m").fillna("Unknown")
+    return dates.to_numpy(), months.to_numpy(dtype=object)
+
+
+def _build_inv_df(invoices, dates, months):
+    """Order-level frame, one row per invoice, sorted by date.
+
+    Built column-by-column (dict of lists) rather than from per-row dicts.
+    ``source`` and ``payment_method`` hold a handful of distinct values and are
+    only compared and grouped on, so they are stored as categoricals.
+    """
+    if not invoices:
+        return pd.DataFrame(columns=_INV_DF_COLUMNS)
+    return pd.DataFrame({
+        "order_num": [inv["order_num"] for inv in invoices],
+        "date": [inv["date"] for inv in invoices],
+        "date_parsed": dates,
+        "month": months,
+        "grand_total": [inv["grand_total"] for inv in invoices],
+        "subtotal": [inv["subtotal"] for inv in invoices],
+        "tax": [inv["tax"] for inv in invoices],
+        "source": [inv["source"] for inv in invoices],
+        "item_count": [len(inv["items"]) for inv in invoices],
+        "file": [inv["file"] for inv in invoices],
+        "ship_address": [inv.get("ship_address", "") for inv in invoices],
+        "payment_method": [inv.get("payment_method", "Unknown") for inv in invoices],
+    }).sort_values("date_parsed").astype({"source": "category", "payment_method": "category"})
+
+
+def _strip_delivery_note(names):
+    """Drop the carrier's delivery note that sometimes prefixes scraped item names."""
+    noted = names.str.startswith(_DELIVERY_NOTE, na=False)
+    if not noted.any():
+        return names
+    # Only the noted names go through the string kernels
+    names = names.copy()
+    names[noted] = names[noted].str.replace(_DELIVERY_NOTE, "", regex=False).str.strip()
+    return names
+
+
+def _build_inv_items(invoices, dates, months):
+    """Item-level frame, one row per receipt line item."""
+    if not any(inv["items"] for inv in invoices):
+        return pd.DataFrame(columns=_INV_ITEM_COLUMNS)
+    owners = np.fromiter((i for i, inv in enumerate(invoices) for _ in inv["items"]), dtype=np.intp)
+    items = [item for inv in invoices for item in inv["items"]]
+
+    # Invoice-level fields are read once per invoice and broadcast to its items
+    def per_invoice(values):
+        return np.array(values, dtype=object)[owners]
+
+    ship_addresses = per_invoice([inv.get("ship_address", "") for inv in invoices])
+    return pd.DataFrame({
+        "order_num": per_invoice([_intern(inv["order_num"]) for inv in invoices]),
+        "date": per_invoice([inv["date"] for inv in invoices]),
+        "date_parsed": dates[owners],
+        "month": months[owners],
+        "name": _strip_delivery_note(pd.Series([_intern(item["name"]) for item in items])),
+        "qty": [item["qty"] for item in items],
+        "price": [item["price"] for item in items],
+        "total": [item["price"] * item["qty"] for item in items],
+        "source": per_invoice([inv["source"] for inv in invoices]),
+        "seller": [item.get("seller", "Unknown") for item in items],
+        "ship_to": [item.get("ship_to", ship) for item, ship in zip(items, ship_addresses)],
+        "payment_method": per_invoice([inv.get("payment_method", "Unknown") for inv in invoices]),
+        "image_url": [item.get("image_url", "") for item in items],
+    })
+
+
+@_lazy("INVOICE_ITEMS_DF", "INVOICE_LOCATIONS")
+def _build_invoice_items_df():
+    """Receipt line items as uploaded, before item details are applied.
+
+    One row per item in ``INVOICES`` order: ``inv_idx`` points back at the invoice,
+    ``item_name`` is the raw name the ``_ITEM_DETAILS`` keys use, and ``name`` /
+    ``auto_category`` / ``location`` are the editor's cleaned name, keyword category
+    and ship-to location, each computed once for the whole upload.
+    ``INVOICE_LOCATIONS`` is the ship-to location per invoice.
+    """
+    counts = [len(inv["items"]) for inv in INVOICES]
+    inv_idx = np.repeat(np.arange(len(INVOICES)), counts)
+    raw = pd.Series([item["name"] for inv in INVOICES for item in inv["items"]], dtype=object)
+    ship = pd.Series([inv.get("ship_address", "") for inv in INVOICES], dtype=object)
+    names = _strip_delivery_note(raw)
+    locations = classify_locations(ship).tolist() if len(ship) else []
+    return (pd.DataFrame({
+        "inv_idx": inv_idx,
+        "order_num": [inv["order_num"] for inv, n in zip(INVOICES, counts) for _ in range(n)],
+        "item_name": raw,
+        "name": names,
+        "auto_category": categorize_items(names) if len(names) else pd.Series(dtype=object),
+        "location": np.array(locations, dtype=object)[inv_idx],
+    }), locations)
+
+
+def _intern(value):
+    """Intern strings used as lookup keys so dict probes can match by identity."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _expand_rows(df, entries_per_row):
+    """Repeat each row of ``df`` once per entry in ``entries_per_row`` (once if empty).
+
+    Returns the expanded frame (original index labels kept) together with, for
+    every entry, its source row number, its position in the expanded frame and
+    the entry itself.
+    """
+    repeats = np.fromiter((len(e) if e else 1 for e in entries_per_row), dtype=np.intp,
+                          count=len(entries_per_row))
+    src, pos, flat = [], [], []
+    for i, (entries, start) in enumerate(zip(entries_per_row, (np.cumsum(repeats) - repeats).tolist())):
+        if entries:
+            src.extend([i] * len(entries))
+            pos.extend(range(start, start + len(entries)))
+            flat.extend(entries)
+    expanded = df.iloc[np.repeat(np.arange(len(df)), repeats)]
+    return expanded, np.asarray(src, dtype=np.intp), pos, flat
+
+
+def _set_rows(df, col, positions, values):
+    """Overwrite ``col`` at the given row positions, creating it (NaN elsewhere) if absent."""
+    out = (df[col].to_numpy(dtype=object, copy=True) if col in df.columns
+           else np.full(len(df), np.nan, dtype=object))
+    out[positions] = values
+    df[col] = pd.Series(out, index=df.index).infer_objects()
+
+
+_NON_BIZ_CATS = ["Personal/Gift", "Business Fees"]
+_biz_mask_cache = (None, None)
+
+
+def _biz_item_mask():
+    """Business-inventory row mask for the current INV_ITEMS, computed once per frame.
+
+    INV_ITEMS is only ever replaced (never re-categorized in place) once this is
+    first used, so the frame's identity is a sufficient cache key.
+    """
+    global _biz_mask_cache
+    frame, mask = _biz_mask_cache
+    if frame is not INV_ITEMS:
+        mask = ~INV_ITEMS["category"].isin(_NON_BIZ_CATS)
+        _biz_mask_cache = (INV_ITEMS, mask)
+    return mask
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -134,7 +526,7 @@ def _parse_bank_date(d):
 # ══════════════════════════════════════════════════════════════════════════════
 
 _sb = _load_data()
-DATA = _sb["DATA"]
+DATA = _prepare_etsy_data(_sb["DATA"])
 CONFIG = _sb["CONFIG"]
 INVOICES = _sb["INVOICES"]
 BANK_TXNS = _sb["BANK_TXNS"]
@@ -169,127 +561,66 @@ bb_cc_available = bb_cc_limit - bb_cc_balance
 bb_cc_asset_value = bb_cc_total_charged
 
 # ── Pre-compute Etsy metrics ────────────────────────────────────────────────
-sales_df = DATA[DATA["Type"] == "Sale"]
-fee_df = DATA[DATA["Type"] == "Fee"]
-ship_df = DATA[DATA["Type"] == "Shipping"]
-mkt_df = DATA[DATA["Type"] == "Marketing"]
-refund_df = DATA[DATA["Type"] == "Refund"]
-tax_df = DATA[DATA["Type"] == "Tax"]
-deposit_df = DATA[DATA["Type"] == "Deposit"]
-buyer_fee_df = DATA[DATA["Type"] == "Buyer Fee"]
-
-gross_sales = sales_df["Net_Clean"].sum()
-total_refunds = abs(refund_df["Net_Clean"].sum())
+# One hash pass over Type yields both the per-type row subsets and their totals
+_by_type, _type_net = _split_by_type(DATA)
+sales_df = _by_type["Sale"]
+fee_df = _by_type["Fee"]
+ship_df = _by_type["Shipping"]
+mkt_df = _by_type["Marketing"]
+refund_df = _by_type["Refund"]
+tax_df = _by_type["Tax"]
+deposit_df = _by_type["Deposit"]
+buyer_fee_df = _by_type["Buyer Fee"]
+
+gross_sales = _type_net.get("Sale", 0.0)
+total_refunds = abs(_type_net.get("Refund", 0.0))
 net_sales = gross_sales - total_refunds
-total_fees = abs(fee_df["Net_Clean"].sum())
-total_shipping_cost = abs(ship_df["Net_Clean"].sum())
-total_marketing = abs(mkt_df["Net_Clean"].sum())
-total_taxes = abs(tax_df["Net_Clean"].sum())
+total_fees = abs(_type_net.get("Fee", 0.0))
+total_shipping_cost = abs(_type_net.get("Shipping", 0.0))
+total_marketing = abs(_type_net.get("Marketing", 0.0))
+total_taxes = abs(_type_net.get("Tax", 0.0))
 
 order_count = len(sales_df)
 avg_order = gross_sales / order_count if order_count else 0
 
-total_buyer_fees = abs(buyer_fee_df["Net_Clean"].sum()) if len(buyer_fee_df) else 0.0
+total_buyer_fees = abs(_type_net.get("Buyer Fee", 0.0))
 etsy_net_earned = gross_sales - total_fees - total_shipping_cost - total_marketing - total_refunds - total_taxes - total_buyer_fees
 net_profit = etsy_net_earned
 profit_margin = (net_profit / gross_sales * 100) if gross_sales else 0
 
 # ── Build inventory DataFrames ───────────────────────────────────────────────
-inv_rows = []
-for inv in INVOICES:
-    date_str = inv["date"]
-    try:
-        dt = pd.to_datetime(date_str, format="%B %d, %Y")
-    except Exception:
-        try:
-            dt = pd.to_datetime(date_str)
-        except Exception:
-            dt = pd.NaT
-    inv_rows.append({
-        "order_num": inv["order_num"],
-        "date": date_str,
-        "date_parsed": dt,
-        "month": dt.to_period("M").strftime("%Y-%m") if pd.notna(dt) else "Unknown",
-        "grand_total": inv["grand_total"],
-        "subtotal": inv["subtotal"],
-        "tax": inv["tax"],
-        "source": inv["source"],
-        "item_count": len(inv["items"]),
-        "file": inv["file"],
-        "ship_address": inv.get("ship_address", ""),
-        "payment_method": inv.get("payment_method", "Unknown"),
-    })
-
-if inv_rows:
-    INV_DF = pd.DataFrame(inv_rows).sort_values("date_parsed")
-else:
-    INV_DF = pd.DataFrame(columns=[
-        "order_num", "date", "date_parsed", "month", "grand_total",
-        "subtotal", "tax", "source", "item_count", "file",
-        "ship_address", "payment_method",
-    ])
+_inv_dates, _inv_months = _parse_invoice_dates(INVOICES)
+INV_DF = _build_inv_df(INVOICES, _inv_dates, _inv_months)
 
 # Item-level DataFrame
-inv_item_rows = []
-for inv in INVOICES:
-    try:
-        dt = pd.to_datetime(inv["date"], format="%B %d, %Y")
-    except Exception:
-        try:
-            dt = pd.to_datetime(inv["date"])
-        except Exception:
-            dt = pd.NaT
-    month = dt.to_period("M").strftime("%Y-%m") if pd.notna(dt) else "Unknown"
-    for item in inv["items"]:
-        item_name = item["name"]
-        if item_name.startswith("Your package was left near the front door or porch."):
-            item_name = item_name.replace("Your package was left near the front door or porch.", "").strip()
-        inv_item_rows.append({
-            "order_num": inv["order_num"],
-            "date": inv["date"],
-            "date_parsed": dt,
-            "month": month,
-            "name": item_name,
-            "qty": item["qty"],
-            "price": item["price"],
-            "total": item["price"] * item["qty"],
-            "source": inv["source"],
-            "seller": item.get("seller", "Unknown"),
-            "ship_to": item.get("ship_to", inv.get("ship_address", "")),
-            "payment_method": inv.get("payment_method", "Unknown"),
-            "image_url": item.get("image_url", ""),
-        })
-
-if inv_item_rows:
-    INV_ITEMS = pd.DataFrame(inv_item_rows)
-else:
-    INV_ITEMS = pd.DataFrame(columns=[
-        "order_num", "date", "date_parsed", "month", "name", "qty",
-        "price", "total", "source", "seller", "ship_to",
-        "payment_method", "image_url",
-    ])
+INV_ITEMS = _build_inv_items(INVOICES, _inv_dates, _inv_months)
+# The override/detail expansions and quick-adds below never take a non-empty
+# INV_ITEMS back to zero rows, so this holds for the rest of module load.
+_HAS_ITEMS = len(INV_ITEMS) > 0
 
 # ── Tax-inclusive cost per item ───────────────────────────────────────────────
 _order_totals_map = {}
 for inv in INVOICES:
     _order_totals_map[inv["order_num"]] = {
         "subtotal": inv["subtotal"], "grand_total": inv["grand_total"]}
-if len(INV_ITEMS) > 0:
-    def _calc_with_tax(row):
-        ot = _order_totals_map.get(row["order_num"])
-        if ot and ot["subtotal"] > 0:
-            return round(row["total"] * (ot["grand_total"] / ot["subtotal"]), 2)
-        return row["total"]
-    INV_ITEMS["total_with_tax"] = INV_ITEMS.apply(_calc_with_tax, axis=1)
+if _HAS_ITEMS:
+    # Spread each order's tax over its items: total * grand_total / subtotal
+    _tax_ratio = INV_ITEMS["order_num"].map({
+        num: ot["grand_total"] / ot["subtotal"]
+        for num, ot in _order_totals_map.items() if ot["subtotal"] > 0
+    }).to_numpy(dtype=np.float64, na_value=np.nan)
+    _item_totals = INV_ITEMS["total"].to_numpy(dtype=np.float64)
+    INV_ITEMS["total_with_tax"] = np.where(np.isnan(_tax_ratio), _item_totals,
+                                           _round_cents(_item_totals * _tax_ratio))
 else:
-    INV_ITEMS["total_with_tax"] = INV_ITEMS["total"] if len(INV_ITEMS) > 0 else []
+    INV_ITEMS["total_with_tax"] = INV_ITEMS["total"] if _HAS_ITEMS else []
 
 # ── Item Details (rename / categorize / true qty) ────────────────────────────
 _ITEM_DETAILS: dict[tuple[str, str], list[dict]] = {}
 try:
     _raw_details = _load_item_details()
     for d in _raw_details:
-        key = (d["order_num"], d["item_name"])
+        key = (_intern(d["order_num"]), _intern(d["item_name"]))
         if d.get("category") == "_JSON_":
             try:
                 entries = json.loads(d["display_name"])
@@ -312,85 +643,87 @@ _LOC_OVERRIDES: dict[tuple[str, str], list[dict]] = {}
 try:
     _raw_overrides = _load_location_overrides()
     for ov in _raw_overrides:
-        key = (ov["order_num"], ov["item_name"])
+        key = (_intern(ov["order_num"]), _intern(ov["item_name"]))
         _LOC_OVERRIDES.setdefault(key, []).append({"location": ov["location"], "qty": ov["qty"]})
 except Exception:
     pass
 
-if len(INV_ITEMS) > 0 and _LOC_OVERRIDES:
-    expanded_rows = []
-    for _, row in INV_ITEMS.iterrows():
-        key = (row["order_num"], row["name"])
-        if key in _LOC_OVERRIDES and key not in _ITEM_DETAILS:
-            for ov in _LOC_OVERRIDES[key]:
-                new_row = row.copy()
-                new_row["qty"] = ov["qty"]
-                new_row["total"] = row["price"] * ov["qty"]
-                new_row["_override_location"] = ov["location"]
-                expanded_rows.append(new_row)
-        else:
-            row_copy = row.copy()
-            row_copy["_override_location"] = ""
-            expanded_rows.append(row_copy)
-    INV_ITEMS = pd.DataFrame(expanded_rows)
+if _HAS_ITEMS and _LOC_OVERRIDES:
+    # Split overridden rows per location; rows with item details are handled below
+    _row_ovs = [None if k in _ITEM_DETAILS else _LOC_OVERRIDES.get(k)
+                for k in zip(INV_ITEMS["order_num"].tolist(), INV_ITEMS["name"].tolist())]
+    _expanded, _ov_src, _ov_pos, _ovs = _expand_rows(INV_ITEMS, _row_ovs)
+    _ov_qty = np.array([ov["qty"] for ov in _ovs])
+    _expanded["_override_location"] = ""
+    _set_rows(_expanded, "qty", _ov_pos, _ov_qty)
+    _set_rows(_expanded, "total", _ov_pos, INV_ITEMS["price"].to_numpy()[_ov_src] * _ov_qty)
+    _set_rows(_expanded, "_override_location", _ov_pos, [ov["location"] for ov in _ovs])
+    INV_ITEMS = _expanded
 
 _UPLOADED_INVENTORY: dict[tuple[str, str, str], int] = {}
 
 # Build image_url lookup BEFORE renaming
 _IMAGE_URLS: dict[str, str] = {}
-if len(INV_ITEMS) > 0 and "image_url" in INV_ITEMS.columns:
-    for _, _r in INV_ITEMS.iterrows():
-        _n = _r["name"]
-        _u = _r.get("image_url", "") or ""
+if _HAS_ITEMS and "image_url" in INV_ITEMS.columns:
+    for _n, _u in zip(INV_ITEMS["name"].to_numpy(), INV_ITEMS["image_url"].to_numpy()):
         if _u and _n not in _IMAGE_URLS:
             _IMAGE_URLS[_n] = _u
 
 # Apply item details: rename, recategorize, adjust qty
-if len(INV_ITEMS) > 0 and _ITEM_DETAILS:
-    detail_rows = []
-    for _, row in INV_ITEMS.iterrows():
-        key = (row["order_num"], row["name"])
-        if key in _ITEM_DETAILS:
-            dets = _ITEM_DETAILS[key]
-            orig_total = row["price"] * row["qty"]
-            orig_with_tax = row.get("total_with_tax", orig_total)
-            total_detail_qty = sum(d["true_qty"] for d in dets)
-            per_unit = orig_total / total_detail_qty if total_detail_qty > 0 else 0
-            per_unit_tax = orig_with_tax / total_detail_qty if total_detail_qty > 0 else 0
-            _orig_img = _IMAGE_URLS.get(row["name"], "")
-            for det in dets:
-                new_row = row.copy()
-                new_row["_orig_name"] = row["name"]
-                new_row["name"] = det["display_name"]
-                new_row["category"] = det["category"]
-                new_row["qty"] = det["true_qty"]
-                new_row["price"] = round(per_unit, 2)
-                new_row["total"] = round(per_unit * det["true_qty"], 2)
-                new_row["total_with_tax"] = round(per_unit_tax * det["true_qty"], 2)
-                new_row["image_url"] = ""
-                if det.get("location"):
-                    new_row["_override_location"] = det["location"]
-                detail_rows.append(new_row)
-                if _orig_img and det["display_name"] not in _IMAGE_URLS:
-                    _IMAGE_URLS[det["display_name"]] = _orig_img
-        else:
-            rc = row.copy()
-            rc["_orig_name"] = row["name"]
-            detail_rows.append(rc)
-    INV_ITEMS = pd.DataFrame(detail_rows)
-
-if len(INV_ITEMS) > 0 and "_orig_name" not in INV_ITEMS.columns:
+if _HAS_ITEMS and _ITEM_DETAILS:
+    # Each reviewed row expands into one row per detail entry; every other row
+    # is kept once.
+    _row_dets = [_ITEM_DETAILS.get(k)
+                 for k in zip(INV_ITEMS["order_num"].tolist(), INV_ITEMS["name"].tolist())]
+    _expanded, _det_src, _det_pos, _dets = _expand_rows(INV_ITEMS, _row_dets)
+
+    # Split each original line's cost evenly across the detail quantities
+    _det_qty = np.array([d["true_qty"] for d in _dets])
+    _qty_sum = np.bincount(_det_src, weights=_det_qty, minlength=len(_row_dets))[_det_src]
+    _has_qty = _qty_sum > 0
+    _orig_total = (INV_ITEMS["price"].to_numpy() * INV_ITEMS["qty"].to_numpy())[_det_src]
+    _orig_with_tax = INV_ITEMS["total_with_tax"].to_numpy()[_det_src]
+    _per_unit = np.divide(_orig_total, _qty_sum, out=np.zeros(len(_dets)), where=_has_qty)
+    _per_unit_tax = np.divide(_orig_with_tax, _qty_sum, out=np.zeros(len(_dets)), where=_has_qty)
+
+    _expanded["_orig_name"] = _expanded["name"]
+    _set_rows(_expanded, "name", _det_pos, [d["display_name"] for d in _dets])
+    _set_rows(_expanded, "category", _det_pos, [d["category"] for d in _dets])
+    _set_rows(_expanded, "qty", _det_pos, list(_det_qty))
+    _set_rows(_expanded, "price", _det_pos, _round_cents(_per_unit))
+    _set_rows(_expanded, "total", _det_pos, _round_cents(_per_unit * _det_qty))
+    _set_rows(_expanded, "total_with_tax", _det_pos, _round_cents(_per_unit_tax * _det_qty))
+    _set_rows(_expanded, "image_url", _det_pos, "")
+    _loc_dets = [j for j, d in enumerate(_dets) if d.get("location")]
+    if _loc_dets:
+        _set_rows(_expanded, "_override_location", [_det_pos[j] for j in _loc_dets],
+                  [_dets[j]["location"] for j in _loc_dets])
+
+    # Renamed items inherit the original item's image
+    _orig_names = INV_ITEMS["name"].to_numpy()
+    for _src, _det in zip(_det_src, _dets):
+        _orig_img = _IMAGE_URLS.get(_orig_names[_src], "")
+        if _orig_img and _det["display_name"] not in _IMAGE_URLS:
+            _IMAGE_URLS[_det["display_name"]] = _orig_img
+    INV_ITEMS = _expanded
+
+if _HAS_ITEMS and "_orig_name" not in INV_ITEMS.columns:
     INV_ITEMS["_orig_name"] = INV_ITEMS["name"]
 
 # Rebuild _UPLOADED_INVENTORY
 _UPLOADED_INVENTORY.clear()
-if len(INV_ITEMS) > 0:
-    for _, _r in INV_ITEMS.iterrows():
-        _loc = _norm_loc(_r.get("_override_location", ""))
-        if not _loc:
-            continue
-        _inv_key = (_loc, _r["name"], _r.get("category", "Other"))
-        _UPLOADED_INVENTORY[_inv_key] = _UPLOADED_INVENTORY.get(_inv_key, 0) + int(_r["qty"])
+if _HAS_ITEMS and "_override_location" in INV_ITEMS.columns:
+    _norm_locs = _per_unique(INV_ITEMS["_override_location"].fillna(""),
+                             lambda locs: [_norm_loc(l) for l in locs])
+    _placed = pd.DataFrame({
+        "loc": _norm_locs,
+        "name": INV_ITEMS["name"],
+        "category": INV_ITEMS["category"] if "category" in INV_ITEMS.columns else "Other",
+        "qty": INV_ITEMS["qty"].astype(int),
+    })[_norm_locs != ""]
+    _UPLOADED_INVENTORY.update(
+        _placed.groupby(["loc", "name", "category"], sort=False, dropna=False)["qty"].sum().to_dict()
+    )
 
 # Apply persistent image overrides
 try:
@@ -415,19 +748,19 @@ monthly_inv_spend = INV_DF.groupby("month")["grand_total"].sum()
 monthly_inv_subtotal = INV_DF.groupby("month")["subtotal"].sum()
 
 # ── Auto-categorize items ────────────────────────────────────────────────────
-if len(INV_ITEMS) > 0:
+if _HAS_ITEMS:
     if "category" in INV_ITEMS.columns:
         _cat_mask = INV_ITEMS["category"].isna() | (INV_ITEMS["category"] == "")
-        INV_ITEMS.loc[_cat_mask, "category"] = INV_ITEMS.loc[_cat_mask, "name"].apply(categorize_item)
+        INV_ITEMS.loc[_cat_mask, "category"] = categorize_items(INV_ITEMS.loc[_cat_mask, "name"])
     else:
-        INV_ITEMS["category"] = INV_ITEMS["name"].apply(categorize_item)
+        INV_ITEMS["category"] = categorize_items(INV_ITEMS["name"])
     inv_by_category = INV_ITEMS.groupby("category")["total"].sum().sort_values(ascending=False)
 else:
     inv_by_category = pd.Series(dtype=float)
 
-if len(INV_ITEMS) > 0:
-    personal_total = INV_ITEMS[INV_ITEMS["category"] == "Personal/Gift"]["total"].sum()
-    biz_fee_total = INV_ITEMS[INV_ITEMS["category"] == "Business Fees"]["total"].sum()
+if _HAS_ITEMS:
+    personal_total = inv_by_category.get("Personal/Gift", 0.0)
+    biz_fee_total = inv_by_category.get("Business Fees", 0.0)
     true_inventory_cost = total_inventory_cost - personal_total - biz_fee_total
 else:
     personal_total = 0.0
@@ -449,22 +782,8 @@ bank_total_deposits = sum(t["amount"] for t in bank_deposits)
 bank_total_debits = sum(t["amount"] for t in bank_debits)
 bank_net_cash = bank_total_deposits - bank_total_debits
 
-bank_by_cat = {}
-for t in bank_debits:
-    cat = t["category"]
-    bank_by_cat[cat] = bank_by_cat.get(cat, 0) + t["amount"]
-bank_by_cat = dict(sorted(bank_by_cat.items(), key=lambda x: -x[1]))
-
-bank_monthly = {}
-for t in BANK_TXNS:
-    parts = t["date"].split("/")
-    month_key = f"{parts[2]}-{parts[0]}"
-    if month_key not in bank_monthly:
-        bank_monthly[month_key] = {"deposits": 0, "debits": 0}
-    if t["type"] == "deposit":
-        bank_monthly[month_key]["deposits"] += t["amount"]
-    else:
-        bank_monthly[month_key]["debits"] += t["amount"]
+_bank_btx = _bank_frame(BANK_TXNS)
+bank_by_cat, bank_monthly = _bank_aggregates(_bank_btx)
 
 bank_tax_deductible = sum(amt for cat, amt in bank_by_cat.items() if cat in BANK_TAX_DEDUCTIBLE)
 bank_personal = bank_by_cat.get("Personal", 0)
@@ -498,7 +817,7 @@ draw_diff = abs(tulsa_draw_total - texas_draw_total)
 draw_owed_to = "Braden" if tulsa_draw_total > texas_draw_total else "TJ"
 
 # ── Credit card / other account spending ─────────────────────────────────────
-cc_by_method = INV_DF.groupby("payment_method").agg(
+cc_by_method = INV_DF.groupby("payment_method", observed=True).agg(
     count=("grand_total", "count"),
     total=("grand_total", "sum"),
 ).to_dict("index") if len(INV_DF) > 0 else {}
@@ -514,15 +833,8 @@ other_inv_total = sum(v["total"] for v in other_inv_methods.values())
 other_inv_count = int(sum(v["count"] for v in other_inv_methods.values()))
 
 # ── Running balance for ledger ──────────────────────────────────────────────
-bank_txns_sorted = sorted(BANK_TXNS, key=lambda x: (_parse_bank_date(x["date"]), 0 if x["type"] == "deposit" else 1))
-bank_running = []
-_bal = 0.0
-for t in bank_txns_sorted:
-    if t["type"] == "deposit":
-        _bal += t["amount"]
-    else:
-        _bal -= t["amount"]
-    bank_running.append({**t, "_balance": round(_bal, 2)})
+bank_txns_sorted, bank_running = _bank_ledger(BANK_TXNS, _bank_btx)
+bank_running_df = pd.DataFrame(bank_running, columns=_BANK_LEDGER_COLUMNS)
 
 # ── Cross-Source Profit ─────────────────────────────────────────────────────
 bank_amazon_inv = bank_by_cat.get("Amazon Inventory", 0)
@@ -531,21 +843,19 @@ full_profit = real_profit - receipt_cogs_outside_bank
 full_profit_margin = (full_profit / gross_sales * 100) if gross_sales else 0
 
 # ── Location classification ─────────────────────────────────────────────────
-INV_DF["location"] = INV_DF["ship_address"].apply(classify_location)
-if len(INV_ITEMS) > 0:
+INV_DF["location"] = classify_locations(INV_DF["ship_address"])
+if _HAS_ITEMS:
     if "_override_location" in INV_ITEMS.columns:
-        INV_ITEMS["location"] = INV_ITEMS.apply(
-            lambda r: r["_override_location"] if r["_override_location"] else classify_location(r["ship_to"]),
-            axis=1,
-        )
+        _ov_loc = INV_ITEMS["_override_location"]
+        INV_ITEMS["location"] = np.where(_ov_loc.astype(bool), _ov_loc, classify_locations(INV_ITEMS["ship_to"]))
     else:
-        INV_ITEMS["location"] = INV_ITEMS["ship_to"].apply(classify_location)
+        INV_ITEMS["location"] = classify_locations(INV_ITEMS["ship_to"])
 
 # Business-only filtered data
 _personal_order_mask = (INV_DF["source"] == "Personal Amazon") | INV_DF["file"].str.contains("Gigi", na=False)
 BIZ_INV_DF = INV_DF[~_personal_order_mask].copy()
-if len(INV_ITEMS) > 0:
-    BIZ_INV_ITEMS = INV_ITEMS[~INV_ITEMS["category"].isin(["Personal/Gift", "Business Fees"])].copy()
+if _HAS_ITEMS:
+    BIZ_INV_ITEMS = INV_ITEMS[_biz_item_mask()].copy()
     biz_inv_by_category = BIZ_INV_ITEMS.groupby("category")["total"].sum().sort_values(ascending=False)
     personal_inv_items = INV_ITEMS[INV_ITEMS["category"] == "Personal/Gift"].copy()
 else:
@@ -562,7 +872,7 @@ try:
 except Exception:
     pass
 
-if _QUICK_ADDS and len(INV_ITEMS) > 0:
+if _QUICK_ADDS and _HAS_ITEMS:
     qa_rows = []
     for qa in _QUICK_ADDS:
         qa_rows.append({
@@ -600,32 +910,16 @@ _usage_by_item: dict[str, int] = {}
 for u in _USAGE_LOG:
     _usage_by_item[u["item_name"]] = _usage_by_item.get(u["item_name"], 0) + u.get("qty", 1)
 
-STOCK_SUMMARY = pd.DataFrame()
-if len(INV_ITEMS) > 0:
-    _biz_mask = ~INV_ITEMS["category"].isin(["Personal/Gift", "Business Fees"])
-    _biz_items = INV_ITEMS[_biz_mask].copy()
-    if len(_biz_items) > 0:
-        _agg_dict = {
-            "category": ("category", "first"),
-            "total_purchased": ("qty", "sum"),
-            "total_cost": ("total", "sum"),
-            "location": ("location", "first"),
-            "image_url": ("image_url", "first"),
-        }
-        if "total_with_tax" in _biz_items.columns:
-            _agg_dict["total_cost_with_tax"] = ("total_with_tax", "sum")
-        _stock_agg = _biz_items.groupby("name").agg(**_agg_dict).reset_index()
-        _stock_agg = _stock_agg.rename(columns={"name": "display_name"})
-        _stock_agg["total_used"] = _stock_agg["display_name"].map(lambda n: _usage_by_item.get(n, 0))
-        _stock_agg["in_stock"] = _stock_agg["total_purchased"] - _stock_agg["total_used"]
-        _stock_agg["unit_cost"] = (_stock_agg["total_cost"] / _stock_agg["total_purchased"]).round(2)
-        if "total_cost_with_tax" in _stock_agg.columns:
-            _stock_agg["unit_cost_with_tax"] = (_stock_agg["total_cost_with_tax"] / _stock_agg["total_purchased"]).round(2)
-        else:
-            _stock_agg["total_cost_with_tax"] = _stock_agg["total_cost"]
-            _stock_agg["unit_cost_with_tax"] = _stock_agg["unit_cost"]
-        _stock_agg["image_url"] = _stock_agg["display_name"].map(lambda n: _IMAGE_URLS.get(n, ""))
-        STOCK_SUMMARY = _stock_agg.sort_values(["category", "display_name"]).reset_index(drop=True)
+# Stock status lookup tables, indexed by the code from _stock_status (0 out, 1 low, 2 in stock)
+_STOCK_COLORS = np.array([RED, ORANGE, GREEN], dtype=object)
+_STOCK_LABELS = np.array(["Out of Stock", "Low Stock", "In Stock"], dtype=object)
+
+
+def _stock_status(qty):
+    """Color and label arrays for stock quantities (>2 in stock, 1-2 low, else out)."""
+    qty = np.asarray(qty)
+    codes = (qty > 0).astype(np.int8) + (qty > 2)
+    return _STOCK_COLORS[codes], _STOCK_LABELS[codes]
 
 
 def _recompute_stock_summary():
@@ -633,8 +927,7 @@ def _recompute_stock_summary():
     if len(INV_ITEMS) == 0:
         STOCK_SUMMARY = pd.DataFrame()
         return STOCK_SUMMARY
-    _biz_mask = ~INV_ITEMS["category"].isin(["Personal/Gift", "Business Fees"])
-    _biz = INV_ITEMS[_biz_mask].copy()
+    _biz = INV_ITEMS[_biz_item_mask()]
     if len(_biz) == 0:
         STOCK_SUMMARY = pd.DataFrame()
         return STOCK_SUMMARY
@@ -645,30 +938,44 @@ def _recompute_stock_summary():
         "location": ("location", "first") if "location" in _biz.columns else ("ship_to", "first"),
         "image_url": ("image_url", "first"),
     }
-    if "total_with_tax" in _biz.columns:
+    _has_tax = "total_with_tax" in _biz.columns
+    if _has_tax:
         _agg["total_cost_with_tax"] = ("total_with_tax", "sum")
     _sa = _biz.groupby("name").agg(**_agg).reset_index().rename(columns={"name": "display_name"})
-    _sa["total_used"] = _sa["display_name"].map(lambda n: _usage_by_item.get(n, 0))
-    _sa["in_stock"] = _sa["total_purchased"] - _sa["total_used"]
-    _sa["unit_cost"] = (_sa["total_cost"] / _sa["total_purchased"]).round(2)
-    if "total_cost_with_tax" in _sa.columns:
-        _sa["unit_cost_with_tax"] = (_sa["total_cost_with_tax"] / _sa["total_purchased"]).round(2)
-    else:
-        _sa["total_cost_with_tax"] = _sa["total_cost"]
-        _sa["unit_cost_with_tax"] = _sa["unit_cost"]
-    _sa["image_url"] = _sa["display_name"].map(lambda n: _IMAGE_URLS.get(n, ""))
+
+    # Derived columns in one pass over the aggregated arrays
+    names = _sa["display_name"].tolist()
+    purchased = _sa["total_purchased"].to_numpy()
+    cost = _sa["total_cost"].to_numpy()
+    used = np.array([_usage_by_item.get(n, 0) for n in names])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        unit_cost = np.round(cost / purchased, 2)
+        unit_cost_tax = np.round(_sa["total_cost_with_tax"].to_numpy() / purchased, 2) if _has_tax else unit_cost
+    _sa["total_used"] = used
+    _sa["in_stock"] = purchased - used
+    _sa["unit_cost"] = unit_cost
+    if not _has_tax:
+        _sa["total_cost_with_tax"] = cost
+    _sa["unit_cost_with_tax"] = unit_cost_tax
+    _sa["image_url"] = [_IMAGE_URLS.get(n, "") for n in names]
+    _sa["stock_color"], _sa["stock_label"] = _stock_status(purchased - used)
     STOCK_SUMMARY = _sa.sort_values(["category", "display_name"]).reset_index(drop=True)
     return STOCK_SUMMARY
 
 
+STOCK_SUMMARY = _recompute_stock_summary()
+
+
 def _compute_stock_kpis(stock_df=None):
     if stock_df is None:
         stock_df = STOCK_SUMMARY
     if len(stock_df) == 0:
-        return {"in_stock": 0, "value": 0, "low": 0, "oos": 0, "unique": 0}
+        return {"in_stock": 0, "value": 0, "value_str": "$0.00", "low": 0, "oos": 0, "unique": 0}
+    value = stock_df["total_cost"].sum()
     return {
         "in_stock": int(stock_df["in_stock"].sum()),
-        "value": stock_df["total_cost"].sum(),
+        "value": value,
+        "value_str": f"${value:,.2f}",
         "low": int((stock_df["in_stock"].between(1, 2)).sum()),
         "oos": int((stock_df["in_stock"] <= 0).sum()),
         "unique": len(stock_df),
@@ -676,16 +983,17 @@ def _compute_stock_kpis(stock_df=None):
 
 
 # ── Stock KPI vars ──────────────────────────────────────────────────────────
-total_in_stock = int(STOCK_SUMMARY["in_stock"].sum()) if len(STOCK_SUMMARY) > 0 else 0
-total_stock_value = STOCK_SUMMARY["total_cost"].sum() if len(STOCK_SUMMARY) > 0 else 0
-low_stock_count = int((STOCK_SUMMARY["in_stock"].between(1, 2)).sum()) if len(STOCK_SUMMARY) > 0 else 0
-out_of_stock_count = int((STOCK_SUMMARY["in_stock"] <= 0).sum()) if len(STOCK_SUMMARY) > 0 else 0
-unique_item_count = len(STOCK_SUMMARY) if len(STOCK_SUMMARY) > 0 else 0
+_stock_kpis = _compute_stock_kpis()
+total_in_stock = _stock_kpis["in_stock"]
+total_stock_value = _stock_kpis["value"]
+low_stock_count = _stock_kpis["low"]
+out_of_stock_count = _stock_kpis["oos"]
+unique_item_count = _stock_kpis["unique"]
 
 # ── Payment method aggregates ───────────────────────────────────────────────
 payment_summary = {}
 if len(INV_DF) > 0:
-    for pm, grp in INV_DF.groupby("payment_method"):
+    for pm, grp in INV_DF.groupby("payment_method", observed=True):
         dates = grp["date_parsed"].dropna()
         payment_summary[pm] = {
             "orders": len(grp),
@@ -694,31 +1002,47 @@ if len(INV_DF) > 0:
             "tax": grp["tax"].sum(),
             "first_date": dates.min() if len(dates) > 0 else None,
             "last_date": dates.max() if len(dates) > 0 else None,
-            "items": [],
+            "_item_idx": np.empty(0, dtype=np.intp),
         }
     if len(INV_ITEMS) > 0:
-        for pm, grp in INV_ITEMS.groupby("payment_method"):
+        for pm, idx in INV_ITEMS.groupby("payment_method", sort=False).indices.items():
             if pm in payment_summary:
-                payment_summary[pm]["items"] = grp.to_dict("records")
+                payment_summary[pm]["_item_idx"] = idx
+_PAYMENT_ITEMS = INV_ITEMS
+
+
+def get_payment_items(pm):
+    """Line items paid with ``pm`` as a list of row dicts, materialized on demand."""
+    summary = payment_summary.get(pm)
+    if summary is None or len(summary["_item_idx"]) == 0:
+        return []
+    return _PAYMENT_ITEMS.iloc[summary["_item_idx"]].to_dict("records")
+
 
 # ── Per-location aggregates ─────────────────────────────────────────────────
-loc_spend = BIZ_INV_DF.groupby("location")["grand_total"].sum()
-loc_orders = BIZ_INV_DF.groupby("location")["order_num"].count()
-loc_tax = BIZ_INV_DF.groupby("location")["tax"].sum()
-loc_subtotal = BIZ_INV_DF.groupby("location")["subtotal"].sum()
-
-tulsa_spend = loc_spend.get("Tulsa, OK", 0)
-texas_spend = loc_spend.get("Texas", 0)
-tulsa_orders = loc_orders.get("Tulsa, OK", 0)
-texas_orders = loc_orders.get("Texas", 0)
-tulsa_tax = loc_tax.get("Tulsa, OK", 0)
-texas_tax = loc_tax.get("Texas", 0)
-tulsa_subtotal = loc_subtotal.get("Tulsa, OK", 0)
-texas_subtotal = loc_subtotal.get("Texas", 0)
+loc_agg = BIZ_INV_DF.groupby("location").agg(
+    grand_total=("grand_total", "sum"),
+    order_num=("order_num", "count"),
+    tax=("tax", "sum"),
+    subtotal=("subtotal", "sum"),
+)
+loc_spend = loc_agg["grand_total"]
+loc_orders = loc_agg["order_num"]
+loc_tax = loc_agg["tax"]
+loc_subtotal = loc_agg["subtotal"]
+
+_loc_pair = loc_agg.reindex(["Tulsa, OK", "Texas"], fill_value=0)
+tulsa_spend, texas_spend = _loc_pair["grand_total"].tolist()
+tulsa_orders, texas_orders = _loc_pair["order_num"].tolist()
+tulsa_tax, texas_tax = _loc_pair["tax"].tolist()
+tulsa_subtotal, texas_subtotal = _loc_pair["subtotal"].tolist()
+
+# Business items split by location once; the Locations boards and charts all read from this
+BIZ_INV_BY_LOC = dict(iter(BIZ_INV_ITEMS.groupby("location", sort=False))) if len(BIZ_INV_ITEMS) > 0 else {}
 
 if len(BIZ_INV_ITEMS) > 0:
-    tulsa_items = BIZ_INV_ITEMS[BIZ_INV_ITEMS["location"] == "Tulsa, OK"]
-    texas_items = BIZ_INV_ITEMS[BIZ_INV_ITEMS["location"] == "Texas"]
+    tulsa_items = BIZ_INV_BY_LOC.get("Tulsa, OK", BIZ_INV_ITEMS.iloc[:0])
+    texas_items = BIZ_INV_BY_LOC.get("Texas", BIZ_INV_ITEMS.iloc[:0])
     tulsa_by_cat = tulsa_items.groupby("category")["total"].sum().sort_values(ascending=False)
     texas_by_cat = texas_items.groupby("category")["total"].sum().sort_values(ascending=False)
     tulsa_monthly = BIZ_INV_DF[BIZ_INV_DF["location"] == "Tulsa, OK"].groupby("month")["grand_total"].sum()
@@ -729,133 +1053,162 @@ else:
     tulsa_monthly = pd.Series(dtype=float)
     texas_monthly = pd.Series(dtype=float)
 
+# Per-item aggregates for the Locations boards, keyed by location
+_EMPTY_LOC_AGG = pd.DataFrame(columns=["name", "category", "qty", "total", "price", "stock_color", "image_url"])
+
+
+def _loc_agg(grp):
+    agg = grp.groupby("name").agg(
+        category=("category", "first"),
+        qty=("qty", "sum"),
+        total=("total", "sum"),
+        price=("price", "first"),
+    ).reset_index().sort_values("category")
+    agg["stock_color"] = _stock_status(agg["qty"])[0]
+    agg["image_url"] = [_IMAGE_URLS.get(n, "") for n in agg["name"].tolist()]
+    return agg
+
+
+LOC_AGG = {loc: _loc_agg(grp) for loc, grp in BIZ_INV_BY_LOC.items()}
+_loc_totals = {loc: (int(agg["qty"].sum()), agg["total"].sum()) for loc, agg in LOC_AGG.items()}
+tulsa_qty, tulsa_value = _loc_totals.get("Tulsa, OK", (0, 0))
+texas_qty, texas_value = _loc_totals.get("Texas", (0, 0))
+
+
+def _refresh_image_urls():
+    """Re-resolve the precomputed image_url columns after ``_IMAGE_URLS`` changes."""
+    if len(STOCK_SUMMARY) > 0:
+        STOCK_SUMMARY["image_url"] = [_IMAGE_URLS.get(n, "") for n in STOCK_SUMMARY["display_name"].tolist()]
+    for agg in LOC_AGG.values():
+        agg["image_url"] = [_IMAGE_URLS.get(n, "") for n in agg["name"].tolist()]
+
 true_net_profit = net_profit - total_inventory_cost
 true_profit_margin = (true_net_profit / gross_sales * 100) if gross_sales else 0
 
 # ── Fee breakdown ───────────────────────────────────────────────────────────
-listing_fees = abs(fee_df[fee_df["Title"].str.contains("Listing fee", na=False)]["Net_Clean"].sum())
-transaction_fees_product = abs(
-    fee_df[
-        fee_df["Title"].str.startswith("Transaction fee:", na=False)
-        & ~fee_df["Title"].str.contains("Shipping", na=False)
-    ]["Net_Clean"].sum()
-)
-transaction_fees_shipping = abs(
-    fee_df[fee_df["Title"].str.contains("Transaction fee: Shipping", na=False)]["Net_Clean"].sum()
-)
-processing_fees = abs(fee_df[fee_df["Title"].str.contains("Processing fee", na=False)]["Net_Clean"].sum())
-
-credit_transaction = fee_df[fee_df["Title"].str.startswith("Credit for transaction fee", na=False)]["Net_Clean"].sum()
-credit_listing = fee_df[fee_df["Title"].str.startswith("Credit for listing fee", na=False)]["Net_Clean"].sum()
-credit_processing = fee_df[fee_df["Title"].str.startswith("Credit for processing fee", na=False)]["Net_Clean"].sum()
-share_save = fee_df[fee_df["Title"].str.contains("Share & Save", na=False)]["Net_Clean"].sum()
+# Each frame is aggregated by Title once and every distinct title is then matched
+# against all of that frame's buckets in a single regex pass.
+_fee_b = _title_buckets(_title_totals(fee_df), _FEE_BUCKETS)
+_mkt_b = _title_buckets(_title_totals(mkt_df), _MKT_BUCKETS)
+_ship_b = _title_buckets(_title_totals(ship_df), _SHIP_BUCKETS)
+
+listing_fees = abs(_fee_b["listing"][0])
+transaction_fees_product = abs(_fee_b["txn_product"][0])
+transaction_fees_shipping = abs(_fee_b["txn_shipping"][0])
+processing_fees = abs(_fee_b["processing"][0])
+
+credit_transaction = _fee_b["credit_transaction"][0]
+credit_listing = _fee_b["credit_listing"][0]
+credit_processing = _fee_b["credit_processing"][0]
+share_save = _fee_b["share_save"][0]
 total_credits = credit_transaction + credit_listing + credit_processing + share_save
 
 # Marketing breakdown
-etsy_ads = abs(mkt_df[mkt_df["Title"].str.contains("Etsy Ads", na=False)]["Net_Clean"].sum())
-offsite_ads_fees = abs(
-    mkt_df[
-        mkt_df["Title"].str.contains("Offsite Ads", na=False)
-        & ~mkt_df["Title"].str.contains("Credit", na=False)
-    ]["Net_Clean"].sum()
-)
-offsite_ads_credits = mkt_df[mkt_df["Title"].str.contains("Credit for Offsite", na=False)]["Net_Clean"].sum()
+etsy_ads = abs(_mkt_b["etsy_ads"][0])
+offsite_ads_fees = abs(_mkt_b["offsite_fees"][0])
+offsite_ads_credits = _mkt_b["offsite_credits"][0]
 
 # Shipping subcategories
-usps_outbound = abs(ship_df[ship_df["Title"] == "USPS shipping label"]["Net_Clean"].sum())
-usps_outbound_count = len(ship_df[ship_df["Title"] == "USPS shipping label"])
-usps_return = abs(ship_df[ship_df["Title"] == "USPS return shipping label"]["Net_Clean"].sum())
-usps_return_count = len(ship_df[ship_df["Title"] == "USPS return shipping label"])
-asendia_labels = abs(ship_df[ship_df["Title"].str.contains("Asendia", na=False)]["Net_Clean"].sum())
-asendia_count = len(ship_df[ship_df["Title"].str.contains("Asendia", na=False)])
-ship_adjustments = abs(ship_df[ship_df["Title"].str.contains("Adjustment", na=False)]["Net_Clean"].sum())
-ship_adjust_count = len(ship_df[ship_df["Title"].str.contains("Adjustment", na=False)])
-ship_credits = ship_df[ship_df["Title"].str.contains("Credit for", na=False)]["Net_Clean"].sum()
-ship_credit_count = len(ship_df[ship_df["Title"].str.contains("Credit for", na=False)])
-ship_insurance = abs(ship_df[ship_df["Title"].str.contains("insurance", case=False, na=False)]["Net_Clean"].sum())
-ship_insurance_count = len(ship_df[ship_df["Title"].str.contains("insurance", case=False, na=False)])
+usps_outbound, usps_outbound_count = _ship_b["usps_outbound"]
+usps_outbound = abs(usps_outbound)
+usps_return, usps_return_count = _ship_b["usps_return"]
+usps_return = abs(usps_return)
+asendia_labels, asendia_count = _ship_b["asendia"]
+asendia_labels = abs(asendia_labels)
+ship_adjustments, ship_adjust_count = _ship_b["adjustment"]
+ship_adjustments = abs(ship_adjustments)
+ship_credits, ship_credit_count = _ship_b["credit"]
+ship_insurance, ship_insurance_count = _ship_b["insurance"]
+ship_insurance = abs(ship_insurance)
 
 # Buyer paid shipping
-ship_fee_gross = abs(
-    fee_df[fee_df["Title"].str.contains("Transaction fee: Shipping", na=False)]["Net_Clean"].sum()
-)
-ship_fee_credits_amt = abs(
-    fee_df[fee_df["Title"].str.contains("Credit for transaction fee on shipping", na=False)]["Net_Clean"].sum()
-)
+ship_fee_gross = transaction_fees_shipping
+ship_fee_credits_amt = abs(_fee_b["credit_ship_fee"][0])
 net_ship_tx_fees = ship_fee_gross - ship_fee_credits_amt
 buyer_paid_shipping = net_ship_tx_fees / 0.065
 shipping_profit = buyer_paid_shipping - total_shipping_cost
 shipping_margin = (shipping_profit / buyer_paid_shipping * 100) if buyer_paid_shipping else 0
 
-ship_fee_rows = fee_df[fee_df["Title"].str.contains("Transaction fee: Shipping", na=False)].copy()
-orders_with_paid_shipping = set(ship_fee_rows["Info"].dropna())
-all_order_ids = set(sales_df["Title"].str.extract(r"(Order #\d+)", expand=False).dropna())
-orders_free_shipping = all_order_ids - orders_with_paid_shipping
-paid_ship_count = len(orders_with_paid_shipping & all_order_ids)
-free_ship_count = len(orders_free_shipping)
+ship_fee_rows = fee_df[fee_df["Title"].str.contains("Transaction fee: Shipping", na=False)]
+# Sale order ids and shipping-fee order ids share one integer coding, so the
+# paid/free split is a pair of sorted int-array set operations.
+_sale_order_ids = sales_df["OrderId"].dropna()
+_order_codes, _ = pd.factorize(pd.concat([_sale_order_ids, ship_fee_rows["Info"].dropna()], ignore_index=True))
+_sale_codes = np.unique(_order_codes[:len(_sale_order_ids)])
+_paid_codes = np.unique(_order_codes[len(_sale_order_ids):])
+paid_ship_count = int(np.intersect1d(_paid_codes, _sale_codes, assume_unique=True).size)
+free_ship_count = int(np.setdiff1d(_sale_codes, _paid_codes, assume_unique=True).size)
 avg_outbound_label = usps_outbound / usps_outbound_count if usps_outbound_count else 0
 est_label_cost_paid_orders = paid_ship_count * avg_outbound_label
 paid_shipping_profit = buyer_paid_shipping - est_label_cost_paid_orders
 est_label_cost_free_orders = free_ship_count * avg_outbound_label
 
 # Refunded orders shipping
-refund_df_orders = refund_df.copy()
-refund_df_orders["Order"] = refund_df_orders["Title"].str.extract(r"(Order #\d+)")
-refunded_order_ids = set(refund_df_orders["Order"].dropna())
-
-refund_ship_fees = 0.0
-refund_ship_count = 0
-for oid in refunded_order_ids:
-    order_ship = fee_df[
-        (fee_df["Info"] == oid) & fee_df["Title"].str.contains("Transaction fee: Shipping", na=False)
-    ]
-    if len(order_ship):
-        refund_ship_fees += abs(order_ship["Net_Clean"].sum())
-        refund_ship_count += 1
+refunded_order_ids = set(refund_df["OrderId"].dropna())
+
+_ship_fee_by_order = ship_fee_rows.groupby("Info")["Net_Clean"].sum().abs()
+_refund_ship = _ship_fee_by_order[_ship_fee_by_order.index.isin(refunded_order_ids)]
+refund_ship_fees = float(_refund_ship.sum())
+refund_ship_count = len(_refund_ship)
 refund_buyer_shipping = refund_ship_fees / 0.065 if refund_ship_fees else 0
 est_refund_label_cost = len(refunded_order_ids) * avg_outbound_label
 
-# Return label matches
-return_labels = ship_df[ship_df["Title"] == "USPS return shipping label"].sort_values("Date_Parsed")
-return_label_matches = []
-for _, ret in return_labels.iterrows():
-    ret_date = ret["Date_Parsed"]
-    nearby = refund_df[abs((refund_df["Date_Parsed"] - ret_date).dt.days) <= 7].copy()
-    best_match_product = "Unknown"
-    best_match_order = "Unknown"
-    best_match_refund = 0
-    if len(nearby):
-        nearby["_dist"] = abs((nearby["Date_Parsed"] - ret_date).dt.days)
-        best = nearby.sort_values("_dist").iloc[0]
-        best_match_order = best["Title"].replace("Refund for ", "").replace("Partial refund for ", "")
-        best_match_refund = abs(best["Net_Clean"])
-        prod_row = fee_df[
-            (fee_df["Info"] == best_match_order)
-            & fee_df["Title"].str.startswith("Transaction fee:", na=False)
-            & ~fee_df["Title"].str.contains("Shipping", na=False)
-        ]
-        if len(prod_row):
-            best_match_product = prod_row.iloc[0]["Title"].replace("Transaction fee: ", "")
-    return_label_matches.append({
-        "date": ret["Date"],
-        "label": ret["Info"],
-        "cost": abs(ret["Net_Clean"]),
-        "product": best_match_product,
-        "order": best_match_order,
-        "refund_amt": best_match_refund,
-    })
-
 # Product performance
 prod_fees = fee_df[
     fee_df["Title"].str.startswith("Transaction fee:", na=False)
     & ~fee_df["Title"].str.contains("Shipping", na=False)
 ].copy()
-prod_fees["Product"] = prod_fees["Title"].str.replace("Transaction fee: ", "", regex=False)
-product_fee_totals = prod_fees.groupby("Product")["Net_Clean"].sum().abs().sort_values(ascending=False)
+prod_fees["Product"] = prod_fees["Title"].str.removeprefix("Transaction fee: ")
+_prod_codes, _prod_names = pd.factorize(prod_fees["Product"], sort=True)
+product_fee_totals = pd.Series(
+    np.abs(np.bincount(_prod_codes, weights=prod_fees["Net_Clean"].fillna(0).to_numpy(),
+                       minlength=len(_prod_names))),
+    index=_prod_names.rename("Product"), name="Net_Clean",
+).sort_values(ascending=False)
 if len(product_fee_totals) > 0:
     product_revenue_est = (product_fee_totals / 0.065).round(2)
 else:
     product_revenue_est = pd.Series(dtype=float)
+# Deep Dive's top-10 bar, with labels already truncated for the axis
+_top_products = product_revenue_est.head(10)
+top_products_top10 = {"values": _top_products.to_numpy(),
+                      "labels": [n[:35] for n in _top_products.index]}
+
+# Return label matches: each label is paired with the nearest refund (within
+# 7 days, earliest refund row on ties) via a label x refund day-distance matrix.
+return_labels = ship_df[ship_df["Title"] == "USPS return shipping label"].sort_values("Date_Parsed")
+# Order -> product reverse index (first transaction fee per order), so each
+# matched label resolves its product with a dict lookup instead of a fee_df scan.
+_product_by_order = prod_fees.drop_duplicates("Info").set_index("Info")["Product"].to_dict()
+_refund_orders = (refund_df["Title"].str.replace("Refund for ", "", regex=False)
+                  .str.replace("Partial refund for ", "", regex=False).to_numpy())
+_refund_amts = refund_df["Net_Clean"].abs().to_numpy()
+_found = np.zeros(len(return_labels), dtype=bool)
+_best = np.zeros(len(return_labels), dtype=np.intp)
+if len(return_labels) and len(refund_df):
+    _delta = refund_df["Date_Parsed"].to_numpy()[None, :] - return_labels["Date_Parsed"].to_numpy()[:, None]
+    _valid = ~np.isnat(_delta)
+    _days = np.abs(np.where(_valid, _delta, np.timedelta64(0, "D")) // np.timedelta64(1, "D"))
+    _dist = np.where(_valid & (_days <= 7), _days, np.iinfo(np.int64).max)
+    _best = _dist.argmin(axis=1)
+    _found = _dist[np.arange(len(_dist)), _best] <= 7
+
+return_label_matches = []
+for _i, (_date, _label, _cost) in enumerate(zip(return_labels["Date"], return_labels["Info"],
+                                                 return_labels["Net_Clean"].abs())):
+    if _found[_i]:
+        _order = _refund_orders[_best[_i]]
+        _product, _refund_amt = _product_by_order.get(_order, "Unknown"), _refund_amts[_best[_i]]
+    else:
+        _order, _product, _refund_amt = "Unknown", "Unknown", 0
+    return_label_matches.append({
+        "date": _date,
+        "label": _label,
+        "cost": _cost,
+        "product": _product,
+        "order": _order,
+        "refund_amt": _refund_amt,
+    })
 
 # ── Monthly breakdown ───────────────────────────────────────────────────────
 months_sorted = sorted(DATA["Month"].dropna().unique())
@@ -867,68 +1220,75 @@ def monthly_sum(type_name):
 
 
 monthly_sales = monthly_sum("Sale")
-monthly_fees = monthly_sum("Fee").abs()
-monthly_shipping = monthly_sum("Shipping").abs()
-monthly_marketing = monthly_sum("Marketing").abs()
-monthly_refunds = monthly_sum("Refund").abs()
+monthly_raw_fees = monthly_sum("Fee")
+monthly_raw_shipping = monthly_sum("Shipping")
+monthly_raw_marketing = monthly_sum("Marketing")
+monthly_raw_refunds = monthly_sum("Refund")
+
+monthly_fees = monthly_raw_fees.abs()
+monthly_shipping = monthly_raw_shipping.abs()
+monthly_marketing = monthly_raw_marketing.abs()
+monthly_refunds = monthly_raw_refunds.abs()
 monthly_taxes = monthly_sum("Tax").abs()
 
-monthly_raw_fees = DATA[DATA["Type"] == "Fee"].groupby("Month")["Net_Clean"].sum()
-monthly_raw_shipping = DATA[DATA["Type"] == "Shipping"].groupby("Month")["Net_Clean"].sum()
-monthly_raw_marketing = DATA[DATA["Type"] == "Marketing"].groupby("Month")["Net_Clean"].sum()
-monthly_raw_refunds = DATA[DATA["Type"] == "Refund"].groupby("Month")["Net_Clean"].sum()
-
-monthly_net_revenue = {}
-for m in months_sorted:
-    monthly_net_revenue[m] = (
-        monthly_sales.get(m, 0)
-        + monthly_raw_fees.get(m, 0)
-        + monthly_raw_shipping.get(m, 0)
-        + monthly_raw_marketing.get(m, 0)
-        + monthly_raw_refunds.get(m, 0)
+_monthly_net = (
+    monthly_sales.add(monthly_raw_fees, fill_value=0)
+    .add(monthly_raw_shipping, fill_value=0)
+    .add(monthly_raw_marketing, fill_value=0)
+    .add(monthly_raw_refunds, fill_value=0)
+    .reindex(months_sorted, fill_value=0)
+)
+monthly_net_revenue = _monthly_net.to_dict()
+
+_DAILY_COLUMNS = {"Sale": "revenue", "Fee": "fees", "Shipping": "shipping",
+                  "Marketing": "marketing", "Refund": "refunds"}
+
+
+# Daily and weekly series only feed the deep-dive charts, so they are built on
+# first access (see __getattr__) rather than at import and on every reload.
+@_lazy("daily_sales", "daily_orders", "daily_fee_cost", "daily_ship_cost", "daily_mkt_cost",
+       "daily_refund_cost", "all_dates", "daily_df")
+def _build_daily():
+    # One (day, Type) groupby instead of a pass per subframe
+    daily = (DATA.groupby([DATA["Date_Parsed"].dt.normalize(), "Type"], observed=True)["Net_Clean"]
+             .agg(["sum", "count"]).unstack("Type")
+             .reindex(columns=pd.MultiIndex.from_product([["sum", "count"], list(_DAILY_COLUMNS)])))
+    sums, counts = daily["sum"], daily["count"]
+
+    def stat(frame, txn_type):
+        return frame[txn_type].dropna().rename("Net_Clean")
+
+    # Days with a sale, fee or shipping entry, as in the original date union
+    active = sums[["Sale", "Fee", "Shipping"]].notna().any(axis=1).to_numpy()
+    dates = sums.index[active].rename(None)
+    df = sums.loc[active].fillna(0).rename(columns=_DAILY_COLUMNS).rename_axis(index=None, columns=None)
+    df["orders"] = counts.loc[active, "Sale"].fillna(0).to_numpy()
+    df["profit"] = df[list(_DAILY_COLUMNS.values())].sum(axis=1)
+    df[["cum_revenue", "cum_profit"]] = df[["revenue", "profit"]].cumsum()
+    df["profit_ma7"] = df["profit"].rolling(7, min_periods=1).mean()
+    return (stat(sums, "Sale"), stat(counts, "Sale").astype("int64"), stat(sums, "Fee"),
+            stat(sums, "Shipping"), stat(sums, "Marketing"), stat(sums, "Refund"), dates, df)
+
+
+@_lazy("weekly_aov")
+def _build_weekly_aov():
+    week_start = sales_df["Date_Parsed"].dt.to_period("W").dt.start_time.rename("WeekStart")
+    weekly = sales_df.groupby(week_start).agg(
+        total=("Net_Clean", "sum"),
+        count=("Net_Clean", "count"),
     )
+    weekly["aov"] = weekly["total"] / weekly["count"]
+    return (weekly,)
 
-# Daily aggregations
-daily_sales = sales_df.groupby(sales_df["Date_Parsed"].dt.date)["Net_Clean"].sum()
-daily_orders = sales_df.groupby(sales_df["Date_Parsed"].dt.date)["Net_Clean"].count()
-daily_fee_cost = fee_df.groupby(fee_df["Date_Parsed"].dt.date)["Net_Clean"].sum()
-daily_ship_cost = ship_df.groupby(ship_df["Date_Parsed"].dt.date)["Net_Clean"].sum()
-daily_mkt_cost = mkt_df.groupby(mkt_df["Date_Parsed"].dt.date)["Net_Clean"].sum()
-daily_refund_cost = refund_df.groupby(refund_df["Date_Parsed"].dt.date)["Net_Clean"].sum()
-
-all_dates = sorted(set(daily_sales.index) | set(daily_fee_cost.index) | set(daily_ship_cost.index))
-daily_df = pd.DataFrame(index=all_dates)
-daily_df["revenue"] = pd.Series(daily_sales)
-daily_df["fees"] = pd.Series(daily_fee_cost)
-daily_df["shipping"] = pd.Series(daily_ship_cost)
-daily_df["marketing"] = pd.Series(daily_mkt_cost)
-daily_df["refunds"] = pd.Series(daily_refund_cost)
-daily_df["orders"] = pd.Series(daily_orders)
-daily_df = daily_df.fillna(0)
-daily_df["profit"] = daily_df["revenue"] + daily_df["fees"] + daily_df["shipping"] + daily_df["marketing"] + daily_df["refunds"]
-daily_df["cum_revenue"] = daily_df["revenue"].cumsum()
-daily_df["cum_profit"] = daily_df["profit"].cumsum()
-
-# Weekly AOV
-weekly_sales = sales_df.copy()
-weekly_sales["WeekStart"] = weekly_sales["Date_Parsed"].dt.to_period("W").apply(lambda p: p.start_time)
-weekly_aov = weekly_sales.groupby("WeekStart").agg(
-    total=("Net_Clean", "sum"),
-    count=("Net_Clean", "count"),
-)
-weekly_aov["aov"] = weekly_aov["total"] / weekly_aov["count"]
 
 monthly_order_counts = sales_df.groupby("Month")["Net_Clean"].count()
-monthly_aov = {}
-monthly_profit_per_order = {}
-for m in months_sorted:
-    oc = monthly_order_counts.get(m, 0)
-    if oc > 0:
-        monthly_aov[m] = monthly_sales.get(m, 0) / oc
-        monthly_profit_per_order[m] = monthly_net_revenue.get(m, 0) / oc
-    else:
-        monthly_aov[m] = 0
-        monthly_profit_per_order[m] = 0
+_monthly_oc = monthly_order_counts.reindex(months_sorted, fill_value=0)
+_monthly_aov = monthly_sales.reindex(months_sorted, fill_value=0).div(_monthly_oc).where(_monthly_oc > 0, 0)
+monthly_aov = _monthly_aov.to_dict()
+# Month-aligned arrays (months_sorted order) for trend math on the pages
+monthly_sales_vec = monthly_sales.reindex(months_sorted, fill_value=0).to_numpy(dtype=np.float64)
+monthly_aov_vec = _monthly_aov.to_numpy(dtype=np.float64)
+monthly_profit_per_order = _monthly_net.div(_monthly_oc).where(_monthly_oc > 0, 0).to_dict()
 
 if len(DATA) > 0 and DATA["Date_Parsed"].notna().any():
     days_active = max((DATA["Date_Parsed"].max() - DATA["Date_Parsed"].min()).days, 1)
@@ -942,6 +1302,51 @@ else:
 
 _RECENT_UPLOADS: set = set()
 
+# Bumped at the end of every reload, so pages can key caches of derived views
+# on it instead of recomputing them on each render.
+DATA_VERSION = 0
+
+# Headline totals the pages show as money strings; formatted once per data version
+_FMT_NAMES = (
+    "gross_sales", "net_profit", "full_profit", "total_refunds", "listing_fees",
+    "processing_fees", "shipping_profit", "buyer_paid_shipping", "usps_return",
+    "etsy_balance", "bank_net_cash", "bank_cash_on_hand", "bank_all_expenses",
+    "bank_owner_draw_total", "tulsa_draw_total", "texas_draw_total", "draw_diff",
+    "bb_cc_balance", "bb_cc_limit", "bb_cc_total_charged", "bb_cc_total_paid",
+    "bb_cc_available", "avg_order", "total_fees", "total_shipping_cost", "total_marketing",
+    "receipt_cogs_outside_bank", "bank_biz_expense_total", "bank_tax_deductible",
+)
+
+
+def _build_fmt():
+    g = globals()
+    return {name: money(g[name]) for name in _FMT_NAMES}
+
+
+fmt = _build_fmt()
+
+
+def _bump_data_version():
+    global DATA_VERSION, fmt
+    DATA_VERSION += 1
+    fmt = _build_fmt()
+
+
+def cached_per_version(builder):
+    """Cache a page builder's result until the next reload.
+
+    Results are keyed on ``DATA_VERSION`` plus the call's arguments, so a builder
+    runs once per data version rather than on every render, and callers never
+    pass the version themselves.
+    """
+    cached = lru_cache(maxsize=2)(lambda version, *args: builder(*args))
+
+    @wraps(builder)
+    def wrapper(*args):
+        return cached(DATA_VERSION, *args)
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
 
 def _reload_etsy_data():
     global DATA, sales_df, fee_df, ship_df, mkt_df, refund_df, tax_df
@@ -954,28 +1359,29 @@ def _reload_etsy_data():
     global bank_all_expenses, bank_cash_on_hand, etsy_balance
 
     fresh = _load_data()
-    DATA = fresh["DATA"]
-
-    sales_df = DATA[DATA["Type"] == "Sale"]
-    fee_df = DATA[DATA["Type"] == "Fee"]
-    ship_df = DATA[DATA["Type"] == "Shipping"]
-    mkt_df = DATA[DATA["Type"] == "Marketing"]
-    refund_df = DATA[DATA["Type"] == "Refund"]
-    tax_df = DATA[DATA["Type"] == "Tax"]
-    deposit_df = DATA[DATA["Type"] == "Deposit"]
-    buyer_fee_df = DATA[DATA["Type"] == "Buyer Fee"]
-
-    gross_sales = sales_df["Net_Clean"].sum()
-    total_refunds = abs(refund_df["Net_Clean"].sum())
+    DATA = _prepare_etsy_data(fresh["DATA"])
+
+    by_type, type_net = _split_by_type(DATA)
+    sales_df = by_type["Sale"]
+    fee_df = by_type["Fee"]
+    ship_df = by_type["Shipping"]
+    mkt_df = by_type["Marketing"]
+    refund_df = by_type["Refund"]
+    tax_df = by_type["Tax"]
+    deposit_df = by_type["Deposit"]
+    buyer_fee_df = by_type["Buyer Fee"]
+
+    gross_sales = type_net.get("Sale", 0.0)
+    total_refunds = abs(type_net.get("Refund", 0.0))
     net_sales = gross_sales - total_refunds
-    total_fees = abs(fee_df["Net_Clean"].sum())
-    total_shipping_cost = abs(ship_df["Net_Clean"].sum())
-    total_marketing = abs(mkt_df["Net_Clean"].sum())
-    total_taxes = abs(tax_df["Net_Clean"].sum())
+    total_fees = abs(type_net.get("Fee", 0.0))
+    total_shipping_cost = abs(type_net.get("Shipping", 0.0))
+    total_marketing = abs(type_net.get("Marketing", 0.0))
+    total_taxes = abs(type_net.get("Tax", 0.0))
     order_count = len(sales_df)
     avg_order = gross_sales / order_count if order_count else 0
 
-    total_buyer_fees = abs(buyer_fee_df["Net_Clean"].sum()) if len(buyer_fee_df) else 0.0
+    total_buyer_fees = abs(type_net.get("Buyer Fee", 0.0))
     etsy_net_earned = (gross_sales - total_fees - total_shipping_cost
                        - total_marketing - total_refunds - total_taxes - total_buyer_fees)
     net_profit = etsy_net_earned
@@ -996,6 +1402,10 @@ def _reload_etsy_data():
     real_profit = bank_cash_on_hand + bank_owner_draw_total
     real_profit_margin = (real_profit / gross_sales * 100) if gross_sales else 0
 
+    # Only once every frame above is swapped, or a concurrent render could
+    # rebuild a lazy value from the old frames and keep it
+    _reset_lazy()
+    _bump_data_version()
     return {
         "transactions": len(DATA),
         "orders": order_count,
@@ -1013,7 +1423,7 @@ def _reload_bank_data():
     global bank_owner_draw_total, real_profit, real_profit_margin
     global tulsa_draws, texas_draws, tulsa_draw_total, texas_draw_total
     global draw_diff, draw_owed_to
-    global bank_txns_sorted, bank_running
+    global bank_txns_sorted, bank_running, bank_running_df
     global bb_cc_payments, bb_cc_total_paid, bb_cc_balance, bb_cc_available
 
     bank_dir = os.path.join(BASE_DIR, "data", "bank_statements")
@@ -1103,22 +1513,8 @@ def _reload_bank_data():
     bank_total_debits = sum(t["amount"] for t in bank_debits)
     bank_net_cash = bank_total_deposits - bank_total_debits
 
-    bank_by_cat = {}
-    for t in bank_debits:
-        cat = t["category"]
-        bank_by_cat[cat] = bank_by_cat.get(cat, 0) + t["amount"]
-    bank_by_cat = dict(sorted(bank_by_cat.items(), key=lambda x: -x[1]))
-
-    bank_monthly = {}
-    for t in BANK_TXNS:
-        parts = t["date"].split("/")
-        month_key = f"{parts[2]}-{parts[0]}"
-        if month_key not in bank_monthly:
-            bank_monthly[month_key] = {"deposits": 0, "debits": 0}
-        if t["type"] == "deposit":
-            bank_monthly[month_key]["deposits"] += t["amount"]
-        else:
-            bank_monthly[month_key]["debits"] += t["amount"]
+    btx = _bank_frame(BANK_TXNS)
+    bank_by_cat, bank_monthly = _bank_aggregates(btx)
 
     bank_tax_deductible = sum(amt for cat, amt in bank_by_cat.items() if cat in BANK_TAX_DEDUCTIBLE)
     bank_personal = bank_by_cat.get("Personal", 0)
@@ -1140,16 +1536,8 @@ def _reload_bank_data():
     draw_diff = abs(tulsa_draw_total - texas_draw_total)
     draw_owed_to = "Braden" if tulsa_draw_total > texas_draw_total else "TJ"
 
-    bank_txns_sorted = sorted(BANK_TXNS, key=lambda x: (_parse_bank_date(x["date"]),
-                              0 if x["type"] == "deposit" else 1))
-    bank_running = []
-    _bal = 0.0
-    for t in bank_txns_sorted:
-        if t["type"] == "deposit":
-            _bal += t["amount"]
-        else:
-            _bal -= t["amount"]
-        bank_running.append({**t, "_balance": round(_bal, 2)})
+    bank_txns_sorted, bank_running = _bank_ledger(BANK_TXNS, btx)
+    bank_running_df = pd.DataFrame(bank_running, columns=_BANK_LEDGER_COLUMNS)
 
     # Auto-detect Best Buy CC payments from bank transactions
     bb_cc_payments = [{"date": t["date"], "desc": t["desc"], "amount": t["amount"]}
@@ -1159,6 +1547,7 @@ def _reload_bank_data():
     bb_cc_balance = bb_cc_total_charged - bb_cc_total_paid
     bb_cc_available = bb_cc_limit - bb_cc_balance
 
+    _bump_data_version()
     return {
         "transactions": len(BANK_TXNS),
         "statements": bank_statement_count,
@@ -1166,56 +1555,43 @@ def _reload_bank_data():
     }
 
 
-def _reload_inventory_data(new_order):
-    global INVOICES, INV_DF, INV_ITEMS, BIZ_INV_DF, STOCK_SUMMARY
-    global total_inventory_cost, total_inv_subtotal, total_inv_tax
-    global biz_inv_cost, personal_acct_cost, inv_order_count, true_inventory_cost
+def _save_invoices():
+    """Write INVOICES to the local inventory_orders.json snapshot.
 
-    INVOICES.append(new_order)
-    _RECENT_UPLOADS.add(new_order["order_num"])
+    Written compact: indentation dominated serialization time once the file
+    held a few thousand line items.
+    """
     try:
         out_path = os.path.join(BASE_DIR, "data", "generated", "inventory_orders.json")
         with open(out_path, "w") as f:
-            json.dump(INVOICES, f, indent=2)
+            json.dump(INVOICES, f, separators=(",", ":"))
     except Exception:
         pass
-    _save_new_order(new_order)
 
-    try:
-        dt = pd.to_datetime(new_order["date"], format="%B %d, %Y")
-    except Exception:
-        try:
-            dt = pd.to_datetime(new_order["date"])
-        except Exception:
-            dt = pd.NaT
-    month = dt.to_period("M").strftime("%Y-%m") if pd.notna(dt) else "Unknown"
-
-    new_inv_rows = []
-    for item in new_order["items"]:
-        item_name = item["name"]
-        if item_name.startswith("Your package was left near the front door or porch."):
-            item_name = item_name.replace("Your package was left near the front door or porch.", "").strip()
-        new_inv_rows.append({
-            "order_num": new_order["order_num"],
-            "date": new_order["date"],
-            "date_parsed": dt,
-            "month": month,
-            "name": item_name,
-            "qty": item["qty"],
-            "price": item["price"],
-            "total": item["price"] * item["qty"],
-            "source": new_order["source"],
-            "seller": item.get("seller", "Unknown"),
-            "ship_to": item.get("ship_to", new_order.get("ship_address", "")),
-            "payment_method": new_order.get("payment_method", "Unknown"),
-            "image_url": item.get("image_url", ""),
-            "category": categorize_item(item_name),
-            "_orig_name": item_name,
-            "_override_location": "",
-        })
 
-    if new_inv_rows:
-        new_df = pd.DataFrame(new_inv_rows)
+def _reload_inventory_data(new_order, persist=True):
+    """Add an uploaded order to the inventory globals.
+
+    Pass ``persist=False`` when adding several orders and call ``_save_invoices()``
+    once afterwards, so the local snapshot is rewritten once per upload rather
+    than once per order.
+    """
+    global INVOICES, INV_DF, INV_ITEMS, BIZ_INV_DF, STOCK_SUMMARY
+    global total_inventory_cost, total_inv_subtotal, total_inv_tax
+    global biz_inv_cost, personal_acct_cost, inv_order_count, true_inventory_cost
+
+    INVOICES.append(new_order)
+    _RECENT_UPLOADS.add(new_order["order_num"])
+    _reset_lazy("INVOICE_ITEMS_DF", "INVOICE_LOCATIONS")
+    if persist:
+        _save_invoices()
+    _save_new_order(new_order)
+
+    if new_order["items"]:
+        new_df = _build_inv_items([new_order], *_parse_invoice_dates([new_order]))
+        new_df["category"] = categorize_items(new_df["name"])
+        new_df["_orig_name"] = new_df["name"]
+        new_df["_override_location"] = ""
         if new_order["subtotal"] > 0:
             new_df["total_with_tax"] = (
                 new_df["total"] * (new_order["grand_total"] / new_order["subtotal"])
@@ -1224,26 +1600,7 @@ def _reload_inventory_data(new_order):
             new_df["total_with_tax"] = new_df["total"]
         INV_ITEMS = pd.concat([INV_ITEMS, new_df], ignore_index=True)
 
-    inv_rows = []
-    for inv in INVOICES:
-        d_str = inv["date"]
-        try:
-            d = pd.to_datetime(d_str, format="%B %d, %Y")
-        except Exception:
-            try:
-                d = pd.to_datetime(d_str)
-            except Exception:
-                d = pd.NaT
-        inv_rows.append({
-            "order_num": inv["order_num"], "date": d_str, "date_parsed": d,
-            "month": d.to_period("M").strftime("%Y-%m") if pd.notna(d) else "Unknown",
-            "grand_total": inv["grand_total"], "subtotal": inv["subtotal"],
-            "tax": inv["tax"], "source": inv["source"],
-            "item_count": len(inv["items"]), "file": inv["file"],
-            "ship_address": inv.get("ship_address", ""),
-            "payment_method": inv.get("payment_method", "Unknown"),
-        })
-    INV_DF = pd.DataFrame(inv_rows).sort_values("date_parsed")
+    INV_DF = _build_inv_df(INVOICES, *_parse_invoice_dates(INVOICES))
 
     total_inventory_cost = INV_DF["grand_total"].sum()
     total_inv_subtotal = INV_DF["subtotal"].sum()
@@ -1253,9 +1610,7 @@ def _reload_inventory_data(new_order):
     inv_order_count = len(INV_DF)
 
     if len(INV_ITEMS) > 0:
-        _pt = INV_ITEMS[INV_ITEMS["category"] == "Personal/Gift"]["total"].sum()
-        _bf = INV_ITEMS[INV_ITEMS["category"] == "Business Fees"]["total"].sum()
-        true_inventory_cost = total_inventory_cost - _pt - _bf
+        true_inventory_cost = total_inventory_cost - INV_ITEMS.loc[~_biz_item_mask(), "total"].sum()
     else:
         true_inventory_cost = total_inventory_cost
 
@@ -1263,6 +1618,7 @@ def _reload_inventory_data(new_order):
     BIZ_INV_DF = INV_DF[~_pm].copy()
     _recompute_stock_summary()
 
+    _bump_data_version()
     return {
         "order_num": new_order["order_num"],
         "item_count": len(new_order["items"]),
@@ -1284,6 +1640,7 @@ def _cascade_reload(source="etsy"):
     full_profit_margin = (full_profit / gross_sales * 100) if gross_sales else 0
 
     run_audit()
+    _bump_data_version()
 
 
 def _validate_etsy_csv(decoded_bytes):
@@ -1314,40 +1671,87 @@ def _check_etsy_csv_overlap(new_df, new_filename):
         return False, None, ""
     if pd.isna(new_min) or pd.isna(new_max):
         return False, None, ""
-    for fn in os.listdir(etsy_dir):
-        if not fn.lower().endswith(".csv"):
-            continue
+    for fn, entry in _file_index(etsy_dir, ".csv", "etsy_statements_index.json", _csv_date_range).items():
         if fn == new_filename:
             return True, fn, f"Replacing existing file {fn}"
+        if entry["value"] is None:
+            continue
+        ex_min, ex_max = (pd.Timestamp(d) for d in entry["value"])
+        if new_min <= ex_max and ex_min <= new_max:
+            return True, fn, f"Date range overlaps with {fn} ({ex_min.strftime('%b %Y')}–{ex_max.strftime('%b %Y')})"
+    return False, None, ""
+
+
+def _csv_date_range(path):
+    """[min, max] ISO dates of an Etsy statement's Date column, or None if unreadable."""
+    try:
+        dates = pd.to_datetime(pd.read_csv(path, usecols=["Date"])["Date"], format="%B %d, %Y", errors="coerce")
+    except Exception:
+        return None
+    lo, hi = dates.min(), dates.max()
+    if pd.isna(lo) or pd.isna(hi):
+        return None
+    return [lo.isoformat(), hi.isoformat()]
+
+
+def _file_index(directory, suffix, index_name, compute):
+    """Per-file metadata for the ``suffix`` files in ``directory``, keyed by filename.
+
+    Results of ``compute(path)`` are cached in ``data/generated/<index_name>`` and
+    reused while a file's mtime and size are unchanged, so only new or modified
+    files are read. Files that fail to compute are skipped.
+    """
+    index_path = os.path.join(BASE_DIR, "data", "generated", index_name)
+    try:
+        with open(index_path) as f:
+            cached = json.load(f)
+    except Exception:
+        cached = {}
+    index = {}
+    dirty = False
+    for fn in os.listdir(directory):
+        if not fn.lower().endswith(suffix):
+            continue
         try:
-            existing_df = pd.read_csv(os.path.join(etsy_dir, fn))
-            ex_dates = pd.to_datetime(existing_df["Date"], format="%B %d, %Y", errors="coerce")
-            ex_min, ex_max = ex_dates.min(), ex_dates.max()
-            if pd.isna(ex_min) or pd.isna(ex_max):
+            st = os.stat(os.path.join(directory, fn))
+        except OSError:
+            continue
+        entry = cached.get(fn)
+        if not entry or entry.get("mtime") != st.st_mtime or entry.get("size") != st.st_size:
+            try:
+                value = compute(os.path.join(directory, fn))
+            except Exception:
                 continue
-            if new_min <= ex_max and ex_min <= new_max:
-                return True, fn, f"Date range overlaps with {fn} ({ex_min.strftime('%b %Y')}–{ex_max.strftime('%b %Y')})"
+            entry = {"mtime": st.st_mtime, "size": st.st_size, "value": value}
+            dirty = True
+        index[fn] = entry
+    if dirty or cached.keys() != index.keys():
+        try:
+            with open(index_path, "w") as f:
+                json.dump(index, f, indent=2)
         except Exception:
-            continue
-    return False, None, ""
+            pass
+    return index
 
 
-def _check_bank_pdf_duplicate(decoded_bytes, filename):
+def _pdf_digest(data):
     import hashlib
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _check_bank_pdf_duplicate(decoded_bytes, filename):
     bank_dir = os.path.join(BASE_DIR, "data", "bank_statements")
     if not os.path.isdir(bank_dir):
         return False, None
-    new_hash = hashlib.md5(decoded_bytes).hexdigest()
-    for fn in os.listdir(bank_dir):
-        if not fn.lower().endswith(".pdf"):
-            continue
-        try:
-            with open(os.path.join(bank_dir, fn), "rb") as f:
-                existing_hash = hashlib.md5(f.read()).hexdigest()
-            if new_hash == existing_hash:
-                return True, fn
-        except Exception:
-            continue
+
+    def _hash_file(path):
+        with open(path, "rb") as f:
+            return _pdf_digest(f.read())
+
+    new_hash = _pdf_digest(decoded_bytes)
+    for fn, entry in _file_index(bank_dir, ".pdf", "bank_hashes.json", _hash_file).items():
+        if entry["value"] == new_hash:
+            return True, fn
     return False, None
 
 
@@ -1598,9 +2002,7 @@ def run_audit():
     # ── 14. Fee-to-sale pairing — every Sale should have Transaction fee ────
     try:
         if len(sales_df) > 0 and len(fee_df) > 0:
-            sale_orders = set(
-                sales_df["Title"].str.extract(r"(Order #\d+)", expand=False).dropna()
-            )
+            sale_orders = set(sales_df["OrderId"].dropna())
             fee_orders = set(
                 fee_df[fee_df["Title"].str.startswith("Transaction fee:", na=False)]
                 ["Info"].dropna()
@@ -1,5 +1,6 @@
 """Data Hub page — File uploads for Etsy CSV, bank PDF, receipt PDF."""
 import os
+from functools import lru_cache
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 
@@ -8,12 +9,31 @@ from etsy_dashboard.components.cards import section
 from etsy_dashboard import data_state as ds
 
 
+def _upload_styles(color):
+    """(title, dropzone, card) styles for an upload zone accented with ``color``."""
+    return (
+        {"color": color, "fontWeight": "bold", "marginBottom": "4px"},
+        {
+            "width": "100%", "borderWidth": "2px", "borderStyle": "dashed",
+            "borderColor": f"{color}44", "borderRadius": "10px",
+            "textAlign": "center", "padding": "20px",
+            "cursor": "pointer",
+        },
+        {"borderTop": f"3px solid {color}"},
+    )
+
+
+# Built once for the zone colors the page uses; other colors fall back to _upload_styles
+_UPLOAD_STYLE_BY_COLOR = {c: _upload_styles(c) for c in (GREEN, BLUE, ORANGE)}
+
+
 def _upload_zone(upload_id, title, icon, description, accept, color=CYAN):
     """Build a single upload dropzone."""
+    title_style, drop_style, card_style = _UPLOAD_STYLE_BY_COLOR.get(color) or _upload_styles(color)
     return dbc.Card(dbc.CardBody([
         html.Div([
             html.Span(icon, style={"fontSize": "32px", "marginBottom": "8px", "display": "block"}),
-            html.H5(title, style={"color": color, "fontWeight": "bold", "marginBottom": "4px"}),
+            html.H5(title, style=title_style),
             html.P(description, style={"color": GRAY, "fontSize": "12px", "marginBottom": "12px"}),
         ], style={"textAlign": "center"}),
         dcc.Upload(
@@ -22,23 +42,44 @@ def _upload_zone(upload_id, title, icon, description, accept, color=CYAN):
                 html.Span("Drag & Drop or "),
                 html.A("Click to Browse", style={"color": CYAN, "textDecoration": "underline"}),
             ], style={"color": GRAY, "fontSize": "13px"}),
-            style={
-                "width": "100%", "borderWidth": "2px", "borderStyle": "dashed",
-                "borderColor": f"{color}44", "borderRadius": "10px",
-                "textAlign": "center", "padding": "20px",
-                "cursor": "pointer",
-            },
+            style=drop_style,
             accept=accept,
             className="upload-zone",
         ),
-    ]), style={"borderTop": f"3px solid {color}"}, className="mb-3")
+    ]), style=card_style, className="mb-3")
+
 
+@lru_cache(maxsize=32)
+def _list_files(directory, extension, mtime_ns):
+    """Sorted names of the ``extension`` files in ``directory``.
 
-def _file_list(directory, extension, color=GRAY):
-    """List existing files in a directory."""
-    if not os.path.isdir(directory):
+    ``mtime_ns`` is the directory's mtime; it only keys the cache, so a listing is
+    reused until a file is added, removed or renamed.
+    """
+    with os.scandir(directory) as entries:
+        return tuple(sorted(e.name for e in entries
+                            if e.name.lower().endswith(extension) and e.is_file()))
+
+
+def _data_subdirs():
+    """``{name: DirEntry}`` for the folders under data/, from a single scandir."""
+    try:
+        with os.scandir(os.path.join(ds.BASE_DIR, "data")) as entries:
+            return {e.name: e for e in entries if e.is_dir()}
+    except OSError:
+        return {}
+
+
+def _file_list(subdirs, name, extension, color=GRAY):
+    """List existing files in the data/ subfolder ``name``."""
+    entry = subdirs.get(name)
+    if entry is None:
+        return html.P("No files yet.", style={"color": DARKGRAY, "fontSize": "12px"})
+    try:
+        mtime_ns = entry.stat().st_mtime_ns
+    except OSError:
         return html.P("No files yet.", style={"color": DARKGRAY, "fontSize": "12px"})
-    files = sorted([f for f in os.listdir(directory) if f.lower().endswith(extension)])
+    files = _list_files(entry.path, extension, mtime_ns)
     if not files:
         return html.P("No files yet.", style={"color": DARKGRAY, "fontSize": "12px"})
     return html.Div([
@@ -52,9 +93,7 @@ def _file_list(directory, extension, color=GRAY):
 
 def layout():
     """Build the Data Hub page."""
-    etsy_dir = os.path.join(ds.BASE_DIR, "data", "etsy_statements")
-    bank_dir = os.path.join(ds.BASE_DIR, "data", "bank_statements")
-    invoice_dir = os.path.join(ds.BASE_DIR, "data", "invoices")
+    subdirs = _data_subdirs()
 
     return html.Div([
         html.P("Upload your financial documents to keep the dashboard up to date.",
@@ -73,7 +112,7 @@ def layout():
                 ),
                 html.Div(id="upload-etsy-status"),
                 section("Uploaded Etsy Statements", [
-                    _file_list(etsy_dir, ".csv", GREEN),
+                    _file_list(subdirs, "etsy_statements", ".csv", GREEN),
                     html.P(f"{len(ds.DATA)} transactions loaded",
                            style={"color": DARKGRAY, "fontSize": "11px", "marginTop": "6px"}),
                 ], GREEN),
@@ -90,7 +129,7 @@ def layout():
                 ),
                 html.Div(id="upload-bank-status"),
                 section("Uploaded Bank Statements", [
-                    _file_list(bank_dir, ".pdf", BLUE),
+                    _file_list(subdirs, "bank_statements", ".pdf", BLUE),
                     html.P(f"{ds.bank_statement_count} statement(s), {len(ds.BANK_TXNS)} transactions",
                            style={"color": DARKGRAY, "fontSize": "11px", "marginTop": "6px"}),
                 ], BLUE),
@@ -107,7 +146,7 @@ def layout():
                 ),
                 html.Div(id="upload-receipt-status"),
                 section("Uploaded Receipts", [
-                    _file_list(invoice_dir, ".pdf", ORANGE),
+                    _file_list(subdirs, "invoices", ".pdf", ORANGE),
                     html.P(f"{len(ds.INVOICES)} orders loaded, {len(ds.INV_ITEMS)} items",
                            style={"color": DARKGRAY, "fontSize": "11px", "marginTop": "6px"}),
                 ], ORANGE),
@@ -7,17 +7,54 @@ import pandas as pd
 
 from etsy_dashboard.theme import *
 from etsy_dashboard.components.kpi import kpi_pill, kpi_card
-from etsy_dashboard.components.cards import section, row_item, make_chart, chart_context, severity_color
+from etsy_dashboard.components.cards import (
+    section, row_item, make_chart, chart_context, severity_color, frozen_figure,
+)
 from etsy_dashboard import data_state as ds
 
 
+# Line traces longer than this are thinned with LTTB before being sent to the browser
+_MAX_POINTS = 500
+
+
+def _lttb(x, y, n_out=_MAX_POINTS):
+    """Largest-Triangle-Three-Buckets downsample of a line trace.
+
+    Returns ``(x, y)`` unchanged when the series is already short enough; otherwise
+    ``n_out`` points that keep the first, last and the visually dominant point of
+    every bucket in between. NaNs are dropped first (plotly draws them as gaps anyway).
+    """
+    if len(y) <= n_out:
+        return x, y
+    x, y = pd.Index(x), pd.Series(y).to_numpy(dtype=np.float64)
+    keep = ~np.isnan(y)
+    x, y = x[keep], y[keep]
+    n = len(y)
+    if n <= n_out:
+        return x, y
+    xs = (x.asi8 if isinstance(x, pd.DatetimeIndex) else x.to_numpy()).astype(np.float64)
+    every = (n - 2) / (n_out - 2)
+    picked = np.empty(n_out, dtype=np.intp)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = int(i * every) + 1, int((i + 1) * every) + 1
+        nxt_end = min(int((i + 2) * every) + 1, n)
+        avg_x, avg_y = xs[end:nxt_end].mean(), y[end:nxt_end].mean()
+        area = np.abs((xs[a] - avg_x) * (y[start:end] - y[a]) - (xs[a] - xs[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        picked[i + 1] = a
+    return x[picked], y[picked]
+
+
+@ds.cached_per_version
 def _run_analytics():
-    """Run the analytics engine and return findings."""
+    """Run the analytics engine and return findings, once per data reload."""
     findings = []
 
     # Revenue trend
     if len(ds.months_sorted) >= 2:
-        vals = [ds.monthly_sales.get(m, 0) for m in ds.months_sorted]
+        vals = ds.monthly_sales_vec
         if vals[0] > 0:
             growth = ((vals[-1] - vals[0]) / vals[0]) * 100
             sev = "good" if growth > 0 else "bad"
@@ -30,7 +67,7 @@ def _run_analytics():
 
     # Average order value trend
     if len(ds.months_sorted) >= 2:
-        aov_vals = [ds.monthly_aov.get(m, 0) for m in ds.months_sorted]
+        aov_vals = ds.monthly_aov_vec
         first_aov = aov_vals[0] if aov_vals[0] > 0 else 1
         aov_change = ((aov_vals[-1] - first_aov) / first_aov) * 100
         sev = "good" if aov_change > 0 else "warning" if aov_change > -10 else "bad"
@@ -65,14 +102,16 @@ def _run_analytics():
 
     # Revenue projection (linear regression)
     if len(ds.months_sorted) >= 3:
-        from sklearn.linear_model import LinearRegression
-        x = np.arange(len(ds.months_sorted)).reshape(-1, 1)
-        y = np.array([ds.monthly_sales.get(m, 0) for m in ds.months_sorted])
-        model = LinearRegression().fit(x, y)
-        next_month_rev = model.predict([[len(ds.months_sorted)]])[0]
+        x = np.arange(len(ds.months_sorted), dtype=np.float64)
+        y = ds.monthly_sales_vec
+        slope, intercept = np.polyfit(x, y, 1)
+        next_month_rev = slope * len(x) + intercept
+        ss_res = ((y - (slope * x + intercept)) ** 2).sum()
+        ss_tot = ((y - y.mean()) ** 2).sum()
+        r2 = 1 - ss_res / ss_tot if ss_tot else 1.0
         findings.append({
             "title": f"Projected next month revenue: ${next_month_rev:,.0f}",
-            "detail": f"Linear trend based on {len(ds.months_sorted)} months (R²={model.score(x, y):.2f})",
+            "detail": f"Linear trend based on {len(ds.months_sorted)} months (R²={r2:.2f})",
             "severity": "info",
             "category": "Projections",
         })
@@ -110,29 +149,24 @@ def _run_analytics():
             "category": "Marketing",
         })
 
-    return findings
-
+    return tuple(findings)
 
-def layout():
-    """Build the Deep Dive analytics page."""
-    findings = _run_analytics()
-
-    # KPI strip
-    days = ds.days_active
-    daily_rev = ds.gross_sales / days if days else 0
-    daily_profit = ds.full_profit / days if days else 0
-    daily_orders = ds.order_count / days if days else 0
 
+@ds.cached_per_version
+def _build_charts():
+    """Build the page's charts as serialized figures."""
     # Cumulative chart
     cum_fig = go.Figure()
     if len(ds.daily_df) > 0:
+        x, y = _lttb(ds.daily_df.index, ds.daily_df["cum_revenue"])
         cum_fig.add_trace(go.Scatter(
-            x=ds.daily_df.index, y=ds.daily_df["cum_revenue"],
+            x=x, y=y,
             name="Cumulative Revenue", line=dict(color=GREEN, width=2),
             fill="tozeroy", fillcolor="rgba(46,204,113,0.08)",
         ))
+        x, y = _lttb(ds.daily_df.index, ds.daily_df["cum_profit"])
         cum_fig.add_trace(go.Scatter(
-            x=ds.daily_df.index, y=ds.daily_df["cum_profit"],
+            x=x, y=y,
             name="Cumulative Profit", line=dict(color=CYAN, width=2),
             fill="tozeroy", fillcolor="rgba(0,212,255,0.08)",
         ))
@@ -142,13 +176,15 @@ def layout():
     # Weekly AOV chart
     aov_fig = go.Figure()
     if len(ds.weekly_aov) > 0:
+        x, y = _lttb(ds.weekly_aov.index, ds.weekly_aov["aov"])
         aov_fig.add_trace(go.Scatter(
-            x=ds.weekly_aov.index, y=ds.weekly_aov["aov"],
+            x=x, y=y,
             name="Weekly AOV", line=dict(color=ORANGE, width=2),
             mode="lines+markers",
         ))
+        x, y = _lttb(ds.weekly_aov.index, ds.weekly_aov["count"])
         aov_fig.add_trace(go.Scatter(
-            x=ds.weekly_aov.index, y=ds.weekly_aov["count"],
+            x=x, y=y,
             name="Orders", line=dict(color=CYAN, width=1, dash="dot"),
             yaxis="y2",
         ))
@@ -162,34 +198,52 @@ def layout():
     # Daily profit chart
     daily_fig = go.Figure()
     if len(ds.daily_df) > 0:
-        colors = [GREEN if v >= 0 else RED for v in ds.daily_df["profit"]]
+        colors = np.where(ds.daily_df["profit"].to_numpy() >= 0, GREEN, RED).tolist()
         daily_fig.add_trace(go.Bar(
             x=ds.daily_df.index, y=ds.daily_df["profit"],
             name="Daily Profit", marker_color=colors,
         ))
         # 7-day moving average
-        if len(ds.daily_df) >= 7:
-            ma7 = ds.daily_df["profit"].rolling(7).mean()
-            daily_fig.add_trace(go.Scatter(
-                x=ds.daily_df.index, y=ma7,
-                name="7-day MA", line=dict(color=CYAN, width=2),
-            ))
+        x, y = _lttb(ds.daily_df.index, ds.daily_df["profit_ma7"])
+        daily_fig.add_trace(go.Scatter(
+            x=x, y=y,
+            name="7-day MA", line=dict(color=CYAN, width=2),
+        ))
     make_chart(daily_fig, 300)
     daily_fig.update_layout(title="Daily Profit", xaxis_title="Date")
 
     # Product revenue chart
     prod_fig = go.Figure()
     if len(ds.product_revenue_est) > 0:
-        top_prods = ds.product_revenue_est.head(10)
         prod_fig.add_trace(go.Bar(
-            x=top_prods.values,
-            y=[n[:35] for n in top_prods.index],
+            x=ds.top_products_top10["values"],
+            y=ds.top_products_top10["labels"],
             orientation="h",
             marker_color=CYAN,
         ))
     make_chart(prod_fig, 350, legend_h=False)
     prod_fig.update_layout(title="Top Products by Est. Revenue", yaxis=dict(autorange="reversed"))
 
+    return {
+        "cum": frozen_figure(cum_fig),
+        "aov": frozen_figure(aov_fig),
+        "daily": frozen_figure(daily_fig),
+        "prod": frozen_figure(prod_fig),
+    }
+
+
+def layout():
+    """Build the Deep Dive analytics page."""
+    findings = _run_analytics()
+
+    # KPI strip
+    days = ds.days_active
+    daily_rev = ds.gross_sales / days if days else 0
+    daily_profit = ds.full_profit / days if days else 0
+    daily_orders = ds.order_count / days if days else 0
+
+    figs = _build_charts()
+
     # Build findings cards
     finding_cards = []
     for f in findings:
@@ -221,12 +275,12 @@ def layout():
 
         # Charts row
         dbc.Row([
-            dbc.Col(dbc.Card(dbc.CardBody(dcc.Graph(figure=cum_fig, config={"displayModeBar": False}))), md=6),
-            dbc.Col(dbc.Card(dbc.CardBody(dcc.Graph(figure=aov_fig, config={"displayModeBar": False}))), md=6),
+            dbc.Col(dbc.Card(dbc.CardBody(dcc.Graph(figure=figs["cum"], config={"displayModeBar": False}))), md=6),
+            dbc.Col(dbc.Card(dbc.CardBody(dcc.Graph(figure=figs["aov"], config={"displayModeBar": False}))), md=6),
         ], className="g-3 mb-3"),
 
         dbc.Row([
-            dbc.Col(dbc.Card(dbc.CardBody(dcc.Graph(figure=daily_fig, config={"displayModeBar": False}))), md=6),
-            dbc.Col(dbc.Card(dbc.CardBody(dcc.Graph(figure=prod_fig, config={"displayModeBar": False}))), md=6),
+            dbc.Col(dbc.Card(dbc.CardBody(dcc.Graph(figure=figs["daily"], config={"displayModeBar": False}))), md=6),
+            dbc.Col(dbc.Card(dbc.CardBody(dcc.Graph(figure=figs["prod"], config={"displayModeBar": False}))), md=6),
         ], className="g-3"),
     ])
@@ -1,33 +1,20 @@
 """Financials page — Full P&L, Cash Flow, Shipping, Monthly, Fees, Ledger."""
-from dash import html, dcc
+from dash import html, dcc, dash_table
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
+import numpy as np
+import pandas as pd
 
 from etsy_dashboard.theme import *
 from etsy_dashboard.components.kpi import kpi_card, kpi_pill
-from etsy_dashboard.components.cards import section, row_item, make_chart
+from etsy_dashboard.components.cards import form_row, section, row_item, make_chart, frozen_figure
 from etsy_dashboard import data_state as ds
 
 
 def _pl_row(label, amount, indent=0, bold=False, color=WHITE, border=False):
     """P&L line item."""
-    neg = amount < 0
-    display_color = RED if neg else color
-    style = {
-        "display": "flex", "justifyContent": "space-between",
-        "padding": "5px 0", "marginLeft": f"{indent * 20}px",
-    }
-    if bold:
-        style["fontWeight"] = "bold"
-    if border:
-        style["borderTop"] = f"1px solid {DARKGRAY}44"
-        style["marginTop"] = "4px"
-        style["paddingTop"] = "8px"
-    return html.Div([
-        html.Span(label, style={"color": display_color if bold else GRAY, "fontSize": "13px", "flex": "1"}),
-        html.Span(ds.money(amount), style={"color": display_color, "fontFamily": "monospace",
-                                             "fontWeight": "bold" if bold else "normal", "fontSize": "13px"}),
-    ], style=style)
+    return form_row(label, ds.money(amount), color=RED if amount < 0 else color,
+                    bold=bold, indent=indent, border=border)
 
 
 def _detail_card(title, color, children, total=None):
@@ -54,6 +41,68 @@ def _txn_row(txn, color):
     ], style={"padding": "2px 0", "borderBottom": "1px solid #ffffff08"})
 
 
+_LEDGER_COLUMNS = [
+    {"name": "Date", "id": "date"},
+    {"name": "Description", "id": "desc"},
+    {"name": "Category", "id": "category"},
+    {"name": "Deposit", "id": "deposit"},
+    {"name": "Debit", "id": "debit"},
+    {"name": "Balance", "id": "balance"},
+]
+_LEDGER_MONEY = {"textAlign": "right", "fontWeight": "bold", "fontFamily": "monospace"}
+_LEDGER_CELL_CONDITIONAL = [
+    {"if": {"column_id": "date"}, "color": GRAY},
+    {"if": {"column_id": "category"}, "color": GRAY, "fontSize": "11px"},
+    {"if": {"column_id": "deposit"}, "color": GREEN, **_LEDGER_MONEY},
+    {"if": {"column_id": "debit"}, "color": RED, **_LEDGER_MONEY},
+    {"if": {"column_id": "balance"}, "color": GREEN, **_LEDGER_MONEY},
+]
+# Later entries win: deposit tint, negative balance, then the TOTAL footer row
+_LEDGER_DATA_CONDITIONAL = [
+    {"if": {"filter_query": '{type} = "deposit"'}, "backgroundColor": f"{GREEN}08"},
+    {"if": {"filter_query": "{bal} < 0", "column_id": "balance"}, "color": RED},
+    {"if": {"filter_query": '{type} = "total"'}, "color": CYAN, "fontWeight": "bold",
+     "padding": "8px", "borderTop": f"3px solid {CYAN}", "backgroundColor": "transparent"},
+    {"if": {"filter_query": '{type} = "total"', "column_id": "deposit"}, "color": GREEN},
+    {"if": {"filter_query": '{type} = "total"', "column_id": "debit"}, "color": RED},
+]
+
+
+def _ledger_table():
+    """Full bank ledger with running balance, as one scrolling DataTable."""
+    ledger = ds.bank_running_df
+    amounts = ledger["amount"].map("{:,.2f}".format)
+    is_deposit = ledger["type"] == "deposit"
+    records = pd.DataFrame({
+        "date": ledger["date"],
+        "desc": ledger["desc"].str[:45],
+        "category": ledger["category"],
+        "type": ledger["type"],
+        "deposit": ("+$" + amounts).where(is_deposit, ""),
+        "debit": ("-$" + amounts).where(~is_deposit, ""),
+        "balance": "$" + ledger["_balance"].map("{:,.2f}".format),
+        "bal": ledger["_balance"],
+    }).to_dict("records")
+    records.append({"date": "TOTAL", "desc": "", "category": "", "type": "total",
+                    "deposit": f"${ds.bank_total_deposits:,.2f}",
+                    "debit": f"${ds.bank_total_debits:,.2f}",
+                    "balance": f"${ds.bank_net_cash:,.2f}", "bal": None})
+    return dash_table.DataTable(
+        data=records,
+        columns=_LEDGER_COLUMNS,
+        page_action="none",
+        style_table={"maxHeight": "700px", "overflowY": "auto"},
+        style_header={"backgroundColor": "transparent", "color": WHITE, "fontWeight": "bold",
+                      "border": "none", "borderBottom": f"2px solid {CYAN}", "padding": "6px 8px"},
+        style_cell={"backgroundColor": "transparent", "color": WHITE, "border": "none",
+                    "borderBottom": "1px solid #ffffff10", "padding": "4px 8px",
+                    "fontSize": "12px", "textAlign": "left", "fontFamily": "inherit"},
+        style_data={"backgroundColor": "#ffffff04"},
+        style_cell_conditional=_LEDGER_CELL_CONDITIONAL,
+        style_data_conditional=_LEDGER_DATA_CONDITIONAL,
+    )
+
+
 # ── Shared style for all collapsible section headers ─────────────────────────
 _DETAILS_STYLE = {
     "color": CYAN, "fontSize": "14px", "fontWeight": "bold",
@@ -72,8 +121,25 @@ def _section_header(title, subtitle):
     ], style=_DETAILS_STYLE)
 
 
+# Fixed chart labels/colors; only the values change with the data
+_WF_BANK_STEPS = (
+    ("Inventory", "Amazon Inventory"), ("AliExpress", "AliExpress Supplies"),
+    ("Craft", "Craft Supplies"), ("Subscriptions", "Subscriptions"),
+    ("Ship Supplies", "Shipping"), ("Best Buy CC", "Business Credit Card"),
+)
+_FEE_PIE_LABELS = ("Listing", "Txn (Product)", "Txn (Shipping)", "Processing", "Credits")
+_FEE_PIE_COLORS = (RED, ORANGE, PURPLE, PINK, GREEN)
+_SHIP_PIE_LABELS = ("USPS Out", "USPS Return", "Asendia", "Adjust", "Insurance", "Credits")
+_SHIP_PIE_COLORS = (BLUE, RED, PURPLE, ORANGE, TEAL, GREEN)
+
+
+@ds.cached_per_version
 def _build_charts():
-    """Build all charts used on the page. Returns dict of figures."""
+    """Build all charts used on the page. Returns dict of figures.
+
+    Figures are stored pre-serialized (``frozen_figure``) so repeat renders skip
+    the build, plotly's figure validation and the numpy-to-JSON conversion.
+    """
     figs = {}
 
     # 1. Expense donut — where every dollar goes
@@ -103,9 +169,7 @@ def _build_charts():
     if ds.total_buyer_fees > 0:
         wl.append("Buyer Fee"); wv.append(-ds.total_buyer_fees); wm.append("relative")
     wl.append("AFTER ETSY"); wv.append(0); wm.append("total")
-    for lbl, cat in [("Inventory", "Amazon Inventory"), ("AliExpress", "AliExpress Supplies"),
-                     ("Craft", "Craft Supplies"), ("Subscriptions", "Subscriptions"),
-                     ("Ship Supplies", "Shipping"), ("Best Buy CC", "Business Credit Card")]:
+    for lbl, cat in _WF_BANK_STEPS:
         v = ds.bank_by_cat.get(cat, 0)
         if v > 0: wl.append(lbl); wv.append(-v); wm.append("relative")
     if ds.bank_owner_draw_total > 0:
@@ -124,17 +188,17 @@ def _build_charts():
 
     # 3. Fee pie
     fig = go.Figure(go.Pie(
-        labels=["Listing", "Txn (Product)", "Txn (Shipping)", "Processing", "Credits"],
+        labels=_FEE_PIE_LABELS,
         values=[ds.listing_fees, ds.transaction_fees_product, ds.transaction_fees_shipping, ds.processing_fees, abs(ds.total_credits)],
-        marker=dict(colors=[RED, ORANGE, PURPLE, PINK, GREEN]), hole=0.4, textinfo="label+percent"))
+        marker=dict(colors=_FEE_PIE_COLORS), hole=0.4, textinfo="label+percent"))
     make_chart(fig, 340); fig.update_layout(title=f"Fee Breakdown (${ds.total_fees:,.0f})")
     figs["fee_pie"] = fig
 
     # 4. Shipping pie
     fig = go.Figure(go.Pie(
-        labels=["USPS Out", "USPS Return", "Asendia", "Adjust", "Insurance", "Credits"],
+        labels=_SHIP_PIE_LABELS,
         values=[ds.usps_outbound, ds.usps_return, ds.asendia_labels, ds.ship_adjustments, ds.ship_insurance, abs(ds.ship_credits)],
-        marker=dict(colors=[BLUE, RED, PURPLE, ORANGE, TEAL, GREEN]), hole=0.4, textinfo="label+percent"))
+        marker=dict(colors=_SHIP_PIE_COLORS), hole=0.4, textinfo="label+percent"))
     make_chart(fig, 340); fig.update_layout(title=f"Shipping Breakdown (${ds.total_shipping_cost:,.0f})")
     figs["ship_pie"] = fig
 
@@ -153,8 +217,10 @@ def _build_charts():
     if ds.bank_by_cat:
         cats = [c for c in ds.bank_by_cat if ds.bank_by_cat[c] > 0][:12]
         vals = [ds.bank_by_cat[c] for c in cats]
+        cat_arr = np.array(cats, dtype=str)
         fig.add_trace(go.Bar(x=vals, y=cats, orientation="h",
-            marker_color=[ORANGE if "Draw" in c else RED if c != "Amazon Inventory" else BLUE for c in cats],
+            marker_color=np.select([np.char.find(cat_arr, "Draw") >= 0, cat_arr != "Amazon Inventory"],
+                                   [ORANGE, RED], BLUE).tolist(),
             text=[f"${v:,.0f}" for v in vals], textposition="outside"))
     make_chart(fig, 380, legend_h=False)
     fig.update_layout(title="Bank Spending by Category", yaxis=dict(autorange="reversed"))
@@ -179,7 +245,7 @@ def _build_charts():
     fig.update_layout(title="Top Products by Est. Revenue", yaxis=dict(autorange="reversed"))
     figs["products"] = fig
 
-    return figs
+    return {name: frozen_figure(f) for name, f in figs.items()}
 
 
 def layout():
@@ -192,28 +258,28 @@ def layout():
     return html.Div([
         # ── KPI Pills ────────────────────────────────────────────────────
         html.Div([
-            kpi_pill("\U0001f4b3", "DEBT", ds.money(ds.bb_cc_balance), RED,
+            kpi_pill("\U0001f4b3", "DEBT", ds.fmt["bb_cc_balance"], RED,
                      f"Best Buy CC (${ds.bb_cc_available:,.0f} avail)",
-                     f"Charged: {ds.money(ds.bb_cc_total_charged)}. Paid: {ds.money(ds.bb_cc_total_paid)}. Limit: {ds.money(ds.bb_cc_limit)}."),
-            kpi_pill("\U0001f4e5", "AFTER ETSY FEES", ds.money(ds.net_profit), ORANGE,
+                     f"Charged: {ds.fmt['bb_cc_total_charged']}. Paid: {ds.fmt['bb_cc_total_paid']}. Limit: {ds.fmt['bb_cc_limit']}."),
+            kpi_pill("\U0001f4e5", "AFTER ETSY FEES", ds.fmt["net_profit"], ORANGE,
                      "What Etsy deposits to your bank",
-                     f"Gross ({ds.money(ds.gross_sales)}) minus fees, shipping, ads, refunds, taxes."),
+                     f"Gross ({ds.fmt['gross_sales']}) minus fees, shipping, ads, refunds, taxes."),
             kpi_pill("\U0001f4c9", "TOTAL FEES", ds.money(net_fees_after_credits), RED,
                      f"{net_fees_after_credits / ds.gross_sales * 100:.1f}% of sales" if ds.gross_sales else "",
-                     f"Listing: {ds.money(ds.listing_fees)}. Processing: {ds.money(ds.processing_fees)}. Credits: {ds.money(abs(ds.total_credits))}."),
-            kpi_pill("\u21a9\ufe0f", "REFUNDS", ds.money(ds.total_refunds), PINK,
+                     f"Listing: {ds.fmt['listing_fees']}. Processing: {ds.fmt['processing_fees']}. Credits: {ds.money(abs(ds.total_credits))}."),
+            kpi_pill("\u21a9\ufe0f", "REFUNDS", ds.fmt["total_refunds"], PINK,
                      f"{len(ds.refund_df)} orders ({len(ds.refund_df) / max(ds.order_count, 1) * 100:.1f}%)",
-                     f"{len(ds.refund_df)} refunded of {ds.order_count}. Return labels: {ds.money(ds.usps_return)}."),
-            kpi_pill("\U0001f4b0", "PROFIT", ds.money(ds.full_profit), GREEN,
+                     f"{len(ds.refund_df)} refunded of {ds.order_count}. Return labels: {ds.fmt['usps_return']}."),
+            kpi_pill("\U0001f4b0", "PROFIT", ds.fmt["full_profit"], GREEN,
                      f"{ds.full_profit_margin:.1f}% margin",
-                     f"Cash ({ds.money(ds.bank_cash_on_hand)}) + draws ({ds.money(ds.bank_owner_draw_total)})."),
+                     f"Cash ({ds.fmt['bank_cash_on_hand']}) + draws ({ds.fmt['bank_owner_draw_total']})."),
         ], style={"display": "flex", "gap": "8px", "marginBottom": "14px", "flexWrap": "wrap"}),
 
         # ── Business Snapshot ────────────────────────────────────────────
         html.Div([
-            html.Div(f"You've earned {ds.money(ds.gross_sales)} in gross sales across {ds.order_count} orders. "
-                     f"After all Etsy fees, shipping, and expenses, your profit is {ds.money(ds.full_profit)} ({ds.full_profit_margin:.1f}% margin). "
-                     f"You have {ds.money(ds.bank_cash_on_hand)} cash on hand.",
+            html.Div(f"You've earned {ds.fmt['gross_sales']} in gross sales across {ds.order_count} orders. "
+                     f"After all Etsy fees, shipping, and expenses, your profit is {ds.fmt['full_profit']} ({ds.full_profit_margin:.1f}% margin). "
+                     f"You have {ds.fmt['bank_cash_on_hand']} cash on hand.",
                      style={"color": WHITE, "fontSize": "14px", "lineHeight": "1.6"}),
         ], style={"backgroundColor": CARD, "borderRadius": "8px", "marginBottom": "14px",
                    "borderLeft": f"4px solid {CYAN}", "padding": "16px 20px",
@@ -267,9 +333,9 @@ def layout():
                             html.Div(style={"borderTop": f"3px solid {GREEN}", "marginTop": "10px"}),
                             html.Div([
                                 html.Span("PROFIT", style={"color": GREEN, "fontWeight": "bold", "fontSize": "22px"}),
-                                html.Span(ds.money(ds.full_profit), style={"color": GREEN, "fontWeight": "bold", "fontSize": "22px", "fontFamily": "monospace"}),
+                                html.Span(ds.fmt["full_profit"], style={"color": GREEN, "fontWeight": "bold", "fontSize": "22px", "fontFamily": "monospace"}),
                             ], style={"display": "flex", "justifyContent": "space-between", "padding": "12px 0"}),
-                            html.Div(f"= Cash {ds.money(ds.bank_cash_on_hand)} + Draws {ds.money(ds.bank_owner_draw_total)}",
+                            html.Div(f"= Cash {ds.fmt['bank_cash_on_hand']} + Draws {ds.fmt['bank_owner_draw_total']}",
                                      style={"color": GRAY, "fontSize": "12px", "textAlign": "center"}),
                         ], CYAN),
                     ], md=6),
@@ -313,19 +379,19 @@ def layout():
                 # Cash KPI row
                 html.Div([
                     html.Div([
-                        html.Div(ds.money(ds.full_profit), style={"color": GREEN, "fontSize": "22px", "fontWeight": "bold", "fontFamily": "monospace"}),
+                        html.Div(ds.fmt["full_profit"], style={"color": GREEN, "fontSize": "22px", "fontWeight": "bold", "fontFamily": "monospace"}),
                         html.Div("PROFIT", style={"color": GRAY, "fontSize": "10px"}),
                     ], style={"textAlign": "center", "flex": "1"}),
                     html.Div([
-                        html.Div(ds.money(ds.bank_cash_on_hand), style={"color": CYAN, "fontSize": "18px", "fontWeight": "bold", "fontFamily": "monospace"}),
-                        html.Div(f"Cash (Bank {ds.money(ds.bank_net_cash)} + Etsy {ds.money(ds.etsy_balance)})", style={"color": GRAY, "fontSize": "10px"}),
+                        html.Div(ds.fmt["bank_cash_on_hand"], style={"color": CYAN, "fontSize": "18px", "fontWeight": "bold", "fontFamily": "monospace"}),
+                        html.Div(f"Cash (Bank {ds.fmt['bank_net_cash']} + Etsy {ds.fmt['etsy_balance']})", style={"color": GRAY, "fontSize": "10px"}),
                     ], style={"textAlign": "center", "flex": "1"}),
                     html.Div([
-                        html.Div(ds.money(ds.bank_owner_draw_total), style={"color": ORANGE, "fontSize": "18px", "fontWeight": "bold", "fontFamily": "monospace"}),
+                        html.Div(ds.fmt["bank_owner_draw_total"], style={"color": ORANGE, "fontSize": "18px", "fontWeight": "bold", "fontFamily": "monospace"}),
                         html.Div("Owner Draws", style={"color": GRAY, "fontSize": "10px"}),
                     ], style={"textAlign": "center", "flex": "1"}),
                     html.Div([
-                        html.Div(ds.money(ds.bank_all_expenses), style={"color": RED, "fontSize": "18px", "fontWeight": "bold", "fontFamily": "monospace"}),
+                        html.Div(ds.fmt["bank_all_expenses"], style={"color": RED, "fontSize": "18px", "fontWeight": "bold", "fontFamily": "monospace"}),
                         html.Div("Expenses", style={"color": GRAY, "fontSize": "10px"}),
                     ], style={"textAlign": "center", "flex": "1"}),
                 ], style={"display": "flex", "gap": "6px", "marginBottom": "12px",
@@ -356,12 +422,12 @@ def layout():
 
                 # Draw settlement banner
                 html.Div([
-                    html.Span(f"TJ: {ds.money(ds.tulsa_draw_total)}", style={"color": "#ffb74d", "fontWeight": "bold", "fontSize": "14px"}),
+                    html.Span(f"TJ: {ds.fmt['tulsa_draw_total']}", style={"color": "#ffb74d", "fontWeight": "bold", "fontSize": "14px"}),
                     html.Span("  |  ", style={"color": DARKGRAY}),
-                    html.Span(f"Braden: {ds.money(ds.texas_draw_total)}", style={"color": "#ff9800", "fontWeight": "bold", "fontSize": "14px"}),
+                    html.Span(f"Braden: {ds.fmt['texas_draw_total']}", style={"color": "#ff9800", "fontWeight": "bold", "fontSize": "14px"}),
                     html.Span("  |  ", style={"color": DARKGRAY}),
                     html.Span(
-                        f"Company owes {ds.draw_owed_to} {ds.money(ds.draw_diff)}" if ds.draw_diff >= 0.01 else "Even!",
+                        f"Company owes {ds.draw_owed_to} {ds.fmt['draw_diff']}" if ds.draw_diff >= 0.01 else "Even!",
                         style={"color": CYAN, "fontWeight": "bold", "fontSize": "14px"}),
                 ], style={"padding": "10px", "marginBottom": "10px", "backgroundColor": "#ffffff06",
                            "borderRadius": "8px", "border": f"1px solid {CYAN}33", "textAlign": "center"}),
@@ -375,11 +441,11 @@ def layout():
                     _detail_card("CASH ON HAND", GREEN, [
                         html.Div([
                             html.Span("Capital One", style={"color": WHITE, "fontSize": "12px", "width": "120px", "display": "inline-block"}),
-                            html.Span(ds.money(ds.bank_net_cash), style={"color": GREEN, "fontFamily": "monospace", "fontWeight": "bold"}),
+                            html.Span(ds.fmt["bank_net_cash"], style={"color": GREEN, "fontFamily": "monospace", "fontWeight": "bold"}),
                         ], style={"padding": "4px 0"}),
                         html.Div([
                             html.Span("Etsy Account", style={"color": WHITE, "fontSize": "12px", "width": "120px", "display": "inline-block"}),
-                            html.Span(ds.money(ds.etsy_balance), style={"color": TEAL, "fontFamily": "monospace", "fontWeight": "bold"}),
+                            html.Span(ds.fmt["etsy_balance"], style={"color": TEAL, "fontFamily": "monospace", "fontWeight": "bold"}),
                         ], style={"padding": "4px 0"}),
                     ], ds.bank_cash_on_hand),
                     _detail_card("BEST BUY CC", BLUE, [
@@ -407,11 +473,11 @@ def layout():
             _section_header("SHIPPING", "are you making or losing money on shipping?"),
             html.Div([
                 html.Div([
-                    kpi_card("NET SHIPPING P&L", ds.money(ds.shipping_profit),
+                    kpi_card("NET SHIPPING P&L", ds.fmt["shipping_profit"],
                         GREEN if ds.shipping_profit >= 0 else RED,
                         f"{'Profitable' if ds.shipping_profit >= 0 else 'Losing'} ({ds.shipping_margin:.1f}%)"),
                     kpi_card("LABEL COST", ds.money(-ds.total_shipping_cost), RED, f"{total_label_count} labels"),
-                    kpi_card("BUYER PAID", ds.money(ds.buyer_paid_shipping), GREEN, f"{ds.paid_ship_count} orders"),
+                    kpi_card("BUYER PAID", ds.fmt["buyer_paid_shipping"], GREEN, f"{ds.paid_ship_count} orders"),
                     kpi_card("FREE ORDERS", str(ds.free_ship_count), ORANGE, f"~{ds.money(-ds.est_label_cost_free_orders)} cost"),
                     kpi_card("RETURNS", str(ds.usps_return_count), PINK, f"{ds.money(-ds.usps_return)} labels"),
                     kpi_card("AVG LABEL", f"${ds.avg_outbound_label:.2f}", BLUE, f"{ds.usps_outbound_count} USPS"),
@@ -433,7 +499,7 @@ def layout():
                     html.Div(style={"borderTop": f"3px solid {ORANGE}", "marginTop": "8px"}),
                     html.Div([
                         html.Span("NET SHIPPING P&L", style={"color": GREEN if ds.shipping_profit >= 0 else RED, "fontWeight": "bold", "fontSize": "20px"}),
-                        html.Span(ds.money(ds.shipping_profit), style={"color": GREEN if ds.shipping_profit >= 0 else RED, "fontWeight": "bold", "fontSize": "20px", "fontFamily": "monospace"}),
+                        html.Span(ds.fmt["shipping_profit"], style={"color": GREEN if ds.shipping_profit >= 0 else RED, "fontWeight": "bold", "fontSize": "20px", "fontFamily": "monospace"}),
                     ], style={"display": "flex", "justifyContent": "space-between", "padding": "10px 0"}),
                 ], ORANGE),
                 section("PAID vs FREE BREAKDOWN", [
@@ -543,7 +609,7 @@ def layout():
                             html.Div([
                                 html.Div([
                                     html.Span("Total Refunded", style={"color": GRAY, "fontSize": "11px"}),
-                                    html.Div(ds.money(ds.total_refunds), style={"color": RED, "fontSize": "20px", "fontWeight": "bold", "fontFamily": "monospace"}),
+                                    html.Div(ds.fmt["total_refunds"], style={"color": RED, "fontSize": "20px", "fontWeight": "bold", "fontFamily": "monospace"}),
                                 ], style={"textAlign": "center", "flex": "1"}),
                                 html.Div([
                                     html.Span("Count", style={"color": GRAY, "fontSize": "11px"}),
@@ -572,46 +638,7 @@ def layout():
             html.Div([
                 dbc.Card(dbc.CardBody(dcc.Graph(figure=figs["bank_monthly"], config={"displayModeBar": False})), className="mb-3"),
                 section(f"FULL LEDGER ({len(ds.BANK_TXNS)} Transactions)", [
-                    html.Div([
-                        html.Table([
-                            html.Thead(html.Tr([
-                                html.Th("Date", style={"textAlign": "left", "padding": "6px 8px"}),
-                                html.Th("Description", style={"textAlign": "left", "padding": "6px 8px"}),
-                                html.Th("Category", style={"textAlign": "left", "padding": "6px 8px"}),
-                                html.Th("Deposit", style={"textAlign": "right", "padding": "6px 8px"}),
-                                html.Th("Debit", style={"textAlign": "right", "padding": "6px 8px"}),
-                                html.Th("Balance", style={"textAlign": "right", "padding": "6px 8px"}),
-                            ], style={"borderBottom": f"2px solid {CYAN}"})),
-                            html.Tbody([
-                                html.Tr([
-                                    html.Td(t["date"], style={"color": GRAY, "padding": "4px 8px", "fontSize": "12px"}),
-                                    html.Td(t["desc"][:45], style={"color": WHITE, "padding": "4px 8px", "fontSize": "12px"}),
-                                    html.Td(t["category"], style={"color": GRAY, "padding": "4px 8px", "fontSize": "11px"}),
-                                    html.Td(
-                                        f"+${t['amount']:,.2f}" if t["type"] == "deposit" else "",
-                                        style={"textAlign": "right", "color": GREEN, "fontWeight": "bold",
-                                               "padding": "4px 8px", "fontSize": "12px", "fontFamily": "monospace"}),
-                                    html.Td(
-                                        f"-${t['amount']:,.2f}" if t["type"] != "deposit" else "",
-                                        style={"textAlign": "right", "color": RED, "fontWeight": "bold",
-                                               "padding": "4px 8px", "fontSize": "12px", "fontFamily": "monospace"}),
-                                    html.Td(
-                                        f"${t['_balance']:,.2f}",
-                                        style={"textAlign": "right",
-                                               "color": GREEN if t["_balance"] >= 0 else RED,
-                                               "fontWeight": "bold",
-                                               "padding": "4px 8px", "fontSize": "12px", "fontFamily": "monospace"}),
-                                ], style={"borderBottom": "1px solid #ffffff10",
-                                           "backgroundColor": f"{GREEN}08" if t["type"] == "deposit" else "#ffffff04"})
-                                for t in ds.bank_running
-                            ] + [html.Tr([
-                                html.Td("TOTAL", colSpan="3", style={"color": CYAN, "fontWeight": "bold", "padding": "8px"}),
-                                html.Td(f"${ds.bank_total_deposits:,.2f}", style={"textAlign": "right", "color": GREEN, "fontWeight": "bold", "padding": "8px", "fontFamily": "monospace"}),
-                                html.Td(f"${ds.bank_total_debits:,.2f}", style={"textAlign": "right", "color": RED, "fontWeight": "bold", "padding": "8px", "fontFamily": "monospace"}),
-                                html.Td(f"${ds.bank_net_cash:,.2f}", style={"textAlign": "right", "color": CYAN, "fontWeight": "bold", "padding": "8px", "fontFamily": "monospace"}),
-                            ], style={"borderTop": f"3px solid {CYAN}"})]),
-                        ], style={"width": "100%", "borderCollapse": "collapse", "color": WHITE}),
-                    ], style={"maxHeight": "700px", "overflowY": "auto"}),
+                    _ledger_table(),
                 ], CYAN),
             ], style={"paddingTop": "10px"}),
         ], style={"marginBottom": "8px"}),
@@ -1,15 +1,18 @@
 """Inventory page — mirrors the Railway monolith's build_tab4_inventory() exactly.
 Header + KPI pills + snapshot banner + Quick Add toggle + inventory editor +
 receipt upload + warehouses + spending analytics + all orders + all items + receipt gallery."""
+from html import escape
+
 from dash import html, dcc, dash_table
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
+import numpy as np
 
 from etsy_dashboard.theme import *
 from etsy_dashboard.components.kpi import kpi_pill
-from etsy_dashboard.components.cards import section, row_item, make_chart
+from etsy_dashboard.components.cards import section, row_item, make_chart, frozen_figure
 from etsy_dashboard.components.tables import stock_level_bar
-from etsy_dashboard.components.thumbnail import item_thumbnail
+from etsy_dashboard.components.thumbnail import item_thumbnail, item_thumbnail_html
 from etsy_dashboard import data_state as ds
 
 
@@ -53,7 +56,7 @@ def _build_kpi_row():
     return html.Div([
         kpi_pill("#", "IN STOCK", str(k["in_stock"]), GREEN,
                  f"{k['unique']} unique"),
-        kpi_pill("$", "VALUE", f"${k['value']:,.2f}", TEAL,
+        kpi_pill("$", "VALUE", k["value_str"], TEAL,
                  "total spend"),
         kpi_pill("!", "LOW STOCK", str(k["low"]), ORANGE,
                  "need reorder"),
@@ -78,7 +81,7 @@ def _build_snapshot_banner():
     dot = "." if not low_msg and not oos_msg else ""
 
     text = (
-        f"You have {skpi['in_stock']} items in stock worth ${skpi['value']:,.2f} "
+        f"You have {skpi['in_stock']} items in stock worth {skpi['value_str']} "
         f"across {skpi['unique']} unique products{dot}."
         f"{low_msg}{oos_msg}{'.' if low_msg or oos_msg else ''} "
         f"Total supply spend: {ds.money(ds.true_inventory_cost)} across {ds.inv_order_count} orders."
@@ -186,8 +189,13 @@ def _build_quick_add_form():
 #  INVENTORY EDITOR  (mirrors monolith _build_inventory_editor — simplified)
 # ══════════════════════════════════════════════════════════════════════════════
 
+@ds.cached_per_version
 def _build_inventory_editor():
-    """Per-order item editor for naming, categorizing, and locating inventory items."""
+    """Per-order item editor for naming, categorizing, and locating inventory items.
+
+    The inventory callbacks bump the data version after every save, so the cached
+    editor is rebuilt.
+    """
     if len(ds.INV_ITEMS) == 0:
         return html.Div(id="editor-items-container")
 
@@ -200,29 +208,33 @@ def _build_inventory_editor():
     saved_count = 0
     total_items = 0
 
-    sorted_orders = sorted(ds.INVOICES, key=lambda o: o.get("date", ""), reverse=True)
+    # Cleaned names, auto categories and locations come precomputed for all items
+    flat = ds.INVOICE_ITEMS_DF
+    clean_names = flat["name"].tolist()
+    auto_cats = flat["auto_category"].tolist()
+    starts = np.searchsorted(flat["inv_idx"].to_numpy(), np.arange(len(ds.INVOICES))).tolist()
 
-    for inv in sorted_orders:
+    sorted_idx = sorted(range(len(ds.INVOICES)), key=lambda i: ds.INVOICES[i].get("date", ""), reverse=True)
+
+    for inv_i in sorted_idx:
+        inv = ds.INVOICES[inv_i]
         onum = inv["order_num"]
         is_personal = (inv.get("source") == "Personal Amazon" or
                        (isinstance(inv.get("file", ""), str) and "Gigi" in inv.get("file", "")))
         source_label = ("Personal Amazon" if is_personal else
                         ("Amazon" if inv.get("source") in ("Key Component Mfg",) else inv.get("source", "")))
-        ship_addr = inv.get("ship_address", "")
-        orig_location = ds.classify_location(ship_addr)
+        orig_location = ds.INVOICE_LOCATIONS[inv_i]
 
         item_rows = []
         order_saved = 0
         order_total_items = 0
 
-        for item in inv["items"]:
-            item_name = item["name"]
-            if item_name.startswith("Your package was left near the front door or porch."):
-                item_name = item_name.replace("Your package was left near the front door or porch.", "").strip()
+        for row, item in enumerate(inv["items"], start=starts[inv_i]):
+            item_name = clean_names[row]
 
             total_items += 1
             order_total_items += 1
-            auto_cat = ds.categorize_item(item_name)
+            auto_cat = auto_cats[row]
             orig_qty = item["qty"]
             price = item["price"]
 
@@ -554,8 +566,9 @@ def _build_warehouse_section():
 #  SPENDING ANALYTICS CHARTS
 # ══════════════════════════════════════════════════════════════════════════════
 
-def _build_analytics_charts():
-    """Build the 3 main inventory charts + sub-sections."""
+@ds.cached_per_version
+def _build_analytics_figures():
+    """Build the analytics figures as serialized figures."""
     inv_months = sorted(ds.monthly_inv_spend.index) if len(ds.monthly_inv_spend) > 0 else []
     sales_months = sorted(ds.monthly_sales.index) if len(ds.monthly_sales) > 0 else []
     all_months = sorted(set(sales_months) | set(inv_months))
@@ -563,11 +576,12 @@ def _build_analytics_charts():
     # 1. Monthly Supply Costs
     fig1 = go.Figure()
     if inv_months:
+        inv_spend = ds.monthly_inv_spend.reindex(inv_months, fill_value=0).tolist()
         fig1.add_trace(go.Bar(
             name="Inventory Spend", x=inv_months,
-            y=[ds.monthly_inv_spend.get(m, 0) for m in inv_months],
+            y=inv_spend,
             marker_color=PURPLE,
-            text=[f"${ds.monthly_inv_spend.get(m, 0):,.0f}" for m in inv_months],
+            text=[f"${v:,.0f}" for v in inv_spend],
             textposition="outside",
         ))
     make_chart(fig1, 360)
@@ -590,22 +604,21 @@ def _build_analytics_charts():
     # 3. Revenue vs COGS vs Profit
     fig3 = go.Figure()
     if all_months:
+        # Every monthly series aligned to the same axis in one reindex each
+        sales, supplies, fees, shipping, marketing, refunds = (
+            s.reindex(all_months, fill_value=0).to_numpy(dtype=float)
+            for s in (ds.monthly_sales, ds.monthly_inv_spend, ds.monthly_fees,
+                      ds.monthly_shipping, ds.monthly_marketing, ds.monthly_refunds))
         fig3.add_trace(go.Bar(
             name="Revenue", x=all_months,
-            y=[ds.monthly_sales.get(m, 0) for m in all_months], marker_color=GREEN))
+            y=sales.tolist(), marker_color=GREEN))
         fig3.add_trace(go.Bar(
             name="Supplies", x=all_months,
-            y=[ds.monthly_inv_spend.get(m, 0) for m in all_months], marker_color=PURPLE))
+            y=supplies.tolist(), marker_color=PURPLE))
         fig3.add_trace(go.Bar(
             name="Etsy Expenses", x=all_months,
-            y=[ds.monthly_fees.get(m, 0) + ds.monthly_shipping.get(m, 0)
-               + ds.monthly_marketing.get(m, 0) + ds.monthly_refunds.get(m, 0)
-               for m in all_months], marker_color=RED))
-        true_profit = [
-            ds.monthly_sales.get(m, 0) - ds.monthly_fees.get(m, 0) - ds.monthly_shipping.get(m, 0)
-            - ds.monthly_marketing.get(m, 0) - ds.monthly_refunds.get(m, 0) - ds.monthly_inv_spend.get(m, 0)
-            for m in all_months
-        ]
+            y=(fees + shipping + marketing + refunds).tolist(), marker_color=RED))
+        true_profit = (sales - fees - shipping - marketing - refunds - supplies).tolist()
         fig3.add_trace(go.Scatter(
             name="True Profit", x=all_months, y=true_profit,
             mode="lines+markers+text",
@@ -617,20 +630,22 @@ def _build_analytics_charts():
                        barmode="group", yaxis_title="Amount ($)")
 
     # Location charts
-    loc_months = sorted(set(list(ds.tulsa_monthly.index) + list(ds.texas_monthly.index)))
+    loc_months = ds.tulsa_monthly.index.union(ds.texas_monthly.index, sort=True).tolist()
     fig_loc = go.Figure()
     if loc_months:
+        tulsa_loc = ds.tulsa_monthly.reindex(loc_months, fill_value=0).tolist()
+        texas_loc = ds.texas_monthly.reindex(loc_months, fill_value=0).tolist()
         fig_loc.add_trace(go.Bar(
             name="TJ (Tulsa)", x=loc_months,
-            y=[ds.tulsa_monthly.get(m, 0) for m in loc_months],
+            y=tulsa_loc,
             marker_color=TEAL,
-            text=[f"${ds.tulsa_monthly.get(m, 0):,.0f}" for m in loc_months],
+            text=[f"${v:,.0f}" for v in tulsa_loc],
             textposition="outside"))
         fig_loc.add_trace(go.Bar(
             name="Braden (TX)", x=loc_months,
-            y=[ds.texas_monthly.get(m, 0) for m in loc_months],
+            y=texas_loc,
             marker_color=ORANGE,
-            text=[f"${ds.texas_monthly.get(m, 0):,.0f}" for m in loc_months],
+            text=[f"${v:,.0f}" for v in texas_loc],
             textposition="outside"))
     make_chart(fig_loc, 380)
     fig_loc.update_layout(title="Monthly Spending by Location", barmode="group")
@@ -652,12 +667,26 @@ def _build_analytics_charts():
     make_chart(texas_cat_fig, 320, False)
     texas_cat_fig.update_layout(title="Braden (TX) by Category", showlegend=False)
 
+    return {
+        "supply": frozen_figure(fig1),
+        "category": frozen_figure(fig2),
+        "profit": frozen_figure(fig3),
+        "location": frozen_figure(fig_loc),
+        "tulsa_cat": frozen_figure(tulsa_cat_fig),
+        "texas_cat": frozen_figure(texas_cat_fig),
+    }
+
+
+def _build_analytics_charts():
+    """Build the 3 main inventory charts + sub-sections."""
+    figs = _build_analytics_figures()
+
     # Payment sections
     payment_cards = []
     if ds.payment_summary:
         for pm_name, pm_data in sorted(ds.payment_summary.items(), key=lambda x: -x[1]["total"]):
             item_agg = {}
-            for it in pm_data.get("items", []):
+            for it in ds.get_payment_items(pm_name):
                 name = it.get("name", "")[:80]
                 if name not in item_agg:
                     item_agg[name] = {"qty": 0, "total": 0.0, "category": it.get("category", "Other")}
@@ -711,10 +740,10 @@ def _build_analytics_charts():
     return html.Div([
         # Main charts
         html.Div([
-            html.Div([dcc.Graph(figure=fig1, config={"displayModeBar": False})], style={"flex": "3"}),
-            html.Div([dcc.Graph(figure=fig2, config={"displayModeBar": False})], style={"flex": "2"}),
+            html.Div([dcc.Graph(figure=figs["supply"], config={"displayModeBar": False})], style={"flex": "3"}),
+            html.Div([dcc.Graph(figure=figs["category"], config={"displayModeBar": False})], style={"flex": "2"}),
         ], style={"display": "flex", "gap": "8px", "marginBottom": "10px"}),
-        dcc.Graph(figure=fig3, config={"displayModeBar": False}),
+        dcc.Graph(figure=figs["profit"], config={"displayModeBar": False}),
 
         # Location Spending Breakdown
         html.Details([
@@ -722,10 +751,10 @@ def _build_analytics_charts():
                 "color": CYAN, "fontSize": "14px", "fontWeight": "bold",
                 "cursor": "pointer", "padding": "8px 0"}),
             html.Div([
-                dcc.Graph(figure=fig_loc, config={"displayModeBar": False}),
+                dcc.Graph(figure=figs["location"], config={"displayModeBar": False}),
                 html.Div([
-                    html.Div([dcc.Graph(figure=tulsa_cat_fig, config={"displayModeBar": False})], style={"flex": "1"}),
-                    html.Div([dcc.Graph(figure=texas_cat_fig, config={"displayModeBar": False})], style={"flex": "1"}),
+                    html.Div([dcc.Graph(figure=figs["tulsa_cat"], config={"displayModeBar": False})], style={"flex": "1"}),
+                    html.Div([dcc.Graph(figure=figs["texas_cat"], config={"displayModeBar": False})], style={"flex": "1"}),
                 ], style={"display": "flex", "gap": "8px", "marginBottom": "10px"}),
                 html.Div([
                     html.Div([
@@ -802,136 +831,184 @@ def _build_analytics_charts():
 #  ORDER & ITEM TABLES
 # ══════════════════════════════════════════════════════════════════════════════
 
-def _build_order_table():
-    """Full orders table from BIZ_INV_DF."""
+# Orders table markup; theme colors are baked in so each row only formats its data
+_TD = "padding:4px 8px;font-size:12px"
+_ORDER_ROW = (
+    '<tr class="stock-row" style="border-bottom:1px solid #ffffff10">'
+    f'<td style="color:{GRAY};{_TD}">{{date}}</td>'
+    f'<td style="color:{WHITE};{_TD}">{{order_num}}</td>'
+    f'<td style="color:{TEAL};{_TD}">{{store}}</td>'
+    f'<td style="color:{CYAN};{_TD}">{{ship}}</td>'
+    f'<td style="text-align:center;color:{WHITE};{_TD}">{{items}}</td>'
+    f'<td style="text-align:right;color:{WHITE};{_TD}">${{subtotal:,.2f}}</td>'
+    f'<td style="text-align:right;color:{GRAY};{_TD}">${{tax:,.2f}}</td>'
+    f'<td style="text-align:right;color:{ORANGE};font-weight:bold;{_TD}">${{total:,.2f}}</td>'
+    '</tr>'
+)
+_TOTAL_TD = f"color:{ORANGE};font-weight:bold;padding:6px 8px"
+_ORDER_TOTAL_ROW = (
+    f'<tr style="border-top:3px solid {ORANGE}">'
+    f'<td style="{_TOTAL_TD}">TOTAL</td><td></td><td></td><td></td>'
+    f'<td style="text-align:center;{_TOTAL_TD}">{{items}}</td>'
+    f'<td style="text-align:right;{_TOTAL_TD}">${{subtotal:,.2f}}</td>'
+    f'<td style="text-align:right;{_TOTAL_TD}">${{tax:,.2f}}</td>'
+    f'<td style="text-align:right;{_TOTAL_TD};font-size:14px">${{total:,.2f}}</td>'
+    '</tr>'
+)
+_ORDER_HEAD = (
+    f'<table style="width:100%;border-collapse:collapse;color:{WHITE}"><thead>'
+    f'<tr style="border-bottom:2px solid {PURPLE}">'
+    + "".join(f'<th style="text-align:{align};padding:6px 8px">{label}</th>' for label, align in (
+        ("Date", "left"), ("Order #", "left"), ("Store", "left"), ("Shipped To", "left"),
+        ("Items", "center"), ("Subtotal", "right"), ("Tax", "right"), ("Total", "right")))
+    + "</tr></thead><tbody>"
+)
+
+
+_ORDERS_PAGE_SIZE = 50
+
+
+@ds.cached_per_version
+def _order_rows():
+    """Rendered ``<tr>`` strings for every business order plus the TOTAL row.
+
+    Pages of the orders table are sliced from this.
+    """
     rows = []
-    for _, r in ds.INV_DF.iterrows():
-        is_personal = (r.get("source") == "Personal Amazon" or
-                       (isinstance(r.get("file", ""), str) and "Gigi" in r.get("file", "")))
+    order_cols = ["date", "order_num", "source", "file", "ship_address",
+                  "item_count", "subtotal", "tax", "grand_total"]
+    for (date, order_num, src, file, ship_addr,
+         item_count, subtotal, tax, grand_total) in ds.INV_DF[order_cols].itertuples(index=False, name=None):
+        is_personal = src == "Personal Amazon" or (isinstance(file, str) and "Gigi" in file)
         if is_personal:
             continue
-        src = r.get("source", "")
         store_label = "Amazon" if src in ("Key Component Mfg",) else src
-        ship_addr = r.get("ship_address", "")
         short_addr = (ship_addr.split(",")[1].strip() + ", " + ship_addr.split(",")[2].strip().split(" ")[0]
                       if ship_addr.count(",") >= 2 else ship_addr)
-        rows.append(html.Tr([
-            html.Td(r.get("date", ""), style={"color": GRAY, "padding": "4px 8px", "fontSize": "12px"}),
-            html.Td(r.get("order_num", ""), style={"color": WHITE, "padding": "4px 8px", "fontSize": "12px"}),
-            html.Td(store_label, style={"color": TEAL, "padding": "4px 8px", "fontSize": "12px"}),
-            html.Td(short_addr, style={"color": CYAN, "padding": "4px 8px", "fontSize": "12px"}),
-            html.Td(str(r.get("item_count", 0)), style={"textAlign": "center", "color": WHITE,
-                                                          "padding": "4px 8px", "fontSize": "12px"}),
-            html.Td(f"${r.get('subtotal', 0):,.2f}", style={"textAlign": "right", "color": WHITE,
-                                                              "padding": "4px 8px", "fontSize": "12px"}),
-            html.Td(f"${r.get('tax', 0):,.2f}", style={"textAlign": "right", "color": GRAY,
-                                                          "padding": "4px 8px", "fontSize": "12px"}),
-            html.Td(f"${r.get('grand_total', 0):,.2f}", style={"textAlign": "right", "color": ORANGE,
-                                                                  "fontWeight": "bold", "padding": "4px 8px",
-                                                                  "fontSize": "12px"}),
-        ], style={"borderBottom": "1px solid #ffffff10"}))
+        rows.append(_ORDER_ROW.format(
+            date=escape(str(date)), order_num=escape(str(order_num)), store=escape(str(store_label)),
+            ship=escape(short_addr), items=item_count, subtotal=subtotal, tax=tax, total=grand_total,
+        ))
 
     total_items = int(ds.INV_DF["item_count"].sum()) if "item_count" in ds.INV_DF.columns else 0
     total_sub = ds.INV_DF["subtotal"].sum() if "subtotal" in ds.INV_DF.columns else 0
     total_tax = ds.INV_DF["tax"].sum() if "tax" in ds.INV_DF.columns else 0
-    total_grand = ds.total_inventory_cost
-
-    rows.append(html.Tr([
-        html.Td("TOTAL", style={"color": ORANGE, "fontWeight": "bold", "padding": "6px 8px"}),
-        html.Td(""), html.Td(""), html.Td(""),
-        html.Td(str(total_items), style={"textAlign": "center", "color": ORANGE,
-                                          "fontWeight": "bold", "padding": "6px 8px"}),
-        html.Td(f"${total_sub:,.2f}", style={"textAlign": "right", "color": ORANGE,
-                                               "fontWeight": "bold", "padding": "6px 8px"}),
-        html.Td(f"${total_tax:,.2f}", style={"textAlign": "right", "color": ORANGE,
-                                               "fontWeight": "bold", "padding": "6px 8px"}),
-        html.Td(f"${total_grand:,.2f}", style={"textAlign": "right", "color": ORANGE,
-                                                 "fontWeight": "bold", "fontSize": "14px",
-                                                 "padding": "6px 8px"}),
-    ], style={"borderTop": f"3px solid {ORANGE}"}))
-
-    return html.Table([
-        html.Thead(html.Tr([
-            html.Th("Date", style={"textAlign": "left", "padding": "6px 8px"}),
-            html.Th("Order #", style={"textAlign": "left", "padding": "6px 8px"}),
-            html.Th("Store", style={"textAlign": "left", "padding": "6px 8px"}),
-            html.Th("Shipped To", style={"textAlign": "left", "padding": "6px 8px"}),
-            html.Th("Items", style={"textAlign": "center", "padding": "6px 8px"}),
-            html.Th("Subtotal", style={"textAlign": "right", "padding": "6px 8px"}),
-            html.Th("Tax", style={"textAlign": "right", "padding": "6px 8px"}),
-            html.Th("Total", style={"textAlign": "right", "padding": "6px 8px"}),
-        ], style={"borderBottom": f"2px solid {PURPLE}"})),
-        html.Tbody(rows),
-    ], style={"width": "100%", "borderCollapse": "collapse", "color": WHITE})
+    total_row = _ORDER_TOTAL_ROW.format(items=total_items, subtotal=total_sub, tax=total_tax,
+                                        total=ds.total_inventory_cost)
+    return tuple(rows), total_row
+
 
+def render_order_page(page):
+    """One page of the orders table as a single server-rendered HTML string.
 
+    Only ``_ORDERS_PAGE_SIZE`` rows are sent to the browser; the TOTAL row is
+    always shown beneath them.
+    """
+    rows, total_row = _order_rows()
+    start = (max(int(page or 1), 1) - 1) * _ORDERS_PAGE_SIZE
+    return dcc.Markdown(_ORDER_HEAD + "".join(rows[start:start + _ORDERS_PAGE_SIZE]) + total_row
+                        + "</tbody></table>", dangerously_allow_html=True)
+
+
+def _build_order_table():
+    """Full orders table from BIZ_INV_DF, paged server-side by ``inv-orders-pagination``."""
+    n_pages = -(-len(_order_rows()[0]) // _ORDERS_PAGE_SIZE)
+    return html.Div([
+        html.Div(render_order_page(1), id="inv-orders-page"),
+        dbc.Pagination(id="inv-orders-pagination", max_value=n_pages, active_page=1,
+                       fully_expanded=False, size="sm", className="mt-2 mb-0")
+        if n_pages > 1 else html.Div(),
+    ])
+
+
+_ITEM_TABLE_COLUMNS = [
+    {"name": "", "id": "thumb", "presentation": "markdown"},
+    {"name": "Type", "id": "type", "presentation": "markdown"},
+    {"name": "Item Name", "id": "name", "presentation": "markdown"},
+    {"name": "Category", "id": "category"},
+    {"name": "Store", "id": "store"},
+    {"name": "Shipped To", "id": "ship"},
+    {"name": "Qty", "id": "qty"},
+    {"name": "Unit Price", "id": "price"},
+    {"name": "Total", "id": "total"},
+    {"name": "Date", "id": "date"},
+]
+_ITEM_TABLE_CELL_CONDITIONAL = [
+    {"if": {"column_id": "thumb"}, "width": "44px", "textAlign": "center", "padding": "4px 6px"},
+    {"if": {"column_id": "type"}, "width": "80px", "textAlign": "center"},
+    {"if": {"column_id": "name"}, "maxWidth": "350px", "overflow": "hidden", "textOverflow": "ellipsis"},
+    {"if": {"column_id": "category"}, "color": TEAL},
+    {"if": {"column_id": "store"}, "color": CYAN},
+    {"if": {"column_id": "ship"}, "color": GRAY},
+    {"if": {"column_id": "qty"}, "textAlign": "center"},
+    {"if": {"column_id": "price"}, "textAlign": "right"},
+    {"if": {"column_id": "total"}, "textAlign": "right", "color": ORANGE, "fontWeight": "bold"},
+    {"if": {"column_id": "date"}, "color": GRAY},
+]
+# Markdown cells are wrapped in a <div> so names are rendered as HTML, not markdown
+_INVENTORY_BADGE = (
+    '<div><span style="background-color:#00e67622;color:{};padding:2px 8px;border-radius:10px;'
+    'font-size:10px;font-weight:600;letter-spacing:0.5px">INVENTORY</span></div>'.format(GREEN)
+)
+
+def _item_name_html(name, orig):
+    if orig == name:
+        return f'<div style="color:{WHITE}">{escape(name)}</div>'
+    return (f'<div><span style="color:{WHITE}">{escape(name)}</span><br>'
+            f'<span style="color:{DARKGRAY};font-size:9px;font-style:italic">{escape(orig[:55])}</span></div>')
+
+
+@ds.cached_per_version
 def _build_item_table():
-    """Full item list sorted by cost — excludes personal/biz fees."""
-    rows = []
+    """Full item list sorted by cost — excludes personal/biz fees.
+
+    One scrolling DataTable instead of a component tree per item.
+    """
+    records, tooltips = [], []
     items_sorted = ds.INV_ITEMS.sort_values("total", ascending=False)
-    for _, r in items_sorted.iterrows():
-        if r.get("category", "") in ("Personal/Gift", "Business Fees"):
+    item_cols = ["name", "category", "source", "ship_to", "image_url", "qty", "price", "total", "date"]
+    orig_names = items_sorted["_orig_name"] if "_orig_name" in items_sorted.columns else items_sorted["name"]
+    for (name, category, item_src, ship_loc, image_url,
+         qty, price, total, date), _item_orig in zip(
+            items_sorted.reindex(columns=item_cols).itertuples(index=False, name=None), orig_names):
+        if category in ("Personal/Gift", "Business Fees"):
             continue
-        item_src = r.get("source", "")
         store_name = "Amazon" if item_src in ("Key Component Mfg",) else item_src
-        ship_loc = r.get("ship_to", "")
         if ship_loc.count(",") >= 2:
             parts = ship_loc.split(",")
             short_ship = parts[1].strip() + ", " + parts[2].strip().split(" ")[0]
         else:
             short_ship = ship_loc
-        _img_url = ds._IMAGE_URLS.get(r["name"], "") or r.get("image_url", "")
-        _item_orig = r.get("_orig_name", r["name"])
-        _item_renamed = _item_orig != r["name"]
-        _name_parts = [html.Span(r["name"], style={"color": WHITE})]
-        if _item_renamed:
-            _name_parts.append(html.Br())
-            _name_parts.append(html.Span(
-                _item_orig[:55], title=_item_orig,
-                style={"color": DARKGRAY, "fontSize": "9px", "fontStyle": "italic"}))
-        rows.append(html.Tr([
-            html.Td(item_thumbnail(r["name"], _img_url, 32),
-                     style={"padding": "4px 6px", "textAlign": "center", "width": "40px"}),
-            html.Td(html.Span("INVENTORY", style={
-                "backgroundColor": "#00e67622", "color": GREEN, "padding": "2px 8px",
-                "borderRadius": "10px", "fontSize": "10px", "fontWeight": "600",
-                "letterSpacing": "0.5px"}), style={"padding": "4px 8px", "textAlign": "center"}),
-            html.Td(_name_parts,
-                     title=f"{r['name']}\nFrom: {_item_orig}" if _item_renamed else r["name"],
-                     style={"padding": "4px 8px", "fontSize": "11px",
-                            "maxWidth": "350px", "overflow": "hidden", "textOverflow": "ellipsis"}),
-            html.Td(r.get("category", "Other"), style={"color": TEAL, "padding": "4px 8px", "fontSize": "11px"}),
-            html.Td(store_name, style={"color": CYAN, "padding": "4px 8px", "fontSize": "11px"}),
-            html.Td(short_ship[:30], style={"color": GRAY, "padding": "4px 8px", "fontSize": "11px"}),
-            html.Td(str(r.get("qty", 0)), style={"textAlign": "center", "color": WHITE,
-                                                    "padding": "4px 8px", "fontSize": "11px"}),
-            html.Td(f"${r.get('price', 0):,.2f}", style={"textAlign": "right", "color": WHITE,
-                                                            "padding": "4px 8px", "fontSize": "11px"}),
-            html.Td(f"${r.get('total', 0):,.2f}", style={"textAlign": "right", "color": ORANGE,
-                                                            "fontWeight": "bold", "padding": "4px 8px",
-                                                            "fontSize": "11px"}),
-            html.Td(r.get("date", ""), style={"color": GRAY, "padding": "4px 8px", "fontSize": "11px"}),
-        ], style={"borderBottom": "1px solid #ffffff10"}))
+        records.append({
+            "thumb": f"<div>{item_thumbnail_html(ds._IMAGE_URLS.get(name, '') or image_url, 32)}</div>",
+            "type": _INVENTORY_BADGE,
+            "name": _item_name_html(name, _item_orig),
+            "category": category,
+            "store": store_name,
+            "ship": short_ship[:30],
+            "qty": str(qty),
+            "price": f"${price:,.2f}",
+            "total": f"${total:,.2f}",
+            "date": date,
+        })
+        tooltips.append({"name": f"{name}\nFrom: {_item_orig}" if _item_orig != name else name})
 
     return html.Div([
         html.P("Business supplies only.", style={"color": GRAY, "fontSize": "12px", "marginBottom": "8px"}),
-        html.Div([
-            html.Table([
-                html.Thead(html.Tr([
-                    html.Th("", style={"padding": "6px 4px", "width": "44px"}),
-                    html.Th("Type", style={"textAlign": "center", "padding": "6px 8px", "width": "80px"}),
-                    html.Th("Item Name", style={"textAlign": "left", "padding": "6px 8px"}),
-                    html.Th("Category", style={"textAlign": "left", "padding": "6px 8px"}),
-                    html.Th("Store", style={"textAlign": "left", "padding": "6px 8px"}),
-                    html.Th("Shipped To", style={"textAlign": "left", "padding": "6px 8px"}),
-                    html.Th("Qty", style={"textAlign": "center", "padding": "6px 8px"}),
-                    html.Th("Unit Price", style={"textAlign": "right", "padding": "6px 8px"}),
-                    html.Th("Total", style={"textAlign": "right", "padding": "6px 8px"}),
-                    html.Th("Date", style={"textAlign": "left", "padding": "6px 8px"}),
-                ], style={"borderBottom": f"2px solid {TEAL}"})),
-                html.Tbody(rows),
-            ], style={"width": "100%", "borderCollapse": "collapse", "color": WHITE}),
-        ], style={"maxHeight": "600px", "overflowY": "auto"}),
+        dash_table.DataTable(
+            data=records,
+            columns=_ITEM_TABLE_COLUMNS,
+            tooltip_data=tooltips,
+            markdown_options={"html": True},
+            page_action="none",
+            style_table={"maxHeight": "600px", "overflowY": "auto"},
+            style_header={"backgroundColor": "transparent", "color": WHITE, "fontWeight": "bold",
+                          "border": "none", "borderBottom": f"2px solid {TEAL}", "padding": "6px 8px"},
+            style_cell={"backgroundColor": "transparent", "color": WHITE, "border": "none",
+                        "borderBottom": "1px solid #ffffff10", "padding": "4px 8px",
+                        "fontSize": "11px", "textAlign": "left", "fontFamily": "inherit"},
+            style_cell_conditional=_ITEM_TABLE_CELL_CONDITIONAL,
+        ),
     ])
 
 
@@ -939,6 +1016,7 @@ def _build_item_table():
 #  RECEIPT GALLERY  (mirrors monolith _build_receipt_gallery — simplified)
 # ══════════════════════════════════════════════════════════════════════════════
 
+@ds.cached_per_version
 def _build_receipt_gallery():
     """Visual receipt gallery with parsed specs (no PDF viewer in local mode)."""
     import pandas as pd
@@ -946,9 +1024,11 @@ def _build_receipt_gallery():
     sorted_invoices = sorted(ds.INVOICES,
                              key=lambda o: o.get("date", ""), reverse=True)
     try:
-        sorted_invoices = sorted(ds.INVOICES,
-            key=lambda o: pd.to_datetime(o.get("date", ""), format="%B %d, %Y", errors="coerce"),
-            reverse=True)
+        # One vectorized parse for all receipt dates, then sort invoices by it
+        parsed = pd.to_datetime(pd.Series([o.get("date", "") for o in ds.INVOICES], dtype=object),
+                                format="%B %d, %Y", errors="coerce").tolist()
+        sorted_invoices = [ds.INVOICES[i] for i in sorted(range(len(ds.INVOICES)),
+                                                          key=parsed.__getitem__, reverse=True)]
     except Exception:
         pass
 
@@ -5,17 +5,13 @@ import plotly.graph_objects as go
 
 from etsy_dashboard.theme import *
 from etsy_dashboard.components.kpi import kpi_card
-from etsy_dashboard.components.cards import section, make_chart
+from etsy_dashboard.components.cards import section, make_chart, frozen_figure
 from etsy_dashboard.components.thumbnail import item_thumbnail
 from etsy_dashboard import data_state as ds
 
 
-def _build_item_card(name, category, qty, unit_cost, location, other_location):
-    """Build a single item card with move button."""
-    cat_color = CATEGORY_COLORS.get(category, GRAY)
-    img_url = ds._IMAGE_URLS.get(name, "")
-    stock_color = GREEN if qty > 2 else ORANGE if qty > 0 else RED
-
+def _build_item_card(name, category, qty, cost_label, cat_color, img_url, stock_color):
+    """Build a single item card; the display fields come precomputed per board."""
     return dbc.Card(dbc.CardBody([
         html.Div([
             item_thumbnail(name, img_url, size=60),
@@ -25,7 +21,7 @@ def _build_item_card(name, category, qty, unit_cost, location, other_location):
                 html.Div([
                     html.Span("● ", style={"color": cat_color, "fontSize": "10px"}),
                     html.Span(category, style={"color": GRAY, "fontSize": "11px"}),
-                    html.Span(f" · ${unit_cost:,.2f}/ea", style={"color": DARKGRAY, "fontSize": "11px"}),
+                    html.Span(cost_label, style={"color": DARKGRAY, "fontSize": "11px"}),
                 ]),
                 html.Div([
                     html.Span(f"×{qty}", style={"color": stock_color, "fontWeight": "bold",
@@ -37,28 +33,20 @@ def _build_item_card(name, category, qty, unit_cost, location, other_location):
     style={"borderLeft": f"3px solid {cat_color}"}, className="mb-2")
 
 
-def _build_location_board(location_label, items_df, other_label):
-    """Build a single location board column."""
-    if len(items_df) == 0:
+def _build_location_board(location_label, agg, total_items, total_value):
+    """Build a single location board column from its ``ds.LOC_AGG`` entry and totals."""
+    if len(agg) == 0:
         return html.P("No items at this location.", style={"color": GRAY, "textAlign": "center", "padding": "20px"})
 
-    # Aggregate by item name
-    agg = items_df.groupby("name").agg(
-        category=("category", "first"),
-        qty=("qty", "sum"),
-        total=("total", "sum"),
-        price=("price", "first"),
-    ).reset_index().sort_values("category")
-
-    total_items = int(agg["qty"].sum())
-    total_value = agg["total"].sum()
-
-    cards = []
-    for _, row in agg.iterrows():
-        cards.append(_build_item_card(
-            row["name"], row["category"], int(row["qty"]),
-            row["price"], location_label, other_label,
-        ))
+    # Display fields for every card in one pass, so the loop only assembles components
+    cost_labels = [f" · ${p:,.2f}/ea" for p in agg["price"].tolist()]
+    cat_colors = agg["category"].map(CATEGORY_COLORS).fillna(GRAY).tolist()
+    cards = [
+        _build_item_card(name, category, int(qty), cost_label, cat_color, img_url, stock_color)
+        for (name, category, qty, stock_color, img_url), cost_label, cat_color in zip(
+            agg[["name", "category", "qty", "stock_color", "image_url"]].itertuples(index=False, name=None),
+            cost_labels, cat_colors)
+    ]
 
     return html.Div([
         # Header
@@ -77,37 +65,31 @@ def _build_location_board(location_label, items_df, other_label):
     ])
 
 
-def layout():
-    """Build the Locations page."""
-    # Get items for each location
-    if len(ds.BIZ_INV_ITEMS) > 0:
-        tulsa_df = ds.BIZ_INV_ITEMS[ds.BIZ_INV_ITEMS["location"] == "Tulsa, OK"]
-        texas_df = ds.BIZ_INV_ITEMS[ds.BIZ_INV_ITEMS["location"] == "Texas"]
-    else:
-        import pandas as pd
-        tulsa_df = pd.DataFrame()
-        texas_df = pd.DataFrame()
-
-    tulsa_count = int(tulsa_df["qty"].sum()) if len(tulsa_df) > 0 else 0
-    texas_count = int(texas_df["qty"].sum()) if len(texas_df) > 0 else 0
-    tulsa_value = tulsa_df["total"].sum() if len(tulsa_df) > 0 else 0
-    texas_value = texas_df["total"].sum() if len(texas_df) > 0 else 0
+@ds.cached_per_version
+def _stock_dropdown_options():
+    """Item options for the move dropdown."""
+    if len(ds.STOCK_SUMMARY) == 0:
+        return []
+    return [{"label": n, "value": n} for n in ds.STOCK_SUMMARY["display_name"].tolist()]
+
 
+@ds.cached_per_version
+def _build_charts():
+    """Build the comparison charts as serialized figures."""
     # Category breakdown comparison chart
     comp_fig = go.Figure()
-    all_cats = sorted(set(
-        list(ds.tulsa_by_cat.index) + list(ds.texas_by_cat.index)
-    )) if len(ds.tulsa_by_cat) > 0 or len(ds.texas_by_cat) > 0 else []
+    all_cats = ds.tulsa_by_cat.index.union(ds.texas_by_cat.index, sort=True).tolist() \
+        if len(ds.tulsa_by_cat) > 0 or len(ds.texas_by_cat) > 0 else []
 
     if all_cats:
         comp_fig.add_trace(go.Bar(
             x=all_cats,
-            y=[ds.tulsa_by_cat.get(c, 0) for c in all_cats],
+            y=ds.tulsa_by_cat.reindex(all_cats, fill_value=0).tolist(),
             name="Tulsa (TJ)", marker_color=CYAN,
         ))
         comp_fig.add_trace(go.Bar(
             x=all_cats,
-            y=[ds.texas_by_cat.get(c, 0) for c in all_cats],
+            y=ds.texas_by_cat.reindex(all_cats, fill_value=0).tolist(),
             name="Texas (Braden)", marker_color=ORANGE,
         ))
     make_chart(comp_fig, 300)
@@ -115,30 +97,40 @@ def layout():
 
     # Monthly spend comparison
     spend_fig = go.Figure()
-    all_months = sorted(set(
-        list(ds.tulsa_monthly.index) + list(ds.texas_monthly.index)
-    )) if len(ds.tulsa_monthly) > 0 or len(ds.texas_monthly) > 0 else []
+    all_months = ds.tulsa_monthly.index.union(ds.texas_monthly.index, sort=True).tolist() \
+        if len(ds.tulsa_monthly) > 0 or len(ds.texas_monthly) > 0 else []
     if all_months:
         spend_fig.add_trace(go.Bar(
             x=all_months,
-            y=[ds.tulsa_monthly.get(m, 0) for m in all_months],
+            y=ds.tulsa_monthly.reindex(all_months, fill_value=0).tolist(),
             name="Tulsa", marker_color=CYAN,
         ))
         spend_fig.add_trace(go.Bar(
             x=all_months,
-            y=[ds.texas_monthly.get(m, 0) for m in all_months],
+            y=ds.texas_monthly.reindex(all_months, fill_value=0).tolist(),
             name="Texas", marker_color=ORANGE,
         ))
     make_chart(spend_fig, 300)
     spend_fig.update_layout(title="Monthly Spending by Location", barmode="group")
 
+    return {"comp": frozen_figure(comp_fig), "spend": frozen_figure(spend_fig)}
+
+
+def layout():
+    """Build the Locations page."""
+    # Items for each location, aggregated once per load in data_state
+    tulsa_agg = ds.LOC_AGG.get("Tulsa, OK", ds._EMPTY_LOC_AGG)
+    texas_agg = ds.LOC_AGG.get("Texas", ds._EMPTY_LOC_AGG)
+
+    figs = _build_charts()
+
     return html.Div([
         # KPI strip
         dbc.Row([
-            dbc.Col(kpi_card("TULSA ITEMS", str(tulsa_count), CYAN,
-                             f"Value: {ds.money(tulsa_value)}"), md=3),
-            dbc.Col(kpi_card("TEXAS ITEMS", str(texas_count), ORANGE,
-                             f"Value: {ds.money(texas_value)}"), md=3),
+            dbc.Col(kpi_card("TULSA ITEMS", str(ds.tulsa_qty), CYAN,
+                             f"Value: {ds.money(ds.tulsa_value)}"), md=3),
+            dbc.Col(kpi_card("TEXAS ITEMS", str(ds.texas_qty), ORANGE,
+                             f"Value: {ds.money(ds.texas_value)}"), md=3),
             dbc.Col(kpi_card("TULSA SPEND", ds.money(ds.tulsa_spend), CYAN,
                              f"{ds.tulsa_orders} orders"), md=3),
             dbc.Col(kpi_card("TEXAS SPEND", ds.money(ds.texas_spend), ORANGE,
@@ -149,12 +141,12 @@ def layout():
         dbc.Row([
             dbc.Col([
                 dbc.Card(dbc.CardBody([
-                    _build_location_board("Tulsa, OK (TJ)", tulsa_df, "Texas"),
+                    _build_location_board("Tulsa, OK (TJ)", tulsa_agg, ds.tulsa_qty, ds.tulsa_value),
                 ]), style={"borderTop": f"3px solid {CYAN}"}),
             ], md=6),
             dbc.Col([
                 dbc.Card(dbc.CardBody([
-                    _build_location_board("Texas (Braden)", texas_df, "Tulsa, OK"),
+                    _build_location_board("Texas (Braden)", texas_agg, ds.texas_qty, ds.texas_value),
                 ]), style={"borderTop": f"3px solid {ORANGE}"}),
             ], md=6),
         ], className="g-3 mb-3"),
@@ -162,9 +154,9 @@ def layout():
         # Charts
         dbc.Row([
             dbc.Col(dbc.Card(dbc.CardBody(
-                dcc.Graph(figure=comp_fig, config={"displayModeBar": False}))), md=6),
+                dcc.Graph(figure=figs["comp"], config={"displayModeBar": False}))), md=6),
             dbc.Col(dbc.Card(dbc.CardBody(
-                dcc.Graph(figure=spend_fig, config={"displayModeBar": False}))), md=6),
+                dcc.Graph(figure=figs["spend"], config={"displayModeBar": False}))), md=6),
         ], className="g-3 mb-3"),
 
         # Move item controls
@@ -173,8 +165,7 @@ def layout():
                 dbc.Col([
                     dcc.Dropdown(
                         id="loc-move-item",
-                        options=[{"label": row["display_name"], "value": row["display_name"]}
-                                 for _, row in ds.STOCK_SUMMARY.iterrows()] if len(ds.STOCK_SUMMARY) > 0 else [],
+                        options=_stock_dropdown_options(),
                         placeholder="Select item to move...",
                         style={"backgroundColor": BG},
                     ),
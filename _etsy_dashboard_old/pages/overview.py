@@ -1,41 +1,56 @@
 """Overview page — KPI strip + Health Checks + P&L + Monthly chart."""
 import os
+import re
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
+import numpy as np
+import pandas as pd
 
 from etsy_dashboard.theme import *
 from etsy_dashboard.components.kpi import kpi_pill
-from etsy_dashboard.components.cards import section, row_item, make_chart
+from etsy_dashboard.components.cards import form_row as _build_pl_row, section, row_item, make_chart, frozen_figure
 from etsy_dashboard import data_state as ds
 
+_ETSY_MONTH_RE = re.compile(r"(\d{4})_(0[1-9]|1[0-2])")
 
-def _build_health_checks():
-    """Scan all data sources and return a health panel with every issue found."""
+
+def _etsy_dir():
+    return os.path.join(ds.BASE_DIR, "data", "etsy_statements")
+
+
+def _etsy_dir_mtime():
+    """Modification stamp of the statements folder (None if it doesn't exist)."""
+    try:
+        return os.stat(_etsy_dir()).st_mtime_ns
+    except OSError:
+        return None
+
+
+@ds.cached_per_version
+def _build_health_checks(etsy_mtime):
+    """Scan all data sources and return a health panel with every issue found.
+
+    Every input is ``ds`` state except the statements folder, so the panel is
+    cached per data version plus that folder's mtime (``etsy_mtime``).
+    """
     todos = []
 
     # 1. Missing Etsy CSVs
-    import re as _re
-    etsy_dir = os.path.join(ds.BASE_DIR, "data", "etsy_statements")
+    etsy_dir = _etsy_dir()
     etsy_months_found = set()
-    if os.path.isdir(etsy_dir):
-        for fn in os.listdir(etsy_dir):
-            if fn.endswith(".csv"):
-                m = _re.search(r"(\d{4})_(\d{2})", fn)
-                if m:
-                    etsy_months_found.add(f"{m.group(1)}-{m.group(2)}")
+    try:
+        with os.scandir(etsy_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".csv") and entry.is_file():
+                    m = _ETSY_MONTH_RE.search(entry.name)
+                    if m:
+                        etsy_months_found.add(f"{m.group(1)}-{m.group(2)}")
+    except (FileNotFoundError, NotADirectoryError):
+        pass
     if etsy_months_found:
         all_months = sorted(etsy_months_found)
-        first_y, first_m = map(int, all_months[0].split("-"))
-        last_y, last_m = map(int, all_months[-1].split("-"))
-        expected = set()
-        y, mo = first_y, first_m
-        while (y, mo) <= (last_y, last_m):
-            expected.add(f"{y}-{mo:02d}")
-            mo += 1
-            if mo > 12:
-                mo = 1
-                y += 1
+        expected = set(pd.period_range(all_months[0], all_months[-1], freq="M").strftime("%Y-%m"))
         missing_etsy = sorted(expected - etsy_months_found)
         for mm in missing_etsy:
             todos.append((1, "\U0001f4c4", RED, f"Missing Etsy statement: {mm}",
@@ -58,49 +73,43 @@ def _build_health_checks():
                       "Upload Amazon/supplier invoices in Data Hub to track COGS"))
 
     # 4. Unreviewed inventory items
-    unreviewed = []
-    for inv in ds.INVOICES:
-        for item in inv["items"]:
-            key = (inv["order_num"], item["name"])
-            if key not in ds._ITEM_DETAILS:
-                unreviewed.append(item["name"][:40])
-    if unreviewed:
+    flat = ds.INVOICE_ITEMS_DF
+    reviewed = pd.MultiIndex.from_arrays([flat["order_num"], flat["item_name"]]).isin(list(ds._ITEM_DETAILS))
+    unreviewed = flat["item_name"][~reviewed]
+    if len(unreviewed) > 0:
         count = len(unreviewed)
-        examples = ", ".join(unreviewed[:3])
+        # Only the displayed examples get truncated
+        examples = ", ".join(unreviewed.iloc[:3].str[:40].tolist())
         todos.append((2, "\u270f\ufe0f", ORANGE,
                       f"{count} inventory item(s) need naming/categorizing",
                       f"Go to Inventory tab editor. Examples: {examples}{'...' if count > 3 else ''}"))
 
+    # 5-7. Stock checks, from one pass over STOCK_SUMMARY's columns
+    names = ds.STOCK_SUMMARY["display_name"].to_numpy() if len(ds.STOCK_SUMMARY) > 0 else np.array([], dtype=object)
+    stock = ds.STOCK_SUMMARY["in_stock"].to_numpy() if len(ds.STOCK_SUMMARY) > 0 else np.array([])
+    has_img = np.fromiter((bool(u) for u in ds.STOCK_SUMMARY.get("image_url", ())), dtype=bool, count=len(names))
+
     # 5. Items without images
-    no_image = []
-    if len(ds.STOCK_SUMMARY) > 0:
-        for _, row in ds.STOCK_SUMMARY.iterrows():
-            name = row["display_name"]
-            if not ds._IMAGE_URLS.get(name, ""):
-                no_image.append(name[:35])
+    no_image = [name[:35] for name in names[~has_img].tolist()]
     if no_image:
         count = len(no_image)
         todos.append((3, "\U0001f5bc\ufe0f", CYAN,
                       f"{count} product(s) missing images",
                       f"Add image URLs in Inventory tab. Examples: {', '.join(no_image[:3])}{'...' if count > 3 else ''}"))
 
-    # 6. Out-of-stock items
-    if len(ds.STOCK_SUMMARY) > 0:
-        oos = ds.STOCK_SUMMARY[ds.STOCK_SUMMARY["in_stock"] <= 0]
-        if len(oos) > 0:
-            oos_names = list(oos["display_name"].values[:5])
-            todos.append((2, "\U0001f6a8", RED,
-                          f"{len(oos)} item(s) out of stock",
-                          f"Reorder needed: {', '.join(oos_names)}{'...' if len(oos) > 5 else ''}"))
+    # 6. Out-of-stock items (only the five listed names are gathered)
+    oos_idx = np.flatnonzero(stock <= 0)
+    if len(oos_idx) > 0:
+        todos.append((2, "\U0001f6a8", RED,
+                      f"{len(oos_idx)} item(s) out of stock",
+                      f"Reorder needed: {', '.join(names[oos_idx[:5]])}{'...' if len(oos_idx) > 5 else ''}"))
 
     # 7. Low stock
-    if len(ds.STOCK_SUMMARY) > 0:
-        low = ds.STOCK_SUMMARY[ds.STOCK_SUMMARY["in_stock"].between(1, 2)]
-        if len(low) > 0:
-            low_names = list(low["display_name"].values[:5])
-            todos.append((3, "\u26a0", ORANGE,
-                          f"{len(low)} item(s) low stock (1-2 left)",
-                          f"Running low: {', '.join(low_names)}{'...' if len(low) > 5 else ''}"))
+    low_idx = np.flatnonzero((stock >= 1) & (stock <= 2))
+    if len(low_idx) > 0:
+        todos.append((3, "\u26a0", ORANGE,
+                      f"{len(low_idx)} item(s) low stock (1-2 left)",
+                      f"Running low: {', '.join(names[low_idx[:5]])}{'...' if len(low_idx) > 5 else ''}"))
 
     # 8. Receipt vs Bank gap
     _bank_amz = ds.bank_by_cat.get("Amazon Inventory", 0)
@@ -169,59 +178,23 @@ def _build_health_checks():
     ]), style={"borderLeft": f"4px solid {RED if critical_count else ORANGE}"}, className="mb-3")
 
 
-def _build_pl_row(label, amount_str, color, bold=False, border=False):
-    """Return a single P&L waterfall row."""
-    row_style = {
-        "display": "flex", "justifyContent": "space-between",
-        "padding": "4px 0",
-        "fontWeight": "bold" if bold else "normal",
-    }
-    if border:
-        row_style["borderTop"] = f"1px solid {DARKGRAY}44"
-        row_style["marginTop"] = "2px"
-        row_style["paddingTop"] = "6px"
-    return html.Div([
-        html.Span(label, style={"color": color if bold else GRAY, "flex": "1", "fontSize": "13px"}),
-        html.Span(amount_str, style={"color": color, "fontFamily": "monospace",
-                                      "fontWeight": "bold", "fontSize": "13px"}),
-    ], style=row_style)
-
-
-def layout():
-    """Build the Overview page."""
-    _total_deductions = ds.total_fees + ds.total_shipping_cost + ds.total_marketing + ds.total_refunds + ds.total_taxes + ds.total_buyer_fees
-
-    # Draw text
-    if ds.draw_diff > 0:
-        _draw_text = f"${ds.bank_owner_draw_total:,.2f}"
-    else:
-        _draw_text = f"${ds.bank_owner_draw_total:,.2f}"
-
-    # Monthly chart
+@ds.cached_per_version
+def _build_monthly_chart():
+    """Monthly revenue vs costs, as a serialized figure."""
+    months = ds.months_sorted
     monthly_fig = go.Figure()
-    monthly_fig.add_trace(go.Bar(
-        x=ds.months_sorted,
-        y=[ds.monthly_sales.get(m, 0) for m in ds.months_sorted],
-        name="Gross Sales", marker_color=GREEN,
-    ))
-    monthly_fig.add_trace(go.Bar(
-        x=ds.months_sorted,
-        y=[-ds.monthly_fees.get(m, 0) for m in ds.months_sorted],
-        name="Fees", marker_color=RED,
-    ))
-    monthly_fig.add_trace(go.Bar(
-        x=ds.months_sorted,
-        y=[-ds.monthly_shipping.get(m, 0) for m in ds.months_sorted],
-        name="Shipping", marker_color=ORANGE,
-    ))
-    monthly_fig.add_trace(go.Bar(
-        x=ds.months_sorted,
-        y=[-ds.monthly_marketing.get(m, 0) for m in ds.months_sorted],
-        name="Marketing", marker_color=PURPLE,
-    ))
+    for series, name, color, sign in ((ds.monthly_sales, "Gross Sales", GREEN, 1),
+                                      (ds.monthly_fees, "Fees", RED, -1),
+                                      (ds.monthly_shipping, "Shipping", ORANGE, -1),
+                                      (ds.monthly_marketing, "Marketing", PURPLE, -1)):
+        monthly_fig.add_trace(go.Bar(
+            x=months,
+            y=(series * sign).reindex(months, fill_value=0).tolist(),
+            name=name, marker_color=color,
+        ))
     monthly_fig.add_trace(go.Scatter(
-        x=ds.months_sorted,
-        y=[ds.monthly_net_revenue.get(m, 0) for m in ds.months_sorted],
+        x=months,
+        y=[ds.monthly_net_revenue.get(m, 0) for m in months],
         name="Net Revenue", line=dict(color=CYAN, width=3),
         mode="lines+markers",
     ))
@@ -231,25 +204,37 @@ def layout():
         barmode="relative",
         xaxis_title="Month",
     )
+    return frozen_figure(monthly_fig)
+
+
+def layout():
+    """Build the Overview page."""
+    _total_deductions = ds.total_fees + ds.total_shipping_cost + ds.total_marketing + ds.total_refunds + ds.total_taxes + ds.total_buyer_fees
+
+    # Draw text
+    if ds.draw_diff > 0:
+        _draw_text = f"${ds.bank_owner_draw_total:,.2f}"
+    else:
+        _draw_text = f"${ds.bank_owner_draw_total:,.2f}"
 
     return html.Div([
         # KPI Strip
         dbc.Row([
             dbc.Col(kpi_pill("\U0001f4b0", "PROFIT", f"${ds.full_profit:,.2f}", GREEN,
                              f"{ds.full_profit_margin:.1f}% margin",
-                             f"Cash {ds.money(ds.bank_cash_on_hand)} + Draws {ds.money(ds.bank_owner_draw_total)} - Outside-bank COGS {ds.money(ds.receipt_cogs_outside_bank)}"), width="auto"),
+                             f"Cash {ds.fmt['bank_cash_on_hand']} + Draws {ds.fmt['bank_owner_draw_total']} - Outside-bank COGS {ds.fmt['receipt_cogs_outside_bank']}"), width="auto"),
             dbc.Col(kpi_pill("\U0001f3e2", "CASH ON HAND", f"${ds.bank_cash_on_hand:,.2f}", CYAN,
-                             f"Bank {ds.money(ds.bank_net_cash)} + Etsy {ds.money(ds.etsy_balance)}"), width="auto"),
+                             f"Bank {ds.fmt['bank_net_cash']} + Etsy {ds.fmt['etsy_balance']}"), width="auto"),
             dbc.Col(kpi_pill("\U0001f4b3", "DEBT", f"${ds.bb_cc_balance:,.2f}", RED,
-                             f"Best Buy CC ({ds.money(ds.bb_cc_available)} avail)",
-                             f"Limit {ds.money(ds.bb_cc_limit)}. Charged {ds.money(ds.bb_cc_total_charged)}. Paid {ds.money(ds.bb_cc_total_paid)}."), width="auto"),
+                             f"Best Buy CC ({ds.fmt['bb_cc_available']} avail)",
+                             f"Limit {ds.fmt['bb_cc_limit']}. Charged {ds.fmt['bb_cc_total_charged']}. Paid {ds.fmt['bb_cc_total_paid']}."), width="auto"),
             dbc.Col(kpi_pill("\U0001f91d", "DRAWS", _draw_text, ORANGE,
-                             f"TJ {ds.money(ds.tulsa_draw_total)} / Braden {ds.money(ds.texas_draw_total)}",
-                             f"{ds.draw_owed_to} owed {ds.money(ds.draw_diff)}"), width="auto"),
+                             f"TJ {ds.fmt['tulsa_draw_total']} / Braden {ds.fmt['texas_draw_total']}",
+                             f"{ds.draw_owed_to} owed {ds.fmt['draw_diff']}"), width="auto"),
             dbc.Col(kpi_pill("\U0001f4ca", "GROSS SALES", f"${ds.gross_sales:,.2f}", TEAL,
-                             f"{ds.order_count} orders @ {ds.money(ds.avg_order)} avg"), width="auto"),
+                             f"{ds.order_count} orders @ {ds.fmt['avg_order']} avg"), width="auto"),
             dbc.Col(kpi_pill("\u2702\ufe0f", "DEDUCTIONS", f"${_total_deductions:,.2f}", RED,
-                             f"Fees {ds.money(ds.total_fees)} + Ship {ds.money(ds.total_shipping_cost)} + Ads {ds.money(ds.total_marketing)}"), width="auto"),
+                             f"Fees {ds.fmt['total_fees']} + Ship {ds.fmt['total_shipping_cost']} + Ads {ds.fmt['total_marketing']}"), width="auto"),
         ], className="g-2 mb-3", style={"flexWrap": "wrap"}),
 
         # Subtitle
@@ -257,7 +242,7 @@ def layout():
                style={"color": GRAY, "fontSize": "12px", "marginBottom": "12px"}),
 
         # Health checks
-        _build_health_checks(),
+        _build_health_checks(_etsy_dir_mtime()),
 
         # Side-by-side: P&L + Monthly chart
         dbc.Row([
@@ -285,7 +270,7 @@ def layout():
             ], md=4),
             dbc.Col([
                 dbc.Card(dbc.CardBody([
-                    dcc.Graph(figure=monthly_fig, config={"displayModeBar": False},
+                    dcc.Graph(figure=_build_monthly_chart(), config={"displayModeBar": False},
                               style={"height": "380px"}),
                 ])),
             ], md=8),
@@ -4,29 +4,10 @@ import dash_bootstrap_components as dbc
 
 from etsy_dashboard.theme import *
 from etsy_dashboard.components.kpi import kpi_card
-from etsy_dashboard.components.cards import section, row_item
+from etsy_dashboard.components.cards import form_row as _form_row, section, row_item
 from etsy_dashboard import data_state as ds
 
 
-def _form_row(label, value_str, color=WHITE, bold=False, indent=0, border=False):
-    """A single row in a tax form."""
-    style = {
-        "display": "flex", "justifyContent": "space-between",
-        "padding": "4px 0", "marginLeft": f"{indent * 20}px",
-    }
-    if bold:
-        style["fontWeight"] = "bold"
-    if border:
-        style["borderTop"] = f"1px solid {DARKGRAY}44"
-        style["marginTop"] = "4px"
-        style["paddingTop"] = "8px"
-    return html.Div([
-        html.Span(label, style={"color": color if bold else GRAY, "fontSize": "13px", "flex": "1"}),
-        html.Span(value_str, style={"color": color, "fontFamily": "monospace",
-                                      "fontWeight": "bold" if bold else "normal", "fontSize": "13px"}),
-    ], style=style)
-
-
 def layout():
     """Build the Tax Forms page."""
     # ── Balance Sheet ────────────────────────────────────────────────────
@@ -102,10 +83,10 @@ def layout():
 
                     html.Div("DEDUCTIONS", style={"color": RED, "fontSize": "11px", "fontWeight": "bold",
                                                      "letterSpacing": "1px", "marginBottom": "4px"}),
-                    _form_row("Etsy Fees", ds.money(ds.total_fees), indent=1),
-                    _form_row("Shipping Labels", ds.money(ds.total_shipping_cost), indent=1),
-                    _form_row("Marketing / Ads", ds.money(ds.total_marketing), indent=1),
-                    _form_row("Other Bank Expenses", ds.money(ds.bank_biz_expense_total), indent=1),
+                    _form_row("Etsy Fees", ds.fmt["total_fees"], indent=1),
+                    _form_row("Shipping Labels", ds.fmt["total_shipping_cost"], indent=1),
+                    _form_row("Marketing / Ads", ds.fmt["total_marketing"], indent=1),
+                    _form_row("Other Bank Expenses", ds.fmt["bank_biz_expense_total"], indent=1),
                     _form_row("Total Deductions", ds.money(expenses), color=RED, bold=True, border=True),
 
                     html.Hr(style={"borderColor": "#ffffff10", "margin": "8px 0"}),
@@ -118,12 +99,12 @@ def layout():
                     html.Div("50/50 Partnership Split", style={"color": GRAY, "fontSize": "11px",
                                                                   "marginBottom": "8px"}),
                     _form_row("TJ (Tulsa) — Ordinary income", ds.money(k1_each)),
-                    _form_row("TJ — Draws taken", ds.money(ds.tulsa_draw_total)),
+                    _form_row("TJ — Draws taken", ds.fmt["tulsa_draw_total"]),
                     _form_row("TJ — Net owed", ds.money(k1_each - ds.tulsa_draw_total),
                               color=GREEN if k1_each > ds.tulsa_draw_total else RED),
                     html.Hr(style={"borderColor": "#ffffff10", "margin": "6px 0"}),
                     _form_row("Braden (Texas) — Ordinary income", ds.money(k1_each)),
-                    _form_row("Braden — Draws taken", ds.money(ds.texas_draw_total)),
+                    _form_row("Braden — Draws taken", ds.fmt["texas_draw_total"]),
                     _form_row("Braden — Net owed", ds.money(k1_each - ds.texas_draw_total),
                               color=GREEN if k1_each > ds.texas_draw_total else RED),
                 ], PURPLE),
@@ -132,7 +113,7 @@ def layout():
 
         # Tax-deductible bank expenses
         section("Tax-Deductible Bank Expenses (Schedule C)", [
-            html.P(f"Total deductible: {ds.money(ds.bank_tax_deductible)}",
+            html.P(f"Total deductible: {ds.fmt['bank_tax_deductible']}",
                    style={"color": GREEN, "fontWeight": "bold", "marginBottom": "8px"}),
             html.Div([
                 _form_row(cat, ds.money(amt))
@@ -2,30 +2,38 @@
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
+import numpy as np
 
 from etsy_dashboard.theme import *
 from etsy_dashboard.components.kpi import kpi_card
-from etsy_dashboard.components.cards import section, make_chart
+from etsy_dashboard.components.cards import form_row as _val_row, section, make_chart, frozen_figure
 from etsy_dashboard import data_state as ds
 
 
-def _val_row(label, value_str, color=WHITE, bold=False, indent=0, border=False):
-    """A single valuation row."""
-    style = {
-        "display": "flex", "justifyContent": "space-between",
-        "padding": "4px 0", "marginLeft": f"{indent * 20}px",
-    }
-    if bold:
-        style["fontWeight"] = "bold"
-    if border:
-        style["borderTop"] = f"1px solid {DARKGRAY}44"
-        style["marginTop"] = "4px"
-        style["paddingTop"] = "8px"
-    return html.Div([
-        html.Span(label, style={"color": color if bold else GRAY, "fontSize": "13px", "flex": "1"}),
-        html.Span(value_str, style={"color": color, "fontFamily": "monospace",
-                                      "fontWeight": "bold" if bold else "normal", "fontSize": "13px"}),
-    ], style=style)
+@ds.cached_per_version
+def _build_projection_chart():
+    """Revenue projection (6-month), as a serialized figure."""
+    months_of_data = len(ds.months_sorted)
+    proj_fig = go.Figure()
+    if months_of_data >= 2:
+        # Least-squares trend line through the monthly sales
+        y = ds.monthly_sales_vec
+        slope, intercept = np.polyfit(np.arange(months_of_data), y, 1)
+        future_y = slope * np.arange(months_of_data + 6) + intercept
+
+        proj_fig.add_trace(go.Bar(
+            x=ds.months_sorted, y=y,
+            name="Actual", marker_color=GREEN,
+        ))
+        all_months = list(ds.months_sorted) + [f"Proj {i+1}" for i in range(6)]
+        proj_fig.add_trace(go.Scatter(
+            x=all_months, y=future_y,
+            name="Projected", line=dict(color=CYAN, width=2, dash="dash"),
+            mode="lines+markers",
+        ))
+    make_chart(proj_fig, 300)
+    proj_fig.update_layout(title="Revenue Projection (6-month)")
+    return frozen_figure(proj_fig)
 
 
 def layout():
@@ -85,30 +93,6 @@ def layout():
     val_fig.update_layout(title="Valuation Estimates", showlegend=False,
                           yaxis=dict(title="Value ($)"))
 
-    # Revenue projection chart (12 months)
-    proj_fig = go.Figure()
-    if months_of_data >= 2:
-        import numpy as np
-        from sklearn.linear_model import LinearRegression
-        x = np.arange(months_of_data).reshape(-1, 1)
-        y = np.array([ds.monthly_sales.get(m, 0) for m in ds.months_sorted])
-        model = LinearRegression().fit(x, y)
-        future_x = np.arange(months_of_data + 6).reshape(-1, 1)
-        future_y = model.predict(future_x)
-
-        proj_fig.add_trace(go.Bar(
-            x=ds.months_sorted, y=y,
-            name="Actual", marker_color=GREEN,
-        ))
-        all_months = list(ds.months_sorted) + [f"Proj {i+1}" for i in range(6)]
-        proj_fig.add_trace(go.Scatter(
-            x=all_months, y=future_y,
-            name="Projected", line=dict(color=CYAN, width=2, dash="dash"),
-            mode="lines+markers",
-        ))
-    make_chart(proj_fig, 300)
-    proj_fig.update_layout(title="Revenue Projection (6-month)")
-
     return html.Div([
         # KPI strip
         dbc.Row([
@@ -158,7 +142,7 @@ def layout():
                     _val_row("= Net Asset Value", ds.money(asset_value), color=ORANGE, bold=True, border=True),
                 ], ORANGE),
 
-                dbc.Card(dbc.CardBody(dcc.Graph(figure=proj_fig, config={"displayModeBar": False})), className="mb-3"),
+                dbc.Card(dbc.CardBody(dcc.Graph(figure=_build_projection_chart(), config={"displayModeBar": False})), className="mb-3"),
             ], md=6),
         ], className="g-3"),
     ])